@@ -0,0 +1,214 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+from src.data.simulated_paths import generate_path, lat_max, lat_min, lon_max, lon_min
+from src.deconfliction.index import SegmentIndex
+from src.deconfliction.projection import LocalProjection
+from src.deconfliction.segments import SegmentTable
+from src.deconfliction.spatiotemporal import SAFETY_DISTANCE_METERS, _overlapping_pairs, detect_conflicts
+
+FLEET_SIZES = (10, 100, 1_000, 10_000)
+DENSITY_PER_KM2 = 20       # drones per km² over the 2 h mission-start window
+NEW_PATHS = 20             # plans checked per fleet
+REPEATS = 3
+BACKENDS = ("dataframe", "index")
+REFERENCE_TIME = datetime(2025, 12, 23, 5, 0, 0)
+
+COLUMNS = ["drone_id", "lat", "lon", "alt", "timestamp"]
+AREA_CENTER = ((lat_min + lat_max) / 2, (lon_min + lon_max) / 2)
+
+
+def make_fleet(num_drones: int, density: float = DENSITY_PER_KM2, seed: int = 0) -> pd.DataFrame:
+    """
+    Simulated fleet of ``num_drones`` paths from ``generate_path``. The
+    operational area is stretched about its centre so the fleet holds
+    ``density`` drones per km², whatever its size.
+    """
+    random.seed(seed)
+    rows = [
+        row
+        for k in range(num_drones)
+        for row in generate_path(f"drone_{k + 1}", REFERENCE_TIME)
+    ]
+    return _scale_area(pd.DataFrame(rows, columns=COLUMNS), num_drones / density)
+
+
+def make_plans(fleet: pd.DataFrame, count: int = NEW_PATHS, seed: int = 1) -> List[pd.DataFrame]:
+    """
+    New paths flown through the same (scaled) area as ``fleet``.
+    """
+    random.seed(seed)
+    rows = [row for k in range(count) for row in generate_path(f"plan_{k + 1}", REFERENCE_TIME)]
+    plans = _scale_area(pd.DataFrame(rows, columns=COLUMNS), _area_km2(fleet))
+    return [group.drop(columns="drone_id") for _, group in plans.groupby("drone_id", sort=False)]
+
+
+def run_case(num_drones: int, backend: str, density: float = DENSITY_PER_KM2,
+             repeats: int = REPEATS, plans: int = NEW_PATHS) -> Dict:
+    """
+    Time ``detect_conflicts`` for every plan against one fleet.
+    """
+    fleet = make_fleet(num_drones, density)
+    new_paths = make_plans(fleet, plans)
+    projection = LocalProjection.centered_on(fleet)
+
+    build_start = time.perf_counter()
+    existing = fleet if backend == "dataframe" else SegmentIndex.from_paths(fleet, projection)
+    build_seconds = time.perf_counter() - build_start
+
+    segment_pairs = sum(_pairs_tested(path, existing, projection) for path in new_paths)
+
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        alerts = [detect_conflicts(path, existing, projection=projection) for path in new_paths]
+        timings.append(time.perf_counter() - start)
+
+    # peak Python/NumPy allocation of one extra, untimed pass
+    tracemalloc.start()
+    for path in new_paths:
+        detect_conflicts(path, existing, projection=projection)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best = min(timings)
+    return {
+        "drones": num_drones,
+        "backend": backend,
+        "density_per_km2": density,
+        "area_km2": round(_area_km2(fleet), 3),
+        "segments": int(fleet.groupby("drone_id").size().sum() - fleet["drone_id"].nunique()),
+        "plans": len(new_paths),
+        "alerts": sum(len(a) for a in alerts),
+        "segment_pairs": int(segment_pairs),
+        "build_seconds": build_seconds,
+        "seconds_best": best,
+        "seconds_median": float(np.median(timings)),
+        "seconds_per_plan": best / len(new_paths),
+        "segment_pairs_per_second": segment_pairs / best if best > 0 else None,
+        "peak_memory_bytes": int(peak),
+    }
+
+
+def run_suite(sizes=FLEET_SIZES, backends=BACKENDS, density: float = DENSITY_PER_KM2,
+              repeats: int = REPEATS, plans: int = NEW_PATHS) -> Dict:
+    """
+    Run every (fleet size, backend) case and fit the scaling exponent of
+    time against fleet size for each backend.
+    """
+    results = [
+        run_case(n, backend, density, repeats, plans)
+        for backend in backends
+        for n in sizes
+    ]
+    return {
+        "benchmark": "detect_conflicts",
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "results": results,
+        "scaling": {backend: _scaling(results, backend) for backend in backends},
+    }
+
+
+def compare(current: Dict, baseline: Dict, tolerance: float = 0.25) -> List[str]:
+    """
+    Cases that got more than ``tolerance`` slower than ``baseline``.
+    """
+    previous = {(r["drones"], r["backend"]): r for r in baseline["results"]}
+    regressions = []
+
+    for result in current["results"]:
+        before = previous.get((result["drones"], result["backend"]))
+        if before is None:
+            continue
+        ratio = result["seconds_best"] / before["seconds_best"]
+        if ratio > 1 + tolerance:
+            regressions.append(
+                f"{result['backend']} @ {result['drones']} drones: "
+                f"{before['seconds_best']:.4f}s → {result['seconds_best']:.4f}s ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def _pairs_tested(path: pd.DataFrame, existing, projection) -> int:
+    new = SegmentTable.from_path(path, projection=projection)
+    if isinstance(existing, pd.DataFrame):
+        table = SegmentTable.from_paths(existing, projection)
+    else:
+        table = existing.candidates(new, SAFETY_DISTANCE_METERS)
+    return sum(len(i) for i, _, _, _ in _overlapping_pairs(new, table))
+
+
+def _scaling(results: List[Dict], backend: str) -> Dict:
+    # slope of log(time) against log(drones): 1.0 is linear scaling
+    runs = [r for r in results if r["backend"] == backend]
+    if len(runs) < 2:
+        return {"exponent": None}
+
+    drones = np.log([r["drones"] for r in runs])
+    seconds = np.log([r["seconds_best"] for r in runs])
+    return {"exponent": float(np.polyfit(drones, seconds, 1)[0])}
+
+
+def _area_km2(paths: pd.DataFrame) -> float:
+    projection = LocalProjection(*AREA_CENTER)
+    xyz = projection.project(paths[["lat", "lon", "alt"]].to_numpy())
+    extent = xyz[:, :2].max(axis=0) - xyz[:, :2].min(axis=0)
+    return float(extent.prod() / 1e6)
+
+
+def _scale_area(paths: pd.DataFrame, area_km2: float) -> pd.DataFrame:
+    # generate_path always flies the fixed operational box; stretch it
+    # about its centre to the requested area
+    factor = np.sqrt(area_km2 / _area_km2(paths))
+    paths["lat"] = AREA_CENTER[0] + (paths["lat"] - AREA_CENTER[0]) * factor
+    paths["lon"] = AREA_CENTER[1] + (paths["lon"] - AREA_CENTER[1]) * factor
+    return paths
+
+
+# Script entry point: python -m benchmarks.bench_conflicts [--output results.json]
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark detect_conflicts on simulated fleets")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(FLEET_SIZES))
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS))
+    parser.add_argument("--density", type=float, default=DENSITY_PER_KM2, help="drones per km²")
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--plans", type=int, default=NEW_PATHS)
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="earlier results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    report = run_suite(args.sizes, args.backends, args.density, args.repeats, args.plans)
+
+    for r in report["results"]:
+        print(f"{r['backend']:>9} {r['drones']:>6} drones: {r['seconds_per_plan'] * 1e3:8.2f} ms/plan, "
+              f"{r['segment_pairs_per_second'] or 0:12,.0f} pairs/s, "
+              f"peak {r['peak_memory_bytes'] / 2**20:7.1f} MiB")
+    for backend, fit in report["scaling"].items():
+        if fit["exponent"] is not None:
+            print(f"{backend:>9} scaling exponent: {fit['exponent']:.2f}")
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"✓ Results written to {args.output}")
+
+    if args.baseline:
+        regressions = compare(report, json.loads(args.baseline.read_text()), args.tolerance)
+        for line in regressions:
+            print(f"⚠ Regression: {line}")
+        if regressions:
+            sys.exit(1)
+        print("✓ No regressions against baseline")
@@ -2,11 +2,50 @@ from pymavlink import mavutil
 import time
 import threading
 
+from src.control.telemetry import TelemetryStore
+
+RATE_SMOOTHING = 0.1  # weight of the newest gap in the receive-interval average
+
+
+class ReceiveStats:
+    """Receive counters for one drone, updated by the monitoring thread"""
+
+    __slots__ = ('messages', 'last', 'interval', 'max_gap')
+
+    def __init__(self):
+        self.messages = 0
+        self.last = None       # receive time of the latest message
+        self.interval = None   # smoothed seconds between messages
+        self.max_gap = 0.0
+
+    def record(self, now):
+        if self.last is not None:
+            gap = now - self.last
+            self.interval = gap if self.interval is None else self.interval + RATE_SMOOTHING * (gap - self.interval)
+            self.max_gap = max(self.max_gap, gap)
+        self.messages += 1
+        self.last = now
+
+    def as_dict(self, now):
+        return {
+            'messages': self.messages,
+            'rate_hz': 1.0 / self.interval if self.interval else 0.0,
+            'max_gap': self.max_gap,
+            'age': now - self.last,   # seconds since the latest message
+        }
+
+
 class SimpleDroneController:
+    # messages read by the monitoring thread; anything else is dropped
+    MONITORED = ['GLOBAL_POSITION_INT', 'COMMAND_ACK']
+
     def __init__(self):
         self.connection = None
         self.detected_drones = []
         self.attitude_heading = {}  # Live data storage
+        self.command_acks = {}      # (system_id, command) → latest COMMAND_ACK
+        self.receive_stats = {}     # system_id → ReceiveStats
+        self.telemetry = TelemetryStore()  # recent position history per drone
         self.monitoring_active = False
 
     def connect_to_drones(self, com_port, baud_rate=57600, timeout=5):
@@ -42,7 +81,12 @@ class SimpleDroneController:
             return []
 
     def start_attitude_monitoring(self, update_interval=0.1):
-        """Start continuous attitude monitoring in background thread"""
+        """Start continuous attitude monitoring in background thread
+
+        The thread blocks on the connection and stores every monitored
+        message as it arrives; ``update_interval`` only bounds how long one
+        receive waits before the loop re-checks ``monitoring_active``.
+        """
         if self.monitoring_active:
             print("Attitude monitoring already running!")
             return
@@ -51,33 +95,10 @@ class SimpleDroneController:
         print("Starting background attitude monitoring...")
         
         def monitor_loop():
+            recv_match = self.connection.recv_match
             while self.monitoring_active:
                 try:
-                    # Clear buffer to get fresh data
-                    while self.connection.recv_match(type='GLOBAL_POSITION_INT', blocking=False):
-                        pass
-                    
-                    # Small delay to let fresh data arrive
-                    time.sleep(0.05)
-                    
-                    # Get fresh GLOBAL_POSITION_INT messages
-                    msg = self.connection.recv_match(type='GLOBAL_POSITION_INT', blocking=False)
-                    if msg:
-                        system_id = msg.get_srcSystem()
-                        if system_id in self.detected_drones:
-                            if system_id not in self.attitude_heading:
-                                self.attitude_heading[system_id] = {}
-                            
-                            self.attitude_heading[system_id].update({
-                                'heading': msg.hdg / 100,
-                                'latitude': msg.lat / 1e7,
-                                'longitude': msg.lon / 1e7,
-                                'altitude': msg.relative_alt / 1000.0,  # Use relative altitude (AGL)
-                                'timestamp': time.time()
-                            })
-                            print(f"Drone {system_id} - Lat: {msg.lat/1e7:.6f}, Lng: {msg.lon/1e7:.6f}, Alt: {msg.relative_alt/1000.0:.1f}m")
-                    
-                    time.sleep(update_interval)
+                    self._handle_message(recv_match(type=self.MONITORED, blocking=True, timeout=update_interval))
                     
                 except Exception as e:
                     print(f"Error in attitude monitoring: {e}")
@@ -88,6 +109,63 @@ class SimpleDroneController:
         monitor_thread.start()
         print("✓ Background attitude monitoring started!")
 
+    def stop_attitude_monitoring(self):
+        """Stop the monitoring thread after its current receive"""
+        self.monitoring_active = False
+
+    def _handle_message(self, msg):
+        """Store one monitored message in its drone's latest-state slot (hot loop: no printing)"""
+        if not msg:
+            return
+
+        system_id = msg.get_srcSystem()
+        if system_id not in self.detected_drones:
+            return
+
+        now = time.time()
+        stats = self.receive_stats.get(system_id)
+        if stats is None:
+            stats = self.receive_stats[system_id] = ReceiveStats()
+        stats.record(now)
+
+        if msg.get_type() == 'COMMAND_ACK':
+            self.command_acks[(system_id, msg.command)] = {
+                'result': msg.result,
+                'timestamp': now
+            }
+            return
+
+        lat, lon = msg.lat / 1e7, msg.lon / 1e7
+        alt = msg.relative_alt / 1000.0  # Use relative altitude (AGL)
+        heading = msg.hdg / 100
+
+        # replace the slot rather than update it, so readers never see a
+        # half-written sample
+        self.attitude_heading[system_id] = {
+            'heading': heading,
+            'latitude': lat,
+            'longitude': lon,
+            'altitude': alt,
+            'timestamp': now
+        }
+        self.telemetry.record(system_id, now, lat, lon, alt, heading)
+
+    def command_ack(self, system_id, command, since=0.0):
+        """Result of the latest COMMAND_ACK for ``command`` received after ``since``, or None"""
+        ack = self.command_acks.get((system_id, command))
+        if ack is None or ack['timestamp'] < since:
+            return None
+        return ack['result']
+
+    def get_telemetry_stats(self):
+        """Receive statistics per drone: messages, rate_hz, max_gap and age in seconds"""
+        now = time.time()
+        return {system_id: stats.as_dict(now) for system_id, stats in list(self.receive_stats.items())}
+
+    def get_drone_track(self, system_id, seconds=None):
+        """Recent positions of a drone as a Track snapshot (None before its first sample)"""
+        return self.telemetry.track(system_id, seconds)
+
     def get_live_drone_attitude(self, system_id):
         """Get the latest attitude data for a specific drone"""
         if system_id not in self.attitude_heading:
@@ -158,7 +236,6 @@ class SimpleDroneController:
         for drone_id in self.detected_drones:
             if self.arm_drone(drone_id):
                 success_count += 1
-            time.sleep(0.1)
         
         print(f"Arming complete: {success_count}/{len(self.detected_drones)} drones armed")
         return success_count == len(self.detected_drones)
@@ -171,7 +248,6 @@ class SimpleDroneController:
         for drone_id in self.detected_drones:
             if self.disarm_drone(drone_id):
                 success_count += 1
-            time.sleep(0.1)
         
         print(f"Disarming complete: {success_count}/{len(self.detected_drones)} drones disarmed")
         return success_count == len(self.detected_drones)
@@ -216,7 +292,6 @@ class SimpleDroneController:
         for drone_id in self.detected_drones:
             if self.set_drone_mode(drone_id, mode_name):
                 success_count += 1
-            time.sleep(0.1)
         
         print(f"Mode change complete: {success_count}/{len(self.detected_drones)} drones changed to {mode_name}")
         return success_count == len(self.detected_drones)
@@ -255,7 +330,6 @@ class SimpleDroneController:
         for drone_id in self.detected_drones:
             if self.takeoff_drone(drone_id, altitude_meters):
                 success_count += 1
-            time.sleep(0.1)
         
         print(f"Takeoff complete: {success_count}/{len(self.detected_drones)} drones took off")
         return success_count == len(self.detected_drones)
@@ -0,0 +1,267 @@
+import time
+import numpy as np
+from typing import Callable, Dict, List, Optional
+
+from src.deconfliction.projection import haversine_distance
+
+ARRIVAL_RADIUS_METERS = 3.0    # 3D distance at which a waypoint counts as reached
+TAKEOFF_ALT_FRACTION = 0.95    # takeoff is done at 95 % of the target altitude
+ACK_TIMEOUT_SECONDS = 3.0      # resend a command not acknowledged by then
+COMMAND_RETRIES = 3            # sends per command before the mission fails
+LEG_TIMEOUT_SECONDS = 300.0    # takeoff or leg not finished by then fails the mission
+TICK_MS = 200                  # how often the UI drives tick()
+
+# Mission states, in flight order
+IDLE = "idle"
+MODE = "mode"
+ARM = "arm"
+TAKEOFF = "takeoff"
+WAYPOINT = "waypoint"
+DONE = "done"
+FAILED = "failed"
+ABORTED = "aborted"
+
+FINAL_STATES = (DONE, FAILED, ABORTED)
+
+# MAVLink ids whose COMMAND_ACK confirms each step. Autopilots answer the
+# SET_MODE message with an ack carrying its message id (11).
+ACK_COMMANDS = {
+    MODE: 11,         # SET_MODE
+    ARM: 400,         # MAV_CMD_COMPONENT_ARM_DISARM
+    TAKEOFF: 22,      # MAV_CMD_NAV_TAKEOFF
+}
+MAV_RESULT_ACCEPTED = 0
+MAV_RESULT_IN_PROGRESS = 5
+
+
+class MissionExecutor:
+    """
+    Non-blocking state machine flying one drone through its waypoints.
+
+    ``tick()`` is called periodically (the GUI drives it from a QTimer) and
+    never sleeps. Each call reads the drone's latest telemetry from
+    ``controller.attitude_heading`` and sends the next command once the
+    current one is done: arm once GUIDED mode is acknowledged, take off
+    once arming is, fly to the first waypoint when takeoff reaches
+    TAKEOFF_ALT_FRACTION of its altitude and to the next one when the
+    drone is within ``arrival_radius`` of the current one. Commands not
+    acknowledged within ACK_TIMEOUT_SECONDS are resent; a rejected one
+    fails the mission. Acks and telemetry older than the command being
+    waited on are ignored.
+    """
+
+    def __init__(
+        self,
+        controller,
+        system_id: int,
+        waypoints: List[Dict],
+        arrival_radius: float = ARRIVAL_RADIUS_METERS,
+        leg_timeout: float = LEG_TIMEOUT_SECONDS,
+        log: Callable[[str], None] = print,
+        clock: Callable[[], float] = time.time
+    ):
+        if not waypoints:
+            raise ValueError("Mission needs at least one waypoint")
+
+        self.controller = controller
+        self.system_id = system_id
+        self.waypoints = sorted(waypoints, key=lambda w: w["timestamp"])
+        self.arrival_radius = arrival_radius
+        self.leg_timeout = leg_timeout
+        self.log = log
+        self.clock = clock
+
+        self.state = IDLE
+        self.index = 0          # waypoint being flown to
+        self._since = None      # clock time the current step's command was first sent
+        self._sent = None       # ... and last (re)sent
+        self._attempts = 0
+        self._command = None    # (command, args) of the current step, for resends
+
+    @property
+    def finished(self) -> bool:
+        return self.state in FINAL_STATES
+
+    @property
+    def takeoff_alt(self) -> float:
+        return self.waypoints[0]["alt"]
+
+    def start(self):
+        """
+        Send the first command (GUIDED mode); later ones follow from tick().
+        """
+        if self.state != IDLE:
+            raise RuntimeError(f"Mission already {self.state}")
+
+        self.log("Setting drone to GUIDED mode...")
+        self._send(MODE, self.controller.set_drone_mode, "GUIDED")
+
+    def abort(self):
+        if not self.finished:
+            self.state = ABORTED
+            self.log(f"⏹ Mission aborted at waypoint {self.index + 1}/{len(self.waypoints)}")
+
+    def tick(self) -> str:
+        """
+        Advance the mission if the current step is done; returns the state.
+        """
+        if self.state == IDLE or self.finished:
+            return self.state
+
+        now = self.clock()
+        elapsed = now - self._since
+
+        if self.state == MODE:
+            if self._acknowledged(now):
+                self.log("Arming drone...")
+                self._send(ARM, self.controller.arm_drone)
+
+        elif self.state == ARM:
+            if self._acknowledged(now):
+                self.log(f"Taking off to {self.takeoff_alt}m...")
+                self._send(TAKEOFF, self.controller.takeoff_drone, self.takeoff_alt)
+
+        elif self.state == TAKEOFF:
+            # the climb itself proves the takeoff was accepted; the ack
+            # only matters for resends and rejections
+            position = self._position()
+            if position is not None and position[2] >= TAKEOFF_ALT_FRACTION * self.takeoff_alt:
+                self._fly_to(0)
+            elif elapsed > self.leg_timeout:
+                self._fail(f"takeoff not completed after {self.leg_timeout:.0f}s")
+            else:
+                self._acknowledged(now)
+
+        elif self.state == WAYPOINT:
+            position = self._position()
+            if position is not None and self._distance_to(self.index, position) <= self.arrival_radius:
+                self.log(f"✓ Reached waypoint {self.index + 1}/{len(self.waypoints)}")
+                if self.index + 1 == len(self.waypoints):
+                    self.state = DONE
+                    self.log("✅ Mission completed successfully!")
+                else:
+                    self._fly_to(self.index + 1)
+            elif elapsed > self.leg_timeout:
+                self._fail(f"waypoint {self.index + 1} not reached after {self.leg_timeout:.0f}s")
+
+        return self.state
+
+    def _fly_to(self, index: int):
+        self.index = index
+        w = self.waypoints[index]
+        self.log(f"Flying to waypoint {index + 1}/{len(self.waypoints)}:")
+        self.log(f"  Latitude: {w['lat']:.6f}")
+        self.log(f"  Longitude: {w['lon']:.6f}")
+        self.log(f"  Altitude: {w['alt']}m")
+        self._send(WAYPOINT, self.controller.goto_location, w["lat"], w["lon"], w["alt"])
+
+    def _send(self, state: str, command: Callable, *args):
+        self.state = state
+        self._since = self._sent = self.clock()
+        self._attempts = 1
+        self._command = (command, args)
+        if not command(self.system_id, *args):
+            self._fail(f"{state} command was not sent")
+
+    def _acknowledged(self, now: float) -> bool:
+        """
+        True once the current step's command is accepted. Resends it when
+        no ack came within ACK_TIMEOUT_SECONDS and fails the mission when
+        it is rejected or out of retries.
+        """
+        result = self.controller.command_ack(self.system_id, ACK_COMMANDS[self.state], self._since)
+        if result == MAV_RESULT_ACCEPTED:
+            return True
+        if result is not None and result != MAV_RESULT_IN_PROGRESS:
+            self._fail(f"{self.state} command rejected (MAV_RESULT {result})")
+        elif result is None and now - self._sent >= ACK_TIMEOUT_SECONDS:
+            if self._attempts == COMMAND_RETRIES:
+                self._fail(f"{self.state} command not acknowledged after {COMMAND_RETRIES} attempts")
+            else:
+                command, args = self._command
+                self._attempts += 1
+                self._sent = now
+                self.log(f"↻ Resending {self.state} command to drone {self.system_id}")
+                if not command(self.system_id, *args):
+                    self._fail(f"{self.state} command was not sent")
+        return False
+
+    def _fail(self, reason: str):
+        self.state = FAILED
+        self.log(f"❌ Mission execution failed: {reason}")
+
+    def _position(self) -> Optional[np.ndarray]:
+        # latest (lat, lon, alt) reported after the current command, if any
+        sample = self.controller.attitude_heading.get(self.system_id)
+        if not sample or sample.get("timestamp", 0) < self._since:
+            return None
+        return np.array([sample["latitude"], sample["longitude"], sample["altitude"]])
+
+    def _distance_to(self, index: int, position: np.ndarray) -> float:
+        w = self.waypoints[index]
+        return float(haversine_distance(position, np.array([w["lat"], w["lon"], w["alt"]])))
+
+
+class MissionScheduler:
+    """
+    Runs independent missions for several drones at once over one
+    controller connection.
+
+    Each drone gets its own MissionExecutor; ``tick()`` advances all of
+    them in one pass, so every drone whose step is done gets its next
+    command in the same tick and dispatch to N drones costs N sends, not
+    N sleeps.
+    """
+
+    def __init__(self, controller, log: Callable[[str], None] = print, clock: Callable[[], float] = time.time, **options):
+        self.controller = controller
+        self.log = log
+        self.clock = clock
+        self.options = options   # arrival_radius / leg_timeout for every mission
+        self.missions: Dict[int, MissionExecutor] = {}
+
+    def add(self, system_id: int, waypoints: List[Dict]) -> MissionExecutor:
+        """
+        Start a mission for ``system_id``; the drone must not be flying one.
+        """
+        current = self.missions.get(system_id)
+        if current is not None and not current.finished:
+            raise RuntimeError(f"Drone {system_id} is already flying a mission")
+
+        mission = MissionExecutor(
+            self.controller, system_id, waypoints,
+            log=lambda message: self.log(f"[drone {system_id}] {message}"),
+            clock=self.clock,
+            **self.options
+        )
+        self.missions[system_id] = mission
+        mission.start()
+        return mission
+
+    @property
+    def active(self) -> List[int]:
+        return [system_id for system_id, m in self.missions.items() if not m.finished]
+
+    @property
+    def finished(self) -> bool:
+        return not self.active
+
+    def tick(self) -> Dict[int, str]:
+        """
+        Advance every active mission once; returns the state of each drone.
+        """
+        for system_id in self.active:
+            # one drone's failure must not stall the others
+            try:
+                self.missions[system_id].tick()
+            except Exception as e:
+                self.missions[system_id].abort()
+                self.log(f"[drone {system_id}] ❌ Mission execution failed: {e}")
+        return {system_id: m.state for system_id, m in self.missions.items()}
+
+    def abort(self, system_id: int = None):
+        """
+        Abort one drone's mission, or all of them.
+        """
+        for sid in ([system_id] if system_id is not None else self.active):
+            self.missions[sid].abort()
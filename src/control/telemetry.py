@@ -0,0 +1,168 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+
+TRACK_CAPACITY = 512      # samples kept per drone (~50 s at 10 Hz)
+SNAPSHOT_RETRIES = 8      # reads lapped by the writer this often give up
+
+
+class Track:
+    """
+    Copy of one drone's recent telemetry, oldest sample first.
+    """
+
+    __slots__ = ("drone_id", "t", "geo", "heading")
+
+    def __init__(self, drone_id, t: np.ndarray, geo: np.ndarray, heading: np.ndarray):
+        self.drone_id = drone_id
+        self.t = t                # float64 Unix seconds
+        self.geo = geo            # float64 (N, 3) lat, lon, alt (relative)
+        self.heading = heading    # float64 degrees
+
+    def __len__(self):
+        return len(self.t)
+
+    def __repr__(self):
+        return f"Track({self.drone_id!r}, {len(self)} samples)"
+
+    def latest(self) -> Dict:
+        """
+        Newest sample in the shape of ``SimpleDroneController.attitude_heading``.
+        """
+        lat, lon, alt = self.geo[-1].tolist()
+        return {
+            "heading": float(self.heading[-1]),
+            "latitude": lat,
+            "longitude": lon,
+            "altitude": alt,
+            "timestamp": float(self.t[-1]),
+        }
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame({
+            "drone_id": self.drone_id,
+            "lat": self.geo[:, 0],
+            "lon": self.geo[:, 1],
+            "alt": self.geo[:, 2],
+            "timestamp": pd.to_datetime(self.t, unit="s"),
+        })
+
+
+class _Ring:
+    # One writer appends; readers copy. Sample k lives in row k % capacity;
+    # ``started`` is bumped before its row is written, ``written`` after.
+
+    __slots__ = ("t", "geo", "heading", "started", "written")
+
+    def __init__(self, capacity: int):
+        self.t = np.zeros(capacity)
+        self.geo = np.zeros((capacity, 3))
+        self.heading = np.zeros(capacity)
+        self.started = 0
+        self.written = 0
+
+    def copy(self, first: int, stop: int):
+        # rows of samples [first, stop) as (at most two) contiguous slices
+        capacity = len(self.t)
+        lo, hi = first % capacity, (stop - 1) % capacity + 1
+        if lo < hi:
+            return self.t[lo:hi].copy(), self.geo[lo:hi].copy(), self.heading[lo:hi].copy()
+        return (
+            np.concatenate((self.t[lo:], self.t[:hi])),
+            np.concatenate((self.geo[lo:], self.geo[:hi])),
+            np.concatenate((self.heading[lo:], self.heading[:hi])),
+        )
+
+
+class TelemetryStore:
+    """
+    Recent position history of every drone in fixed-size NumPy rings.
+
+    Written by one thread (the controller's monitoring thread) and read
+    from any other without a lock. A read copies the ring and then checks
+    how far the writer got in the meantime (a sequence-lock): rows the
+    writer may have touched during the copy are dropped, so a snapshot
+    only ever holds complete samples in time order. A read the writer
+    laps completely is retried.
+    """
+
+    def __init__(self, capacity: int = TRACK_CAPACITY):
+        self.capacity = capacity
+        self._rings: Dict[int, _Ring] = {}
+
+    def record(self, drone_id, t: float, lat: float, lon: float, alt: float, heading: float = 0.0):
+        """
+        Append one sample (writer thread only).
+        """
+        ring = self._rings.get(drone_id)
+        if ring is None:
+            ring = self._rings[drone_id] = _Ring(self.capacity)
+
+        row = ring.written % self.capacity
+        ring.started += 1
+        ring.t[row] = t
+        ring.geo[row] = (lat, lon, alt)
+        ring.heading[row] = heading
+        ring.written += 1
+
+    @property
+    def drones(self) -> List:
+        return list(self._rings)
+
+    def __contains__(self, drone_id) -> bool:
+        return drone_id in self._rings
+
+    def samples(self, drone_id) -> int:
+        """
+        Samples ever recorded for ``drone_id``; a cheap change check.
+        """
+        ring = self._rings.get(drone_id)
+        return 0 if ring is None else ring.written
+
+    def track(self, drone_id, seconds: float = None) -> Optional[Track]:
+        """
+        Consistent copy of ``drone_id``'s history, limited to the last
+        ``seconds`` before its newest sample; None for an unknown drone.
+        """
+        track = self._read(drone_id, self.capacity)
+        if track is not None and seconds is not None:
+            keep = track.t >= track.t[-1] - seconds
+            track = Track(drone_id, track.t[keep], track.geo[keep], track.heading[keep])
+        return track
+
+    def latest(self, drone_id) -> Optional[Dict]:
+        """
+        Newest sample of ``drone_id``, copied without the rest of its ring.
+        """
+        track = self._read(drone_id, 1)
+        return None if track is None else track.latest()
+
+    def snapshot(self, seconds: float = None) -> Dict[int, Track]:
+        """
+        Tracks of every drone with at least one sample.
+        """
+        tracks = {drone_id: self.track(drone_id, seconds) for drone_id in self.drones}
+        return {drone_id: track for drone_id, track in tracks.items() if track is not None}
+
+    def _read(self, drone_id, count: int) -> Optional[Track]:
+        # copy the newest ``count`` samples, then keep those the writer
+        # cannot have touched meanwhile: samples from ``before`` on were
+        # not there yet, and the rows of samples before started - capacity
+        # were reused (or are being written)
+        ring = self._rings.get(drone_id)
+        if ring is None:
+            return None
+
+        for _ in range(SNAPSHOT_RETRIES):
+            before = ring.written
+            if before == 0:
+                return None
+            first = max(0, before - count)
+            t, geo, heading = ring.copy(first, before)
+            after = ring.started
+
+            skip = max(0, after - self.capacity - first)
+            if skip < before - first:
+                return Track(drone_id, t[skip:], geo[skip:], heading[skip:])
+
+        raise RuntimeError(f"Telemetry of drone {drone_id} changed too fast to snapshot")
@@ -3,6 +3,8 @@ import pandas as pd
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from src.data.trajectory_store import TRAJ_SUFFIX, write_paths
+
 # Resolve project paths
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 DATA_DIR = PROJECT_ROOT / "data"
@@ -61,7 +63,7 @@ def generate_path(path_id: str, ref_start_time: datetime):
     return [(path_id, wp[0], wp[1], wp[2], wp[3]) for wp in wps]
 
 # Dataset generator
-def generate_simulated_paths(num_paths: int = 20):
+def generate_simulated_paths(num_paths: int = 20, output_file: Path = None):
     reference_now = datetime.now()
     rows = []
 
@@ -77,8 +79,8 @@ def generate_simulated_paths(num_paths: int = 20):
         columns=["drone_id", "lat", "lon", "alt", "timestamp"]
     )
 
-    output_file = DATA_DIR / "simulated_paths.xlsx"
-    df.to_excel(output_file, index=False)
+    output_file = output_file or DATA_DIR / f"simulated_paths{TRAJ_SUFFIX}"
+    write_paths(df, output_file)
 
     print(f"✓ Generated {output_file} ({num_paths} paths)")
     return output_file
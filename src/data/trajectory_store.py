@@ -0,0 +1,152 @@
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+# Trajectory file formats, in order of preference when looking one up
+TRAJ_SUFFIX = ".traj"
+FORMATS = (TRAJ_SUFFIX, ".parquet", ".xlsx")
+
+STORE_VERSION = 1
+
+
+def find_dataset(stem: Path) -> Path:
+    """
+    Return the most recently written file for ``stem`` (e.g.
+    data/normalized_paths), FORMATS order breaking ties, or the columnar
+    path if none exists yet. A sheet edited after its .traj store was
+    converted wins over the stale store until ``convert`` is re-run.
+    """
+    stem = Path(stem)
+    existing = [stem.with_suffix(suffix) for suffix in FORMATS if stem.with_suffix(suffix).exists()]
+    if not existing:
+        return stem.with_suffix(TRAJ_SUFFIX)
+
+    newest = max(existing, key=_modified)
+    if newest != existing[0]:
+        print(f"⚠️  {newest.name} is newer than {existing[0].name}; using it (re-run convert to refresh)")
+    return newest
+
+
+def _modified(path: Path) -> int:
+    # a columnar store is complete once its meta.json is written
+    meta = path / "meta.json"
+    return (meta if meta.exists() else path).stat().st_mtime_ns
+
+
+def write_paths(df: pd.DataFrame, path: Path) -> Path:
+    """
+    Save a trajectory DataFrame. The format follows the suffix:
+    .traj (columnar NumPy store), .parquet or .xlsx.
+    """
+    path = Path(path)
+
+    if path.suffix == TRAJ_SUFFIX:
+        _write_columnar(df, path)
+    elif path.suffix == ".parquet":
+        df.to_parquet(path, index=False)
+    elif path.suffix == ".xlsx":
+        df.to_excel(path, index=False)
+    else:
+        raise ValueError(f"Unsupported trajectory format: {path.suffix}")
+
+    return path
+
+
+def read_paths(path: Path, mmap: bool = True) -> pd.DataFrame:
+    """
+    Load a trajectory DataFrame written by ``write_paths`` (or any Excel /
+    Parquet file with the same columns). Columnar stores are memory-mapped
+    unless ``mmap`` is False.
+    """
+    path = Path(path)
+
+    if path.suffix == TRAJ_SUFFIX:
+        return _read_columnar(path, mmap)
+    if path.suffix == ".parquet":
+        df = pd.read_parquet(path)
+    elif path.suffix == ".xlsx":
+        df = pd.read_excel(path)
+    else:
+        raise ValueError(f"Unsupported trajectory format: {path.suffix}")
+
+    if "timestamp" in df:
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+    return df
+
+
+def convert(src: Path, dst: Path) -> Path:
+    """
+    Import / export between formats, e.g. .xlsx → .traj.
+    """
+    return write_paths(read_paths(src, mmap=False), dst)
+
+
+# Columnar store: one .npy file per column plus meta.json
+#   numeric  → <name>.npy
+#   datetime → <name>.npy (int64 epoch ns)
+#   category → <name>.codes.npy (int32) + <name>.categories.npy (unicode);
+#              any other column type round-trips as strings
+def _write_columnar(df: pd.DataFrame, path: Path):
+    path.mkdir(parents=True, exist_ok=True)
+    columns = []
+
+    for name in df.columns:
+        values = df[name]
+
+        if pd.api.types.is_datetime64_any_dtype(values):
+            kind = "datetime"
+            np.save(path / f"{name}.npy", _datetime_ns(values))
+        elif pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+            kind = "numeric"
+            np.save(path / f"{name}.npy", np.ascontiguousarray(values.to_numpy()))
+        else:
+            kind = "category"
+            codes, categories = pd.factorize(values.astype(str))
+            np.save(path / f"{name}.codes.npy", codes.astype(np.int32))
+            np.save(path / f"{name}.categories.npy", np.asarray(categories, dtype=str))
+
+        columns.append({"name": str(name), "kind": kind})
+
+    meta = {"version": STORE_VERSION, "rows": len(df), "columns": columns}
+    (path / "meta.json").write_text(json.dumps(meta, indent=2))
+
+
+def _read_columnar(path: Path, mmap: bool = True) -> pd.DataFrame:
+    meta_file = path / "meta.json"
+    if not meta_file.exists():
+        raise FileNotFoundError(f"{meta_file} not found")
+
+    meta = json.loads(meta_file.read_text())
+    mode = "r" if mmap else None
+    data = {}
+
+    for column in meta["columns"]:
+        name, kind = column["name"], column["kind"]
+
+        if kind == "category":
+            codes = np.load(path / f"{name}.codes.npy", mmap_mode=mode)
+            categories = np.load(path / f"{name}.categories.npy").astype(object)
+            data[name] = categories[codes]
+        elif kind == "datetime":
+            ns = np.load(path / f"{name}.npy", mmap_mode=mode)
+            data[name] = ns.view("datetime64[ns]")
+        else:
+            data[name] = np.load(path / f"{name}.npy", mmap_mode=mode)
+
+    return pd.DataFrame(data, copy=False)
+
+
+def _datetime_ns(values: pd.Series) -> np.ndarray:
+    return np.asarray(values, dtype="datetime64[ns]").view(np.int64)
+
+
+# Script entry point: python -m src.data.trajectory_store <src> <dst>
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) != 3:
+        raise SystemExit("usage: python -m src.data.trajectory_store <src> <dst>")
+
+    out = convert(Path(sys.argv[1]), Path(sys.argv[2]))
+    print(f"✓ Converted {sys.argv[1]} → {out}")
@@ -4,7 +4,8 @@ from typing import List, Dict
 
 def explain_conflicts(alerts: List[Dict]) -> List[str]:
     """
-    Convert conflict alerts into human-readable messages.
+    Convert conflict alerts into human-readable messages. Alerts that
+    carry a start / end window (intervals or encounters) also show it.
     """
     messages = []
 
@@ -26,6 +27,12 @@ def explain_conflicts(alerts: List[Dict]) -> List[str]:
             messages.append(
                 f"  ├─ Time: {c['time'].strftime('%Y-%m-%d %H:%M:%S')}"
             )
+            if "start" in c:
+                seconds = (c["end"] - c["start"]).total_seconds()
+                messages.append(
+                    f"  ├─ Window: {c['start'].strftime('%H:%M:%S')} → "
+                    f"{c['end'].strftime('%H:%M:%S')} ({seconds:.0f} s)"
+                )
             messages.append(
                 f"  ├─ Position: ({c['lat']:.6f}, {c['lon']:.6f})"
             )
@@ -0,0 +1,219 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterator, List, Union
+
+from src.deconfliction.projection import LocalProjection
+from src.deconfliction.segments import SegmentTable
+from src.deconfliction.spatiotemporal import (
+    KERNELS, MAX_PAIRS_PER_CHUNK, SAFETY_DISTANCE_METERS, _timestamps, run_kernel
+)
+from src.deconfliction.trajectories import FleetArrays
+
+
+def detect_all_conflicts(
+    paths: Union[pd.DataFrame, SegmentTable, FleetArrays],
+    safety_distance: float = SAFETY_DISTANCE_METERS,
+    method: str = "cpa",
+    projection: LocalProjection = None
+) -> Dict:
+    """
+    Audit a whole schedule for conflicts between any two of its drones.
+
+    Segments are swept in start-time order, so only segments that are
+    airborne at the same time (and whose padded bounding boxes touch) are
+    ever compared, instead of every pair of drones.
+
+    Returns a dict with:
+      "alerts":  conflict dictionaries; "drone_id" / "other_drone_id" name
+                 the pair and the position is that of "drone_id"
+      "pairs":   one row per conflicting drone pair (the sparse conflict
+                 matrix): drone_a, drone_b, conflicts, min_distance,
+                 first_conflict
+      "summary": one row per drone: conflicts, conflicting_drones,
+                 min_distance
+    """
+    if isinstance(paths, SegmentTable):
+        table = paths
+    elif isinstance(paths, FleetArrays):
+        table = paths.segments()
+    else:
+        table = SegmentTable.from_paths(paths, projection or LocalProjection.centered_on(paths))
+    kernel = KERNELS[method]
+
+    parts = [
+        run_kernel(kernel, table, table, a, b, t_start, t_end, safety_distance)
+        for a, b, t_start, t_end in sweep_pairs(table, safety_distance)
+    ]
+    parts = [p for p in parts if len(p["i"])]
+
+    if parts:
+        a = np.concatenate([p["i"] for p in parts])
+        b = np.concatenate([p["j"] for p in parts])
+        t = np.concatenate([p["t"] for p in parts])
+        dist = np.concatenate([p["distance"] for p in parts])
+    else:
+        a = b = t = np.empty(0, dtype=np.int64)
+        dist = np.empty(0)
+
+    order = np.lexsort((t, table.owner[b], table.owner[a]))
+    a, b, t, dist = a[order], b[order], t[order], dist[order]
+
+    alerts = pair_alerts(table, a, b, t, dist)
+    pairs = _pair_table(table, a, b, t, dist)
+    return {
+        "alerts": alerts,
+        "pairs": pairs,
+        "summary": _drone_summary(table, pairs),
+    }
+
+
+def conflict_matrix(pairs: pd.DataFrame, drone_ids: List = None) -> pd.DataFrame:
+    """
+    Dense, symmetric drone x drone matrix of conflict counts built from
+    the "pairs" table of detect_all_conflicts. Meant for display of small
+    fleets; the pairs table is the scalable form.
+    """
+    if drone_ids is None:
+        drone_ids = sorted(set(pairs["drone_a"]) | set(pairs["drone_b"]))
+
+    matrix = pd.DataFrame(0, index=drone_ids, columns=drone_ids, dtype=np.int64)
+    for row in pairs.itertuples(index=False):
+        matrix.loc[row.drone_a, row.drone_b] = row.conflicts
+        matrix.loc[row.drone_b, row.drone_a] = row.conflicts
+    return matrix
+
+
+def sweep_pairs(table: SegmentTable, safety_distance: float) -> Iterator:
+    """
+    Sweep-line over segment start times. With segments sorted by t0,
+    segment a is airborne together with exactly the segments that start
+    after it and before t1[a]; searchsorted finds that run directly.
+    Yields (a, b, t_start, t_end) for pairs that also pass a padded
+    bounding-box test, in chunks of bounded size.
+    """
+    ids = table.valid_ids()
+    if len(ids) < 2:
+        return
+
+    by_start = ids[np.argsort(table.t0[ids], kind="stable")]
+    t0 = table.t0[by_start]
+    t1 = table.t1[by_start]
+    lo = np.minimum(table.xyz0, table.xyz1)[by_start] - safety_distance / 2
+    hi = np.maximum(table.xyz0, table.xyz1)[by_start] + safety_distance / 2
+    owner = table.owner[by_start]
+
+    first = np.arange(1, len(t0))
+    last = np.searchsorted(t0, t1, side="left")
+    counts = np.maximum(last[:-1] - first, 0)
+
+    # cut the sweep into runs of roughly MAX_PAIRS_PER_CHUNK pairs
+    cumulative = np.cumsum(counts)
+    cuts = np.searchsorted(
+        cumulative, np.arange(MAX_PAIRS_PER_CHUNK, cumulative[-1], MAX_PAIRS_PER_CHUNK)
+    )
+    bounds = np.unique(np.concatenate([[0], np.minimum(cuts + 1, len(counts)), [len(counts)]]))
+
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        n = counts[start:stop]
+        a = np.repeat(np.arange(start, stop), n)
+        b = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n) + a + 1
+
+        keep = (
+            (owner[a] != owner[b])
+            & np.all(lo[a] <= hi[b], axis=1)
+            & np.all(lo[b] <= hi[a], axis=1)
+        )
+        a, b = a[keep], b[keep]
+        if len(a) == 0:
+            continue
+
+        # report every pair with the lower-ranked drone first
+        a, b = by_start[a], by_start[b]
+        swap = table.owner[a] > table.owner[b]
+        a[swap], b[swap] = b[swap], a[swap]
+
+        # a zero-length segment (waypoints sharing a timestamp) overlaps
+        # nothing for a positive time; the kernels cannot use such pairs
+        t_start = np.maximum(table.t0[a], table.t0[b])
+        t_end = np.minimum(table.t1[a], table.t1[b])
+        overlap = t_start < t_end
+        if overlap.any():
+            yield a[overlap], b[overlap], t_start[overlap], t_end[overlap]
+
+
+def pair_alerts(table: SegmentTable, a, b, t, dist) -> List[Dict]:
+    """
+    One alert per hit between segments a and b of ``table``, placed at
+    segment a's position at time t.
+    """
+    pos = table.interpolate(a, t, meters=False)
+    return [
+        {
+            "drone_id": drone_a,
+            "other_drone_id": drone_b,
+            "time": time,
+            "lat": float(p[0]),
+            "lon": float(p[1]),
+            "alt": float(p[2]),
+            "distance": float(d),
+        }
+        for drone_a, drone_b, time, p, d in zip(
+            table.drone_ids[table.owner[a]],
+            table.drone_ids[table.owner[b]],
+            _timestamps(t),
+            pos.tolist(),
+            dist.tolist(),
+        )
+    ]
+
+
+def _pair_table(table, a, b, t, dist) -> pd.DataFrame:
+    hits = pd.DataFrame({
+        "owner_a": table.owner[a],
+        "owner_b": table.owner[b],
+        "distance": dist,
+        "time": _timestamps(t),
+    })
+    pairs = (
+        hits.groupby(["owner_a", "owner_b"], sort=True)
+        .agg(
+            conflicts=("distance", "size"),
+            min_distance=("distance", "min"),
+            first_conflict=("time", "min"),
+        )
+        .reset_index()
+    )
+    pairs.insert(0, "drone_a", table.drone_ids[pairs["owner_a"].to_numpy()])
+    pairs.insert(1, "drone_b", table.drone_ids[pairs["owner_b"].to_numpy()])
+    return pairs.drop(columns=["owner_a", "owner_b"])
+
+
+def _drone_summary(table, pairs: pd.DataFrame) -> pd.DataFrame:
+    both = pd.concat([
+        pairs.rename(columns={"drone_a": "drone_id", "drone_b": "other"}),
+        pairs.rename(columns={"drone_b": "drone_id", "drone_a": "other"}),
+    ])
+    summary = both.groupby("drone_id").agg(
+        conflicts=("conflicts", "sum"),
+        conflicting_drones=("other", "nunique"),
+        min_distance=("min_distance", "min"),
+    )
+    summary = summary.reindex(pd.Index(table.drone_ids, name="drone_id"))
+    summary["conflicts"] = summary["conflicts"].fillna(0).astype(np.int64)
+    summary["conflicting_drones"] = summary["conflicting_drones"].fillna(0).astype(np.int64)
+    return summary
+
+
+# Script entry point: nightly audit of the stored schedule
+if __name__ == "__main__":
+    from pathlib import Path
+    from src.data.trajectory_store import find_dataset, read_paths
+
+    schedule = find_dataset(Path(__file__).resolve().parents[2] / "data" / "normalized_paths")
+    if not schedule.exists():
+        raise FileNotFoundError(f"{schedule} not found")
+
+    result = detect_all_conflicts(read_paths(schedule))
+    print(f"✓ Audited {len(result['summary'])} drones: "
+          f"{len(result['alerts'])} conflict(s) between {len(result['pairs'])} pair(s)")
+    print(result["pairs"].to_string(index=False))
@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List
+
+from src.deconfliction.index import SegmentIndex
+from src.deconfliction.segments import SegmentTable
+from src.deconfliction.spatiotemporal import (
+    SAFETY_DISTANCE_METERS, build_alerts, coalesce_hits, find_hits
+)
+from src.deconfliction.stats import NO_STATS, ConflictStats
+
+_HIT_FIELDS = ("t", "distance", "start", "end")
+_SEGMENT_FIELDS = ("t0", "t1", "geo0", "geo1", "xyz0", "xyz1")
+
+
+class IncrementalAnalysis:
+    """
+    Conflict check of a path being edited, cached per segment.
+
+    Every segment of the new path is keyed on its endpoints (times and
+    positions). Its cpa hits against the airspace, together with the
+    fleet segments they involve, are cached under that key, so after an
+    edit only the segments touching the changed waypoints are checked
+    again: adding a waypoint re-checks at most the two segments it
+    creates. The cache is dropped whenever the airspace changes (its
+    ``version``) or the safety distance does.
+
+    ``check`` returns the same encounters, in the same order, as
+    ``detect_conflicts(new_path, airspace, encounters=True)``.
+    """
+
+    def __init__(self, airspace: SegmentIndex, safety_distance: float = SAFETY_DISTANCE_METERS):
+        self.airspace = airspace
+        self.safety_distance = safety_distance
+
+        self._cache: Dict[tuple, Dict] = {}   # segment key -> hits of that segment
+        self._valid_for = None                # (airspace version, safety distance) of the cache
+        self.checked = 0                      # segments re-checked by the last check
+        self.reused = 0                       # segments answered from the cache
+
+    def check(self, new_path: pd.DataFrame, stats: ConflictStats = None) -> List[Dict]:
+        """
+        Encounters between ``new_path`` (lat, lon, alt, timestamp) and
+        the airspace.
+        """
+        stats = stats or NO_STATS
+        valid_for = (getattr(self.airspace, "version", None), self.safety_distance)
+        if valid_for != self._valid_for:
+            self._cache = {}
+            self._valid_for = valid_for
+
+        with stats.stage("prepare"):
+            new = SegmentTable.from_path(new_path, projection=self.airspace.table.projection)
+            keys = [
+                (t0, t1) + tuple(geo0) + tuple(geo1)
+                for t0, t1, geo0, geo1 in zip(
+                    new.t0.tolist(), new.t1.tolist(), new.geo0.tolist(), new.geo1.tolist()
+                )
+            ]
+
+        missing = [k for k, key in enumerate(keys) if key not in self._cache]
+        if missing:
+            self._check_segments(new, missing, keys, stats)
+        self.checked = len(missing)
+        self.reused = len(keys) - len(missing)
+
+        # forget segments the edit removed
+        self._cache = {key: self._cache[key] for key in keys}
+
+        with stats.stage("merge"):
+            existing, hits = self._assemble(new, keys)
+            hits = coalesce_hits(existing, hits)
+        with stats.stage("alerts"):
+            alerts = build_alerts(new, existing, hits, intervals=True)
+        stats.count("alerts", len(alerts))
+        return alerts
+
+    def _check_segments(self, new: SegmentTable, missing: List[int], keys: List[tuple], stats: ConflictStats):
+        # all segments missing from the cache in one query and one kernel run
+        segments = new.take(missing)
+        with stats.stage("prepare"):
+            existing = self.airspace.candidates(segments, self.safety_distance)
+        hits = find_hits(segments, existing, self.safety_distance, "cpa", intervals=True, stats=stats)
+
+        # hits come ordered by drone first; regroup them by new segment
+        order = np.argsort(hits["i"], kind="stable")
+        bounds = np.searchsorted(hits["i"][order], np.arange(len(missing) + 1))
+
+        for k, key in enumerate(keys[m] for m in missing):
+            mine = order[bounds[k]:bounds[k + 1]]
+            j = hits["j"][mine]
+            entry = {field: hits[field][mine] for field in _HIT_FIELDS}
+            entry["drone_id"] = existing.drone_ids[existing.owner[j]]
+            entry["segments"] = existing.take(j)
+            self._cache[key] = entry
+
+    def _assemble(self, new: SegmentTable, keys: List[tuple]):
+        # cached hits of every segment, ordered like find_hits orders them:
+        # drone, new segment, fleet segment, time
+        segments = [k for k, key in enumerate(keys) if len(self._cache[key]["t"])]
+        if not segments:
+            empty = np.zeros(0, dtype=np.int64)
+            return SegmentTable.empty(new.projection), {
+                "i": empty, "j": empty, **{field: empty for field in _HIT_FIELDS}
+            }
+
+        entries = [self._cache[keys[k]] for k in segments]
+        i = np.concatenate([np.full(len(e["t"]), k, dtype=np.int64) for k, e in zip(segments, entries)])
+        drone = np.concatenate([e["drone_id"] for e in entries])
+        owner, drone_ids = pd.factorize(drone, sort=True)
+        fields = {
+            field: np.concatenate([getattr(e["segments"], field) for e in entries])
+            for field in _SEGMENT_FIELDS
+        }
+        hits = {field: np.concatenate([e[field] for e in entries]) for field in _HIT_FIELDS}
+
+        order = np.lexsort((hits["t"], fields["t0"], i, owner))
+        existing = SegmentTable.from_arrays(
+            drone_ids=np.asarray(drone_ids, dtype=object),
+            owner=owner[order].astype(np.int64),
+            projection=new.projection,
+            **{field: values[order] for field, values in fields.items()},
+        )
+        hits = {field: values[order] for field, values in hits.items()}
+        hits["i"] = i[order]
+        hits["j"] = np.arange(len(order), dtype=np.int64)
+        return existing, hits
@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+from itertools import chain
+from typing import Dict, Set, Tuple
+
+from src.deconfliction.projection import LocalProjection
+from src.deconfliction.segments import SegmentTable
+
+# 4D grid cell size (x / y / altitude in meters, time in seconds)
+CELL_METERS = 500
+CELL_ALT_METERS = 100
+CELL_SECONDS = 600
+
+
+class SegmentIndex:
+    """
+    Hashed uniform 4D grid (x, y, alt, time) over the segments of a fleet.
+
+    Every segment is registered in each cell its bounding box touches, so
+    a query only visits segments near the new path in space and time.
+    """
+
+    def __init__(
+        self,
+        table: SegmentTable,
+        cell_meters: float = CELL_METERS,
+        cell_alt_meters: float = CELL_ALT_METERS,
+        cell_seconds: float = CELL_SECONDS
+    ):
+        self.table = table
+        self.cell_size = np.array(
+            [cell_meters, cell_meters, cell_alt_meters, cell_seconds * 1e9]
+        )
+        self.cells: Dict[Tuple[int, ...], Set[int]] = {}
+
+        cells, seg = self._cells_of(table.valid_ids(), table)
+        self._insert(cells, seg)
+
+    @classmethod
+    def from_paths(
+        cls, paths: pd.DataFrame, projection: LocalProjection = None, **kwargs
+    ) -> "SegmentIndex":
+        """
+        Build an index from a fleet DataFrame (drone_id, lat, lon, alt,
+        timestamp), e.g. the one loaded by ``MainWindow.load_paths``.
+        """
+        return cls(SegmentTable.from_paths(paths, projection), **kwargs)
+
+    def __len__(self):
+        return len(self.table)
+
+    def query(self, new: SegmentTable, safety_distance: float) -> np.ndarray:
+        """
+        Sorted ids of stored segments whose cells are touched by any
+        segment of ``new``, padded by ``safety_distance``.
+        """
+        if len(new) == 0 or not self.cells:
+            return np.empty(0, dtype=np.int64)
+
+        cells, _ = self._cells_of(np.arange(len(new)), new, pad=safety_distance)
+        keys = map(tuple, np.unique(cells, axis=0).tolist())
+        hits = chain.from_iterable(self.cells.get(key, ()) for key in keys)
+
+        return np.unique(np.fromiter(hits, dtype=np.int64))
+
+    def candidates(self, new: SegmentTable, safety_distance: float) -> SegmentTable:
+        """
+        Stored segments that may come within ``safety_distance`` of ``new``.
+        """
+        return self.table.take(self.query(new, safety_distance))
+
+    def _cells_of(self, idx: np.ndarray, table: SegmentTable, pad: float = 0.0):
+        """
+        Enumerate every grid cell touched by the bounding boxes of
+        segments ``idx``. Returns (cells (E, 4) int64, segment id (E,)).
+        """
+        lo = np.column_stack([
+            np.minimum(table.xyz0[idx], table.xyz1[idx]) - pad,
+            table.t0[idx].astype(np.float64),
+        ])
+        hi = np.column_stack([
+            np.maximum(table.xyz0[idx], table.xyz1[idx]) + pad,
+            table.t1[idx].astype(np.float64),
+        ])
+
+        lo_c = np.floor(lo / self.cell_size).astype(np.int64)
+        extent = np.floor(hi / self.cell_size).astype(np.int64) - lo_c + 1
+        counts = extent.prod(axis=1)
+
+        owner = np.repeat(np.arange(len(idx)), counts)
+        rank = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+
+        # mixed-radix decode of rank into per-dimension offsets
+        cells = np.empty((len(owner), 4), dtype=np.int64)
+        for d in range(3, -1, -1):
+            ext = extent[owner, d]
+            cells[:, d] = lo_c[owner, d] + rank % ext
+            rank = rank // ext
+
+        return cells, np.asarray(idx, dtype=np.int64)[owner]
+
+    def _insert(self, cells: np.ndarray, seg: np.ndarray):
+        for key, ids in self._group_by_cell(cells, seg):
+            self.cells.setdefault(key, set()).update(ids)
+
+    def _remove(self, cells: np.ndarray, seg: np.ndarray):
+        for key, ids in self._group_by_cell(cells, seg):
+            bucket = self.cells.get(key)
+            if bucket is None:
+                continue
+            bucket.difference_update(ids)
+            if not bucket:
+                del self.cells[key]
+
+    @staticmethod
+    def _group_by_cell(cells: np.ndarray, seg: np.ndarray):
+        if len(seg) == 0:
+            return []
+
+        order = np.lexsort(cells.T[::-1])
+        cells, seg = cells[order], seg[order]
+        keys, start = np.unique(cells, axis=0, return_index=True)
+
+        return zip(map(tuple, keys.tolist()), (ids.tolist() for ids in np.split(seg, start[1:])))
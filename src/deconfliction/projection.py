@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+
+EARTH_RADIUS_METERS = 6371008.8
+METERS_PER_DEGREE = 111000  # legacy flat lat/lon → meters approximation
+
+# Centre of the default operational area (see src/data/simulated_paths.py)
+OPERATING_AREA_ORIGIN = (18.566817, 73.772498)
+
+DISTANCE_MODES = ("enu", "flat", "haversine")
+
+
+class LocalProjection:
+    """
+    Distance model for one operating area.
+
+    Waypoints are projected once into local Cartesian meters (x east,
+    y north, z up) so conflict math never converts degrees in its hot
+    loop.
+
+    mode="enu":        equirectangular projection about the origin; east-west
+                       distances are scaled by cos(origin latitude).
+    mode="flat":       the original ``* 111000`` on both lat and lon.
+    mode="haversine":  ENU for the conflict search, with the horizontal
+                       separation of every candidate conflict re-measured
+                       along the great circle.
+    """
+
+    def __init__(self, lat0: float, lon0: float, mode: str = "enu"):
+        if mode not in DISTANCE_MODES:
+            raise ValueError(f"Unknown distance mode '{mode}', expected one of {DISTANCE_MODES}")
+
+        self.lat0 = float(lat0)
+        self.lon0 = float(lon0)
+        self.mode = mode
+
+        # meters per degree along each horizontal axis
+        if mode == "flat":
+            self._scale = np.array([METERS_PER_DEGREE, METERS_PER_DEGREE])
+        else:
+            self._scale = np.radians([
+                EARTH_RADIUS_METERS * np.cos(np.radians(self.lat0)),  # east, per deg lon
+                EARTH_RADIUS_METERS,                                  # north, per deg lat
+            ])
+
+    @classmethod
+    def centered_on(cls, paths: pd.DataFrame, mode: str = "enu") -> "LocalProjection":
+        """
+        Projection about the centre of the area covered by ``paths``.
+        """
+        if len(paths) == 0:
+            return cls(*OPERATING_AREA_ORIGIN, mode=mode)
+
+        lat = (paths["lat"].min() + paths["lat"].max()) / 2
+        lon = (paths["lon"].min() + paths["lon"].max()) / 2
+        return cls(lat, lon, mode=mode)
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, LocalProjection)
+            and (self.lat0, self.lon0, self.mode) == (other.lat0, other.lon0, other.mode)
+        )
+
+    def __repr__(self):
+        return f"LocalProjection({self.lat0}, {self.lon0}, mode='{self.mode}')"
+
+    @property
+    def refines(self) -> bool:
+        """True when candidate conflicts are re-measured with haversine."""
+        return self.mode == "haversine"
+
+    def project(self, geo: np.ndarray) -> np.ndarray:
+        """
+        Convert an (N, 3) array of (lat, lon, alt) to local meters.
+        """
+        geo = np.asarray(geo, dtype=np.float64).reshape(-1, 3)
+        xyz = np.empty_like(geo)
+
+        if self.mode == "flat":
+            # keep the original axis order (lat, lon)
+            xyz[:, 0] = geo[:, 0] * self._scale[0]
+            xyz[:, 1] = geo[:, 1] * self._scale[1]
+        else:
+            xyz[:, 0] = (geo[:, 1] - self.lon0) * self._scale[0]
+            xyz[:, 1] = (geo[:, 0] - self.lat0) * self._scale[1]
+        xyz[:, 2] = geo[:, 2]
+        return xyz
+
+    def unproject(self, xyz: np.ndarray) -> np.ndarray:
+        """
+        Inverse of ``project``: local meters back to (lat, lon, alt).
+        """
+        xyz = np.asarray(xyz, dtype=np.float64).reshape(-1, 3)
+        geo = np.empty_like(xyz)
+
+        if self.mode == "flat":
+            geo[:, 0] = xyz[:, 0] / self._scale[0]
+            geo[:, 1] = xyz[:, 1] / self._scale[1]
+        else:
+            geo[:, 0] = self.lat0 + xyz[:, 1] / self._scale[1]
+            geo[:, 1] = self.lon0 + xyz[:, 0] / self._scale[0]
+        geo[:, 2] = xyz[:, 2]
+        return geo
+
+
+def haversine_distance(geo_a: np.ndarray, geo_b: np.ndarray) -> np.ndarray:
+    """
+    3D separation in meters between (lat, lon, alt) rows: great-circle
+    horizontal distance combined with the altitude difference.
+    """
+    lat_a, lon_a = np.radians(geo_a[..., 0]), np.radians(geo_a[..., 1])
+    lat_b, lon_b = np.radians(geo_b[..., 0]), np.radians(geo_b[..., 1])
+
+    h = (
+        np.sin((lat_b - lat_a) / 2) ** 2
+        + np.cos(lat_a) * np.cos(lat_b) * np.sin((lon_b - lon_a) / 2) ** 2
+    )
+    horizontal = 2 * EARTH_RADIUS_METERS * np.arcsin(np.sqrt(np.minimum(h, 1.0)))
+    vertical = geo_a[..., 2] - geo_b[..., 2]
+    return np.sqrt(horizontal ** 2 + vertical ** 2)
+
+
+DEFAULT_PROJECTION = LocalProjection(*OPERATING_AREA_ORIGIN)
@@ -0,0 +1,174 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List
+
+from src.deconfliction.index import SegmentIndex
+from src.deconfliction.projection import LocalProjection
+from src.deconfliction.segments import SegmentTable
+
+_SEGMENT_FIELDS = ("owner", "t0", "t1", "geo0", "geo1", "xyz0", "xyz1")
+
+
+class AirspaceRegistry(SegmentIndex):
+    """
+    Live, mutable store of approved flights backed by the 4D grid index.
+
+    Flights are added, removed or amended in place: only the grid cells a
+    flight's segments touch are updated, and freed segment slots are
+    reused, so the fleet never needs a full rebuild. ``version`` is bumped
+    on every change so callers can invalidate cached results.
+    """
+
+    def __init__(self, projection: LocalProjection = None, **kwargs):
+        super().__init__(SegmentTable.empty(projection), **kwargs)
+        self.alive = np.zeros(0, dtype=bool)
+        self.version = 0
+
+        self._size = 0                           # high-water mark of used slots
+        self._free: List[int] = []               # released slots for reuse
+        self._flights: Dict[object, np.ndarray] = {}   # drone_id -> slots
+        self._codes: Dict[object, int] = {}      # drone_id -> owner code
+        self._free_codes: List[int] = []         # codes of removed flights for reuse
+
+    @classmethod
+    def from_paths(
+        cls, paths: pd.DataFrame, projection: LocalProjection = None, **kwargs
+    ) -> "AirspaceRegistry":
+        """
+        Bulk-load a registry from a fleet DataFrame (drone_id, lat, lon,
+        alt, timestamp).
+        """
+        registry = cls(projection, **kwargs)
+        table = SegmentTable.from_paths(paths, projection)
+
+        registry.table = table
+        registry.alive = np.ones(len(table), dtype=bool)
+        registry._size = len(table)
+        registry._codes = {drone_id: code for code, drone_id in enumerate(table.drone_ids)}
+
+        slots = np.arange(len(table))
+        bounds = np.flatnonzero(np.diff(table.owner)) + 1
+        for group in np.split(slots, bounds) if len(table) else []:
+            registry._flights[table.drone_ids[table.owner[group[0]]]] = group
+
+        cells, seg = registry._cells_of(slots, table)
+        registry._insert(cells, seg)
+        return registry
+
+    def __len__(self):
+        return len(self._flights)
+
+    def __contains__(self, drone_id):
+        return drone_id in self._flights
+
+    @property
+    def flights(self) -> List:
+        return list(self._flights)
+
+    def add_flight(self, drone_id, path: pd.DataFrame):
+        """
+        Register an approved flight path (lat, lon, alt, timestamp).
+        """
+        if drone_id in self._flights:
+            raise ValueError(f"Flight {drone_id} is already registered")
+
+        self._add(drone_id, SegmentTable.from_path(path, drone_id, self.table.projection))
+        self.version += 1
+
+    def remove_flight(self, drone_id):
+        """
+        Drop a flight from the airspace.
+        """
+        if drone_id not in self._flights:
+            raise KeyError(f"Flight {drone_id} is not registered")
+
+        self._remove_slots(self._flights.pop(drone_id))
+        self._free_codes.append(self._codes.pop(drone_id))
+        self.version += 1
+
+    def amend_flight(self, drone_id, path: pd.DataFrame):
+        """
+        Replace the filed path of an existing flight.
+        """
+        if drone_id not in self._flights:
+            raise KeyError(f"Flight {drone_id} is not registered")
+
+        segments = SegmentTable.from_path(path, drone_id, self.table.projection)
+        self._remove_slots(self._flights.pop(drone_id))
+        self._add(drone_id, segments)
+        self.version += 1
+
+    def candidates(self, new: SegmentTable, safety_distance: float) -> SegmentTable:
+        """
+        Live segments near ``new``, grouped by drone_id order then time.
+        """
+        return self._ordered(self.query(new, safety_distance))
+
+    def to_table(self) -> SegmentTable:
+        """
+        Every live segment, grouped by drone_id order then time.
+        """
+        return self._ordered(np.flatnonzero(self.alive))
+
+    def _ordered(self, slots: np.ndarray) -> SegmentTable:
+        # owner codes follow insertion order; re-rank them so alerts come
+        # out in the same drone order as a DataFrame groupby
+        table = self.table.take(slots)
+        codes, drone_ids = pd.factorize(self.table.drone_ids[table.owner], sort=True)
+
+        order = np.lexsort((table.t0, codes))
+        table = table.take(order)
+        table.owner = codes[order].astype(np.int64)
+        table.drone_ids = np.asarray(drone_ids, dtype=object)
+        return table
+
+    def _add(self, drone_id, segments: SegmentTable):
+        code = self._codes.get(drone_id)
+        if code is None:
+            # a removed flight's code is reused, so drone_ids stays as long
+            # as the most flights ever registered at once
+            if self._free_codes:
+                code = self._free_codes.pop()
+                self.table.drone_ids[code] = drone_id
+            else:
+                code = len(self.table.drone_ids)
+                self.table.drone_ids = np.append(self.table.drone_ids, np.asarray([drone_id], dtype=object))
+            self._codes[drone_id] = code
+
+        slots = self._allocate(len(segments))
+        for field in _SEGMENT_FIELDS:
+            getattr(self.table, field)[slots] = getattr(segments, field)
+        self.table.owner[slots] = code
+        self.alive[slots] = True
+        self._flights[drone_id] = slots
+
+        cells, seg = self._cells_of(slots, self.table)
+        self._insert(cells, seg)
+
+    def _remove_slots(self, slots: np.ndarray):
+        cells, seg = self._cells_of(slots, self.table)
+        self._remove(cells, seg)
+        self.alive[slots] = False
+        self._free.extend(slots.tolist())
+
+    def _allocate(self, n: int) -> np.ndarray:
+        reused = [self._free.pop() for _ in range(min(n, len(self._free)))]
+        fresh = n - len(reused)
+
+        if self._size + fresh > len(self.alive):
+            self._grow(max(2 * len(self.alive), self._size + fresh, 16))
+
+        slots = np.array(reused + list(range(self._size, self._size + fresh)), dtype=np.int64)
+        self._size += fresh
+        return np.sort(slots)
+
+    def _grow(self, capacity: int):
+        for field in _SEGMENT_FIELDS:
+            old = getattr(self.table, field)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self.table, field, new)
+
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:len(self.alive)] = self.alive
+        self.alive = alive
@@ -0,0 +1,199 @@
+import numpy as np
+import pandas as pd
+
+from src.deconfliction.projection import DEFAULT_PROJECTION, LocalProjection
+
+
+def timestamps_ns(values) -> np.ndarray:
+    """
+    Convert a timestamp column (or list) to int64 epoch nanoseconds.
+    """
+    ts = pd.to_datetime(values)
+    return np.asarray(ts, dtype="datetime64[ns]").view(np.int64)
+
+
+class SegmentTable:
+    """
+    Flat, contiguous segment arrays for one or more drone trajectories.
+
+    Segment k flies from (t0[k], geo0[k]) to (t1[k], geo1[k]) and belongs
+    to drone_ids[owner[k]]. Segments are grouped by drone in the order
+    ``groupby("drone_id")`` would visit them, then by time. xyz0 / xyz1
+    hold the same endpoints projected to meters by ``projection``; tables
+    are only comparable when they share a projection.
+
+    ``valid`` is None for ordinary tables. Tables viewed straight out of a
+    mapped fleet file (see src/deconfliction/trajectories.py) also span
+    the gap between one drone's last waypoint and the next drone's first;
+    ``valid`` masks those out.
+    """
+
+    def __init__(self, drone_ids, owner, t0, t1, geo0, geo1, projection: LocalProjection = None):
+        self.drone_ids = np.asarray(drone_ids, dtype=object)
+        self.owner = np.ascontiguousarray(owner, dtype=np.int64)
+        self.t0 = np.ascontiguousarray(t0, dtype=np.int64)
+        self.t1 = np.ascontiguousarray(t1, dtype=np.int64)
+        self.geo0 = np.ascontiguousarray(geo0, dtype=np.float64).reshape(-1, 3)
+        self.geo1 = np.ascontiguousarray(geo1, dtype=np.float64).reshape(-1, 3)
+
+        # projected once, reused by every distance evaluation
+        self.projection = projection or DEFAULT_PROJECTION
+        self.xyz0 = self.projection.project(self.geo0)
+        self.xyz1 = self.projection.project(self.geo1)
+
+        self.valid = None
+        self.source = None   # (fleet file, start, stop) for mapped tables
+
+    def __len__(self):
+        return len(self.t0)
+
+    @classmethod
+    def from_paths(cls, paths: pd.DataFrame, projection: LocalProjection = None) -> "SegmentTable":
+        """
+        Build a table from a DataFrame with drone_id, lat, lon, alt and
+        timestamp columns, holding any number of drones.
+        """
+        if len(paths) == 0:
+            return cls.empty(projection)
+
+        codes, drone_ids = pd.factorize(paths["drone_id"], sort=True)
+        t = timestamps_ns(paths["timestamp"])
+        order = np.lexsort((t, codes))
+
+        codes = codes[order]
+        t = t[order]
+        geo = paths[["lat", "lon", "alt"]].to_numpy(dtype=np.float64)[order]
+
+        # consecutive waypoints of the same drone form a segment
+        valid = np.flatnonzero(codes[:-1] == codes[1:])
+
+        return cls(
+            drone_ids=drone_ids,
+            owner=codes[valid],
+            t0=t[valid],
+            t1=t[valid + 1],
+            geo0=geo[valid],
+            geo1=geo[valid + 1],
+            projection=projection,
+        )
+
+    @classmethod
+    def from_path(
+        cls, path: pd.DataFrame, drone_id="new_path", projection: LocalProjection = None
+    ) -> "SegmentTable":
+        """
+        Build a single-drone table from a path DataFrame (drone_id optional).
+        """
+        table = cls.from_paths(path.assign(drone_id=drone_id), projection)
+        if len(table.drone_ids) == 0:
+            table.drone_ids = np.asarray([drone_id], dtype=object)
+        return table
+
+    @classmethod
+    def empty(cls, projection: LocalProjection = None) -> "SegmentTable":
+        return cls(
+            drone_ids=[],
+            owner=np.empty(0),
+            t0=np.empty(0),
+            t1=np.empty(0),
+            geo0=np.empty((0, 3)),
+            geo1=np.empty((0, 3)),
+            projection=projection,
+        )
+
+    @classmethod
+    def from_arrays(
+        cls, drone_ids, owner, t0, t1, geo0, geo1, xyz0, xyz1,
+        projection: LocalProjection, valid: np.ndarray = None, source: tuple = None
+    ) -> "SegmentTable":
+        """
+        Wrap already projected arrays as they are: no copy, no conversion.
+        """
+        table = cls.__new__(cls)
+        table.drone_ids = drone_ids
+        table.projection = projection
+        table.owner = owner
+        table.t0 = t0
+        table.t1 = t1
+        table.geo0 = geo0
+        table.geo1 = geo1
+        table.xyz0 = xyz0
+        table.xyz1 = xyz1
+        table.valid = valid
+        table.source = source
+        return table
+
+    def __reduce__(self):
+        # mapped tables travel to worker processes as a file reference,
+        # not as a pickled copy of their arrays
+        if self.source is not None:
+            return _reopen_segments, self.source
+        return super().__reduce__()
+
+    def take(self, idx) -> "SegmentTable":
+        """
+        Return a table holding only the segments at positions ``idx``
+        (an index array, or a slice for a zero-copy view). Drone ids are
+        shared, so owner indices stay comparable.
+        """
+        source = None
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(len(self))
+            if self.source is not None and step == 1:
+                path, offset, _ = self.source
+                source = (path, offset + start, offset + max(start, stop))
+        else:
+            idx = np.asarray(idx, dtype=np.int64)
+
+        return SegmentTable.from_arrays(
+            drone_ids=self.drone_ids,
+            owner=self.owner[idx],
+            t0=self.t0[idx],
+            t1=self.t1[idx],
+            geo0=self.geo0[idx],
+            geo1=self.geo1[idx],
+            xyz0=self.xyz0[idx],
+            xyz1=self.xyz1[idx],
+            projection=self.projection,
+            valid=None if self.valid is None else self.valid[idx],
+            source=source,
+        )
+
+    def valid_ids(self) -> np.ndarray:
+        """
+        Positions of the real segments of this table.
+        """
+        if self.valid is None:
+            return np.arange(len(self))
+        return np.flatnonzero(self.valid)
+
+    def interpolate(self, idx: np.ndarray, t: np.ndarray, meters: bool = True) -> np.ndarray:
+        """
+        Linear position of segments ``idx`` at times ``t`` (ns).
+
+        ``t`` may carry extra trailing axes (e.g. several samples per
+        segment); the result gains a final axis of size 3.
+        """
+        p0, p1 = (self.xyz0, self.xyz1) if meters else (self.geo0, self.geo1)
+        extra = (slice(None),) + (None,) * (t.ndim - 1)
+
+        t0 = self.t0[idx][extra]
+        dt = (self.t1[idx] - self.t0[idx])[extra].astype(np.float64)
+        u = (t - t0) / dt
+
+        start = p0[idx][extra]
+        delta = (p1[idx] - p0[idx])[extra]
+        return start + u[..., None] * delta
+
+    def velocity(self, idx: np.ndarray) -> np.ndarray:
+        """
+        Constant velocity (m/s) of segments ``idx`` in local meters.
+        """
+        dt = (self.t1[idx] - self.t0[idx]) / 1e9
+        return (self.xyz1[idx] - self.xyz0[idx]) / dt[:, None]
+
+
+def _reopen_segments(path, start: int, stop: int) -> SegmentTable:
+    from src.deconfliction.trajectories import FleetArrays
+
+    return FleetArrays.open(path).segments().take(slice(start, stop))
@@ -1,93 +1,664 @@
+import os
 import numpy as np
 import pandas as pd
-from typing import List, Dict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
+from src.deconfliction.index import SegmentIndex
+from src.deconfliction.projection import LocalProjection, haversine_distance
+from src.deconfliction.segments import SegmentTable
+from src.deconfliction.stats import NO_STATS, ConflictStats
+from src.deconfliction.trajectories import FleetArrays
 
 SAFETY_DISTANCE_METERS = 12  # configurable
+SAMPLES_PER_OVERLAP = 4      # time probes per pair for method="sample"
+MAX_PAIRS_PER_CHUNK = 250_000  # bounds the (new x existing) broadcast
+PARALLEL_MIN_SEGMENTS = 100_000  # below this, worker start-up costs more than it saves
+STREAM_GROUP_SEGMENTS = 4096  # fleet segments per drone group yielded by iter_conflicts
+FIRST_CONFLICT_BATCH = 256   # pairs in the first chunk / kernel call of first_conflict; x4 after
+
+_executors: Dict[int, ProcessPoolExecutor] = {}
 
 
 def detect_conflicts(
     new_path: pd.DataFrame,
-    existing_paths: pd.DataFrame,
-    safety_distance: float = SAFETY_DISTANCE_METERS
+    existing_paths: Union[pd.DataFrame, SegmentIndex, FleetArrays],
+    safety_distance: float = SAFETY_DISTANCE_METERS,
+    method: str = "cpa",
+    intervals: bool = False,
+    encounters: bool = False,
+    workers: int = 1,
+    projection: LocalProjection = None,
+    stats: ConflictStats = None
 ) -> List[Dict]:
     """
     Detect spatiotemporal (4D) conflicts between a new path
     and existing drone trajectories.
 
+    existing_paths is either a fleet DataFrame, a (memory-mapped)
+    FleetArrays read without copying, or a prebuilt SegmentIndex /
+    AirspaceRegistry, in which case only nearby segments are checked.
+
+    method="cpa" solves the closest point of approach of every pair of
+    overlapping segments exactly (one alert per pair). method="sample"
+    probes 4 evenly spaced times per pair instead (one alert per sample).
+    With intervals=True (cpa only) each alert also carries "start" and
+    "end": the window during which separation stays below
+    safety_distance.
+
+    With encounters=True (cpa only) the per-pair alerts are coalesced
+    into one record per encounter: consecutive conflicts with the same
+    drone whose windows overlap or touch. "start" / "end" bound the whole
+    encounter; "time", "distance" and the position are those of its
+    closest approach.
+
+    workers > 1 (or None for all cores) splits the fleet across a
+    process pool; the alert order is the same as a serial run.
+
+    projection selects the distance model (see LocalProjection); a
+    fleet file, index or registry already carries its own, and plain
+    paths default to one centred on the new and existing paths.
+
+    stats (a ConflictStats) opts in to counters and stage timings.
+
     Returns a list of conflict dictionaries.
     """
+    stats = stats or NO_STATS
+    with stats.stage("prepare"):
+        new = SegmentTable.from_path(new_path, projection=_projection_of(existing_paths, new_path, projection))
+        existing = prepare_existing(existing_paths, new, safety_distance)
+
+    return conflicts_between(new, existing, safety_distance, method, intervals, encounters, workers, stats)
+
+
+def iter_conflicts(
+    new_path: pd.DataFrame,
+    existing_paths: Union[pd.DataFrame, SegmentIndex, FleetArrays],
+    safety_distance: float = SAFETY_DISTANCE_METERS,
+    method: str = "cpa",
+    intervals: bool = False,
+    encounters: bool = False,
+    projection: LocalProjection = None,
+    cancel: Callable[[], bool] = None,
+    progress: Callable[[int, int], None] = None,
+    stats: ConflictStats = None
+) -> Iterator[Dict]:
+    """
+    Generator variant of detect_conflicts: the fleet is checked in
+    groups of whole drones (about STREAM_GROUP_SEGMENTS segments each)
+    and each group's alerts are yielded as soon as it finishes, in the
+    same order detect_conflicts returns them.
+
+    cancel is polled before every group (e.g. ``threading.Event().is_set``);
+    once it returns True the generator stops. progress, if given, is
+    called after every group with (segments done, segments total).
+    """
+    if cancel is not None and cancel():
+        return
+
+    stats = stats or NO_STATS
+    with stats.stage("prepare"):
+        new = SegmentTable.from_path(new_path, projection=_projection_of(existing_paths, new_path, projection))
+        existing = prepare_existing(existing_paths, new, safety_distance)
+
+    cuts = np.arange(STREAM_GROUP_SEGMENTS, len(existing), STREAM_GROUP_SEGMENTS)
+    bounds = _align_to_drones(existing.owner, cuts)
+
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        if cancel is not None and cancel():
+            return
+
+        yield from conflicts_between(
+            new, existing.take(slice(lo, hi)), safety_distance, method,
+            intervals, encounters, stats=stats
+        )
+        if progress is not None:
+            progress(hi, len(existing))
+
+
+def detect_conflicts_batch(
+    candidates: pd.DataFrame,
+    existing: Union[pd.DataFrame, SegmentIndex, FleetArrays],
+    safety_distance: float = SAFETY_DISTANCE_METERS,
+    method: str = "cpa",
+    intervals: bool = False,
+    encounters: bool = False,
+    mutual: bool = False,
+    workers: int = 1,
+    projection: LocalProjection = None,
+    stats: ConflictStats = None
+) -> Dict[object, List[Dict]]:
+    """
+    Check many candidate plans (one DataFrame, keyed by drone_id) against
+    the existing fleet in one call.
+
+    The fleet is indexed once and the candidates are sorted and grouped
+    once, instead of once per plan. With mutual=True each candidate is
+    also checked against the other candidates; those alerts follow the
+    fleet alerts and name the other candidate as drone_id.
+
+    Returns {candidate drone_id: list of conflict dictionaries}.
+    """
+    stats = stats or NO_STATS
+    with stats.stage("prepare"):
+        plans = SegmentTable.from_paths(candidates, _projection_of(existing, candidates, projection))
+        if isinstance(existing, pd.DataFrame):
+            existing = SegmentIndex.from_paths(existing, projection=plans.projection)
+        elif isinstance(existing, FleetArrays):
+            existing = SegmentIndex(existing.segments())
+        peers = SegmentIndex(plans) if mutual else None
+
+    bounds = np.searchsorted(plans.owner, np.arange(len(plans.drone_ids) + 1))
+    results = {}
+
+    for code, drone_id in enumerate(plans.drone_ids):
+        new = plans.take(np.arange(bounds[code], bounds[code + 1]))
+
+        with stats.stage("prepare"):
+            fleet = existing.candidates(new, safety_distance)
+        alerts = conflicts_between(
+            new, fleet, safety_distance, method, intervals, encounters, workers, stats
+        )
+
+        if peers is not None:
+            with stats.stage("prepare"):
+                others = peers.query(new, safety_distance)
+                others = plans.take(others[plans.owner[others] != code])
+            alerts += conflicts_between(
+                new, others, safety_distance, method, intervals, encounters, stats=stats
+            )
+
+        results[drone_id] = alerts
+
+    return results
+
+
+def first_conflict(
+    new_path: pd.DataFrame,
+    existing_paths: Union[pd.DataFrame, SegmentIndex, FleetArrays],
+    safety_distance: float = SAFETY_DISTANCE_METERS,
+    method: str = "cpa",
+    projection: LocalProjection = None,
+    stats: ConflictStats = None
+) -> Optional[Dict]:
+    """
+    Return one conflict between the new path and the fleet, or None if
+    the path is safe, stopping at the first violation found.
 
-    alerts = []
+    Segment pairs are built lazily, in chunks of the fleet of growing
+    size. Within a chunk, pairs whose bounding boxes never come within
+    safety_distance are dropped and the rest are checked nearest first,
+    in kernel calls of growing size; the scan stops in the first chunk
+    holding a conflict, so the rest of the fleet is never paired up.
+    The alert returned is a conflict, not necessarily the earliest or
+    the closest one.
+    """
+    if method not in KERNELS:
+        raise ValueError(f"Unknown method '{method}', expected one of {sorted(KERNELS)}")
 
-    new_path = new_path.sort_values("timestamp")
-    grouped = existing_paths.groupby("drone_id")
+    stats = stats or NO_STATS
+    with stats.stage("prepare"):
+        new = SegmentTable.from_path(new_path, projection=_projection_of(existing_paths, new_path, projection))
+        existing = prepare_existing(existing_paths, new, safety_distance)
 
-    for drone_id, df in grouped:
-        df = df.sort_values("timestamp")
+    kernel = KERNELS[method]
+    samples_per_pair = SAMPLES_PER_OVERLAP if method == "sample" else 1
+    stats.count("checks")
 
-        if len(df) < 2:
-            continue
+    for i, j, t_start, t_end in stats.timed("pairs", _closest_pairs_first(new, existing, safety_distance)):
+        with stats.stage("kernel"):
+            hits = run_kernel(kernel, new, existing, i, j, t_start, t_end, safety_distance)
+        stats.count("segment_pairs", len(i))
+        stats.count("samples", len(i) * samples_per_pair)
 
-        # --- time window overlap check ---
-        if (
-            new_path.timestamp.iloc[-1] < df.timestamp.iloc[0]
-            or new_path.timestamp.iloc[0] > df.timestamp.iloc[-1]
-        ):
-            continue
+        if len(hits["t"]):
+            with stats.stage("alerts"):
+                alert = build_alerts(new, existing, {key: values[:1] for key, values in hits.items()})[0]
+            stats.count("hits")
+            stats.count("alerts")
+            return alert
 
-        for i in range(len(new_path) - 1):
-            n1, n2 = new_path.iloc[i], new_path.iloc[i + 1]
+    return None
 
-            for j in range(len(df) - 1):
-                o1, o2 = df.iloc[j], df.iloc[j + 1]
 
-                t_start = max(n1.timestamp, o1.timestamp)
-                t_end = min(n2.timestamp, o2.timestamp)
+def is_path_safe(
+    new_path: pd.DataFrame,
+    existing_paths: Union[pd.DataFrame, SegmentIndex, FleetArrays],
+    safety_distance: float = SAFETY_DISTANCE_METERS,
+    method: str = "cpa",
+    projection: LocalProjection = None
+) -> bool:
+    """
+    True when the new path keeps safety_distance from every drone of the
+    fleet. Stops at the first violation (see first_conflict).
+    """
+    return first_conflict(new_path, existing_paths, safety_distance, method, projection) is None
 
-                if t_start >= t_end:
-                    continue
 
-                # sample time overlap
-                try:
-                    ts = pd.date_range(t_start, t_end, periods=4)
-                except ValueError:
-                    continue
+def prepare_existing(
+    existing_paths: Union[pd.DataFrame, SegmentIndex, FleetArrays],
+    new: SegmentTable,
+    safety_distance: float = SAFETY_DISTANCE_METERS
+) -> SegmentTable:
+    """
+    Segments of the existing fleet worth checking against ``new``.
+    """
+    if isinstance(existing_paths, pd.DataFrame):
+        return SegmentTable.from_paths(existing_paths, new.projection)
+    if isinstance(existing_paths, FleetArrays):
+        return existing_paths.segments()
+    return existing_paths.candidates(new, safety_distance)
+
 
-                for t in ts:
-                    dt_new = (n2.timestamp - n1.timestamp).total_seconds()
-                    dt_old = (o2.timestamp - o1.timestamp).total_seconds()
+def _projection_of(
+    existing_paths: Union[pd.DataFrame, SegmentIndex, FleetArrays],
+    new_paths: pd.DataFrame,
+    projection: LocalProjection = None
+) -> LocalProjection:
+    """
+    The distance model both sides of a check must share; plain paths
+    default to one centred on the new and existing paths together.
+    """
+    if isinstance(existing_paths, pd.DataFrame):
+        if projection is not None:
+            return projection
+        both = [new_paths, existing_paths]
+        return LocalProjection.centered_on(pd.DataFrame({
+            axis: np.concatenate([paths[axis].to_numpy(dtype=np.float64) for paths in both])
+            for axis in ("lat", "lon")
+        }))
 
-                    if dt_new == 0 or dt_old == 0:
-                        continue
+    if isinstance(existing_paths, FleetArrays):
+        built = existing_paths.projection
+    else:
+        built = existing_paths.table.projection
+    if projection is not None and projection != built:
+        raise ValueError(f"{type(existing_paths).__name__} was built with {built}, not {projection}")
+    return built
 
-                    un = (t - n1.timestamp).total_seconds() / dt_new
-                    uo = (t - o1.timestamp).total_seconds() / dt_old
 
-                    Pn = np.array([
-                        n1.lat + un * (n2.lat - n1.lat),
-                        n1.lon + un * (n2.lon - n1.lon),
-                        n1.alt + un * (n2.alt - n1.alt)
-                    ])
+def conflicts_between(
+    new: SegmentTable,
+    existing: SegmentTable,
+    safety_distance: float = SAFETY_DISTANCE_METERS,
+    method: str = "cpa",
+    intervals: bool = False,
+    encounters: bool = False,
+    workers: int = 1,
+    stats: ConflictStats = NO_STATS
+) -> List[Dict]:
+    """
+    Vectorized conflict check of one prepared path against a prepared
+    fleet. Alerts are ordered by drone, new segment, existing segment
+    and time (by drone and start time with encounters=True).
+    """
+    if encounters and method != "cpa":
+        raise ValueError("encounters=True requires method='cpa'")
+    intervals = intervals or encounters
 
-                    Po = np.array([
-                        o1.lat + uo * (o2.lat - o1.lat),
-                        o1.lon + uo * (o2.lon - o1.lon),
-                        o1.alt + uo * (o2.alt - o1.alt)
-                    ])
+    stats.count("checks")
+    stats.count("candidate_segments", len(existing.valid_ids()) if stats.enabled else 0)
 
-                    # lat/lon → meters (approx)
-                    horizontal_m = np.linalg.norm(Pn[:2] - Po[:2]) * 111000
-                    vertical_m = abs(Pn[2] - Po[2])
-                    distance_m = np.sqrt(horizontal_m**2 + vertical_m**2)
+    if workers == 1 or len(existing) < PARALLEL_MIN_SEGMENTS:
+        hits = find_hits(new, existing, safety_distance, method, intervals, stats)
+    else:
+        hits = find_hits_parallel(new, existing, safety_distance, method, intervals, workers, stats)
 
-                    if distance_m < safety_distance:
-                        alerts.append({
-                            "drone_id": drone_id,
-                            "time": t,
-                            "lat": float(Pn[0]),
-                            "lon": float(Pn[1]),
-                            "alt": float(Pn[2]),
-                            "distance": float(distance_m),
-                        })
+    if encounters:
+        with stats.stage("merge"):
+            hits = coalesce_hits(existing, hits)
 
+    with stats.stage("alerts"):
+        alerts = build_alerts(new, existing, hits, intervals)
+    stats.count("alerts", len(alerts))
     return alerts
+
+
+def find_hits_parallel(
+    new: SegmentTable,
+    existing: SegmentTable,
+    safety_distance: float = SAFETY_DISTANCE_METERS,
+    method: str = "cpa",
+    intervals: bool = False,
+    workers: int = None,
+    stats: ConflictStats = NO_STATS
+) -> Dict[str, np.ndarray]:
+    """
+    find_hits over a process pool. The fleet is cut into contiguous,
+    drone-aligned slices, so concatenating the per-slice results in
+    slice order reproduces the serial ordering exactly.
+    """
+    workers = workers or os.cpu_count() or 1
+    bounds = _drone_aligned_bounds(existing.owner, workers)
+
+    executor = _executor(workers)
+    futures = [
+        executor.submit(
+            _find_hits_counted, new, existing.take(slice(lo, hi)),
+            safety_distance, method, intervals, stats.enabled
+        )
+        for lo, hi in zip(bounds[:-1], bounds[1:])
+    ]
+
+    parts = []
+    for lo, future in zip(bounds[:-1], futures):
+        part, part_stats = future.result()
+        part["j"] = part["j"] + lo
+        parts.append(part)
+        stats.merge(part_stats)
+
+    return {key: np.concatenate([p[key] for p in parts]) for key in parts[0]}
+
+
+def find_hits(
+    new: SegmentTable,
+    existing: SegmentTable,
+    safety_distance: float = SAFETY_DISTANCE_METERS,
+    method: str = "cpa",
+    intervals: bool = False,
+    stats: ConflictStats = NO_STATS
+) -> Dict[str, np.ndarray]:
+    """
+    Run the selected kernel over every time-overlapping segment pair and
+    return the violating pairs as ordered arrays: i (new segment),
+    j (existing segment), t (ns), distance, and start/end (ns, cpa only).
+    """
+    if method not in KERNELS:
+        raise ValueError(f"Unknown method '{method}', expected one of {sorted(KERNELS)}")
+    if intervals and method != "cpa":
+        raise ValueError("intervals=True requires method='cpa'")
+
+    kernel = KERNELS[method]
+    samples_per_pair = SAMPLES_PER_OVERLAP if method == "sample" else 1
+    parts, in_window = [], []
+
+    for i, j, t_start, t_end in stats.timed("pairs", _overlapping_pairs(new, existing)):
+        with stats.stage("kernel"):
+            parts.append(run_kernel(kernel, new, existing, i, j, t_start, t_end, safety_distance))
+        stats.count("segment_pairs", len(i))
+        stats.count("samples", len(i) * samples_per_pair)
+        if stats.enabled:
+            in_window.append(np.unique(existing.owner[j]))
+
+    if stats.enabled:
+        drones = np.unique(existing.owner[existing.valid_ids()])
+        in_window = np.unique(np.concatenate(in_window)) if in_window else in_window
+        stats.count("drones_checked", len(drones))
+        stats.count("drones_pruned", len(drones) - len(in_window))
+
+    if not parts:
+        return _no_hits()
+
+    with stats.stage("merge"):
+        hits = {key: np.concatenate([p[key] for p in parts]) for key in parts[0]}
+        order = np.lexsort((hits["t"], hits["j"], hits["i"], existing.owner[hits["j"]]))
+        hits = {key: values[order] for key, values in hits.items()}
+    stats.count("hits", len(hits["t"]))
+    return hits
+
+
+def _find_hits_counted(new, existing, safety_distance, method, intervals, counted):
+    # process-pool entry point: worker stats travel back with the hits
+    stats = ConflictStats() if counted else NO_STATS
+    return find_hits(new, existing, safety_distance, method, intervals, stats), stats
+
+
+def run_kernel(kernel, new, existing, i, j, t_start, t_end, safety_distance):
+    """
+    Apply a kernel to candidate pairs; under the haversine distance model
+    its hits are re-measured on the great circle and re-thresholded.
+    """
+    hits = kernel(new, existing, i, j, t_start, t_end, safety_distance)
+    if not existing.projection.refines or len(hits["i"]) == 0:
+        return hits
+
+    dist = haversine_distance(
+        new.interpolate(hits["i"], hits["t"], meters=False),
+        existing.interpolate(hits["j"], hits["t"], meters=False),
+    )
+    keep = dist < safety_distance
+    hits = {key: values[keep] for key, values in hits.items()}
+    hits["distance"] = dist[keep]
+    return hits
+
+
+def coalesce_hits(existing: SegmentTable, hits: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Merge per-pair cpa hits into encounters. Walking each drone's hits
+    in start order, a hit joins the current encounter while its window
+    starts before the encounter's furthest end so far. Each encounter
+    keeps its closest approach (t, distance, i, j) and spans the union
+    of its windows.
+    """
+    if len(hits["t"]) == 0:
+        return hits
+
+    owner = existing.owner[hits["j"]]
+    order = np.lexsort((hits["start"], owner))
+    hits = {key: values[order] for key, values in hits.items()}
+    owner = owner[order]
+
+    # furthest end reached so far within each drone's run of hits
+    reach = pd.Series(hits["end"]).groupby(owner).cummax().to_numpy()
+    opens = np.r_[True, (owner[1:] != owner[:-1]) | (hits["start"][1:] > reach[:-1])]
+    first = np.flatnonzero(opens)
+    encounter = np.cumsum(opens) - 1
+
+    closest = np.lexsort((hits["distance"], encounter))
+    closest = closest[np.r_[True, encounter[closest][1:] != encounter[closest][:-1]]]
+
+    merged = {key: values[closest] for key, values in hits.items()}
+    merged["start"] = np.minimum.reduceat(hits["start"], first)
+    merged["end"] = np.maximum.reduceat(hits["end"], first)
+    return merged
+
+
+def build_alerts(
+    new: SegmentTable,
+    existing: SegmentTable,
+    hits: Dict[str, np.ndarray],
+    intervals: bool = False
+) -> List[Dict]:
+    """
+    Turn kernel hits into alert dicts positioned on the new path.
+    """
+    if len(hits["t"]) == 0:
+        return []
+
+    drone_ids = existing.drone_ids[existing.owner[hits["j"]]]
+    pos = new.interpolate(hits["i"], hits["t"], meters=False)
+    times = _timestamps(hits["t"])
+
+    alerts = [
+        {
+            "drone_id": drone_id,
+            "time": time,
+            "lat": float(p[0]),
+            "lon": float(p[1]),
+            "alt": float(p[2]),
+            "distance": float(d),
+        }
+        for drone_id, time, p, d in zip(
+            drone_ids, times, pos.tolist(), hits["distance"].tolist()
+        )
+    ]
+
+    if intervals:
+        starts = _timestamps(hits["start"])
+        ends = _timestamps(hits["end"])
+        for alert, start, end in zip(alerts, starts, ends):
+            alert["start"] = start
+            alert["end"] = end
+
+    return alerts
+
+
+def _timestamps(ns: np.ndarray) -> pd.DatetimeIndex:
+    return pd.DatetimeIndex(ns.view("datetime64[ns]"))
+
+
+def _overlapping_pairs(new: SegmentTable, existing: SegmentTable, first_chunk: int = MAX_PAIRS_PER_CHUNK):
+    """
+    Yield (i, j, t_start, t_end) arrays for every pair of new segment i
+    and existing segment j whose time windows overlap, in chunks.
+
+    Chunks cover about ``first_chunk`` pairs at first and grow 4x up to
+    MAX_PAIRS_PER_CHUNK, so a caller that stops early has not paid for
+    the pairs it never looked at.
+    """
+    if len(new) == 0 or len(existing) == 0:
+        return
+
+    lo, pairs = 0, first_chunk
+    while lo < len(existing):
+        hi = min(lo + max(1, pairs // len(new)), len(existing))
+
+        t_start = np.maximum(new.t0[:, None], existing.t0[None, lo:hi])
+        t_end = np.minimum(new.t1[:, None], existing.t1[None, lo:hi])
+
+        overlap = t_start < t_end
+        if existing.valid is not None:
+            overlap &= existing.valid[None, lo:hi]
+
+        i, j = np.nonzero(overlap)
+        if len(i):
+            yield i, j + lo, t_start[i, j], t_end[i, j]
+        lo, pairs = hi, min(pairs * 4, MAX_PAIRS_PER_CHUNK)
+
+
+def _closest_pairs_first(new: SegmentTable, existing: SegmentTable, safety_distance: float):
+    """
+    Yield (i, j, t_start, t_end) batches of the time-overlapping pairs
+    whose segment bounding boxes come within ``safety_distance``.
+
+    Pairs are generated lazily in chunks of growing size (see
+    _overlapping_pairs); each chunk's pairs are yielded nearest first,
+    in batches of growing size, before the next chunk is built.
+    """
+    for i, j, t_start, t_end in _overlapping_pairs(new, existing, FIRST_CONFLICT_BATCH):
+        gap = _box_gap(new, existing, i, j)
+        near = np.flatnonzero(gap < safety_distance)
+        order = near[np.argsort(gap[near], kind="stable")]
+
+        lo, size = 0, FIRST_CONFLICT_BATCH
+        while lo < len(order):
+            batch = order[lo:lo + size]
+            yield i[batch], j[batch], t_start[batch], t_end[batch]
+            lo, size = lo + size, size * 4
+
+
+def _box_gap(new: SegmentTable, existing: SegmentTable, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+    """
+    Distance between the bounding boxes of new segment i and existing
+    segment j: a lower bound on their separation.
+    """
+    gap = np.maximum(
+        np.minimum(existing.xyz0[j], existing.xyz1[j]) - np.maximum(new.xyz0[i], new.xyz1[i]),
+        np.minimum(new.xyz0[i], new.xyz1[i]) - np.maximum(existing.xyz0[j], existing.xyz1[j]),
+    )
+    return np.sqrt((np.maximum(gap, 0) ** 2).sum(axis=1))
+
+
+def _sample_pairs(new, existing, i, j, t_start, t_end, safety_distance):
+    """
+    Probe each overlapping pair at evenly spaced times (as
+    ``pd.date_range(t_start, t_end, periods=4)`` would) and keep the
+    samples closer than ``safety_distance``.
+    """
+    ts = np.linspace(
+        0, t_end - t_start, SAMPLES_PER_OVERLAP, dtype=np.int64, axis=1
+    ) + t_start[:, None]
+
+    pn = new.interpolate(i, ts)
+    po = existing.interpolate(j, ts)
+    dist = np.sqrt(((pn - po) ** 2).sum(axis=-1))
+
+    p, k = np.nonzero(dist < safety_distance)
+    return {"i": i[p], "j": j[p], "t": ts[p, k], "distance": dist[p, k]}
+
+
+def _cpa_pairs(new, existing, i, j, t_start, t_end, safety_distance):
+    """
+    Closest point of approach of two linear motions over their shared
+    window: minimise |r + v*s| for s in [0, T], where r is the relative
+    position at t_start and v the relative velocity.
+    """
+    rel = new.interpolate(i, t_start) - existing.interpolate(j, t_start)
+    vel = new.velocity(i) - existing.velocity(j)
+    span = (t_end - t_start) / 1e9
+
+    vv = (vel ** 2).sum(axis=-1)
+    rv = (rel * vel).sum(axis=-1)
+    moving = vv > 0
+
+    s_min = np.zeros_like(span)
+    s_min[moving] = -rv[moving] / vv[moving]
+    s_min = np.clip(s_min, 0, span)
+
+    dist = np.sqrt(((rel + vel * s_min[:, None]) ** 2).sum(axis=-1))
+    p = np.flatnonzero(dist < safety_distance)
+
+    # window where |r + v*s| < safety_distance: roots of a quadratic in s
+    rr = (rel[p] ** 2).sum(axis=-1)
+    vv, rv, span = vv[p], rv[p], span[p]
+    moving = vv > 0
+
+    s_in = np.zeros_like(span)
+    s_out = span.copy()
+    root = np.sqrt(np.maximum(rv[moving] ** 2 - vv[moving] * (rr[moving] - safety_distance ** 2), 0))
+    s_in[moving] = np.maximum((-rv[moving] - root) / vv[moving], 0)
+    s_out[moving] = np.minimum((-rv[moving] + root) / vv[moving], span[moving])
+
+    # a window clamped to the shared span keeps its exact bounds: truncated
+    # to ns it would end just before the next segment's window starts, and
+    # coalesce_hits would split one encounter in two
+    t0, t1 = t_start[p], t_end[p]
+    return {
+        "i": i[p],
+        "j": j[p],
+        "t": t0 + (s_min[p] * 1e9).astype(np.int64),
+        "distance": dist[p],
+        "start": np.where(s_in <= 0, t0, t0 + (s_in * 1e9).astype(np.int64)),
+        "end": np.where(s_out >= span, t1, t0 + (s_out * 1e9).astype(np.int64)),
+    }
+
+
+def _drone_aligned_bounds(owner: np.ndarray, parts: int) -> List[int]:
+    """
+    Split points for ``parts`` roughly equal slices of a segment table,
+    moved back so no drone straddles two slices.
+    """
+    cuts = np.linspace(0, len(owner), parts + 1).astype(np.int64)[1:-1]
+    return _align_to_drones(owner, cuts)
+
+
+def _align_to_drones(owner: np.ndarray, cuts: np.ndarray) -> List[int]:
+    # move each cut back to the first segment of the drone it falls in
+    cuts = np.searchsorted(owner, owner[cuts], side="left")
+    return [0] + sorted(set(cuts.tolist()) - {0}) + [len(owner)]
+
+
+def _executor(workers: int) -> ProcessPoolExecutor:
+    # pools are reused across calls; spawning workers costs far more
+    # than a typical check
+    if workers not in _executors:
+        _executors[workers] = ProcessPoolExecutor(max_workers=workers)
+    return _executors[workers]
+
+
+def _no_hits() -> Dict[str, np.ndarray]:
+    empty_i = np.empty(0, dtype=np.int64)
+    return {
+        "i": empty_i,
+        "j": empty_i,
+        "t": empty_i,
+        "distance": np.empty(0),
+        "start": empty_i,
+        "end": empty_i,
+    }
+
+
+KERNELS = {
+    "cpa": _cpa_pairs,
+    "sample": _sample_pairs,
+}
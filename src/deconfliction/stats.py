@@ -0,0 +1,130 @@
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterable, Iterator
+
+# Counters recorded by the conflict pipeline, in report order
+COUNTERS = (
+    "checks",              # detect_conflicts / conflicts_between calls
+    "candidate_segments",  # fleet segments left after index pruning
+    "drones_checked",      # drones owning a candidate segment
+    "drones_pruned",       # ... of which none overlaps the new path in time
+    "segment_pairs",       # time-overlapping segment pairs tested
+    "samples",             # distance evaluations (4 per pair sampled, 1 per CPA)
+    "hits",                # pairs / samples closer than the safety distance
+    "alerts",              # alert dictionaries emitted
+)
+
+
+class ConflictStats:
+    """
+    Opt-in counters and per-stage timings for the deconfliction pipeline.
+
+    Pass one to detect_conflicts (or detect_conflicts_batch) and read it
+    afterwards; the same object accumulates across calls. Stages:
+    prepare (segment tables / index lookup), pairs (time-overlap
+    enumeration), kernel (sampling or CPA), merge (ordering of hits) and
+    alerts (alert construction). In parallel mode the worker stages are
+    summed over workers.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.counters: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self.timings: Dict[str, float] = {}
+
+    def count(self, name: str, n: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + int(n)
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add_time(name, time.perf_counter() - start)
+
+    def timed(self, name: str, iterable: Iterable) -> Iterator:
+        """
+        Iterate ``iterable``, charging the time spent producing each item
+        to stage ``name``.
+        """
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self._add_time(name, time.perf_counter() - start)
+                return
+            self._add_time(name, time.perf_counter() - start)
+            yield item
+
+    def merge(self, other: "ConflictStats"):
+        for name, n in other.counters.items():
+            self.count(name, n)
+        for name, seconds in other.timings.items():
+            self._add_time(name, seconds)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(self.timings.values())
+
+    def as_dict(self) -> Dict:
+        return {
+            "counters": dict(self.counters),
+            "timings": dict(self.timings),
+            "total_seconds": self.total_seconds,
+        }
+
+    def summary(self) -> str:
+        """
+        One-line timing summary for logs.
+        """
+        stages = " · ".join(f"{name} {seconds * 1e3:.1f}" for name, seconds in self.timings.items())
+        c = self.counters
+        return (
+            f"⏱ {self.total_seconds * 1e3:.1f} ms ({stages} ms) │ "
+            f"{c['segment_pairs']} pairs, {c['samples']} samples, {c['alerts']} alerts, "
+            f"{c['drones_pruned']}/{c['drones_checked']} drones pruned"
+        )
+
+    def to_prometheus(self, prefix: str = "deconfliction") -> str:
+        """
+        Render the stats in the Prometheus text exposition format.
+        """
+        lines = []
+        for name, n in self.counters.items():
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {n}")
+
+        lines.append(f"# TYPE {prefix}_stage_seconds_total counter")
+        for name, seconds in self.timings.items():
+            lines.append(f'{prefix}_stage_seconds_total{{stage="{name}"}} {seconds:.9f}')
+        return "\n".join(lines) + "\n"
+
+    def _add_time(self, name: str, seconds: float):
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+
+class _NoStats(ConflictStats):
+    """
+    Stand-in used when instrumentation is off: every hook is a no-op.
+    """
+
+    enabled = False
+
+    def count(self, name: str, n: int = 1):
+        pass
+
+    def stage(self, name: str):
+        return nullcontext()
+
+    def timed(self, name: str, iterable: Iterable) -> Iterable:
+        return iterable
+
+    def merge(self, other: ConflictStats):
+        pass
+
+
+NO_STATS = _NoStats()
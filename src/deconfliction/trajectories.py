@@ -0,0 +1,208 @@
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Iterator
+
+from src.deconfliction.projection import DEFAULT_PROJECTION, LocalProjection
+from src.deconfliction.segments import SegmentTable, timestamps_ns
+
+FLEET_SUFFIX = ".fleet"
+FLEET_VERSION = 1
+
+# arrays stored in a fleet file, one .npy each
+_FLEET_ARRAYS = ("offsets", "t", "geo", "xyz", "owner", "valid")
+
+
+class Trajectory:
+    """
+    One drone's waypoints inside a FleetArrays: views, never copies.
+    """
+
+    __slots__ = ("drone_id", "t", "geo", "xyz")
+
+    def __init__(self, drone_id, t: np.ndarray, geo: np.ndarray, xyz: np.ndarray):
+        self.drone_id = drone_id
+        self.t = t        # int64 epoch ns
+        self.geo = geo    # float64 (N, 3) lat, lon, alt
+        self.xyz = xyz    # float64 (N, 3) local meters
+
+    def __len__(self):
+        return len(self.t)
+
+    def __repr__(self):
+        return f"Trajectory({self.drone_id!r}, {len(self)} waypoints)"
+
+    @property
+    def lat(self) -> np.ndarray:
+        return self.geo[:, 0]
+
+    @property
+    def lon(self) -> np.ndarray:
+        return self.geo[:, 1]
+
+    @property
+    def alt(self) -> np.ndarray:
+        return self.geo[:, 2]
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame({
+            "drone_id": self.drone_id,
+            "lat": self.lat,
+            "lon": self.lon,
+            "alt": self.alt,
+            "timestamp": self.t.view("datetime64[ns]"),
+        })
+
+
+class FleetArrays:
+    """
+    Compact, read-mostly fleet of trajectories in contiguous arrays.
+
+    Waypoints of all drones are stored back to back, grouped by drone_id
+    order then time; drone k owns rows offsets[k]:offsets[k + 1]. Because
+    consecutive rows are consecutive waypoints, the segment arrays the
+    conflict engine needs are plain shifted views (t[:-1] / t[1:]), and
+    ``segments()`` hands them over without copying. A fleet saved with
+    ``save`` is reopened memory-mapped, so several analysis processes can
+    share one file through the page cache.
+    """
+
+    def __init__(self, drone_ids, offsets, t, geo, xyz, owner, valid,
+                 projection: LocalProjection = None, path: Path = None):
+        self.drone_ids = np.asarray(drone_ids, dtype=object)
+        self.offsets = offsets
+        self.t = t
+        self.geo = geo
+        self.xyz = xyz
+        self.owner = owner    # per row-to-row segment: drone of its first row
+        self.valid = valid    # False where the segment crosses into the next drone
+        self.projection = projection or DEFAULT_PROJECTION
+        self.path = path
+        self._codes = None
+
+    @classmethod
+    def from_paths(cls, paths: pd.DataFrame, projection: LocalProjection = None) -> "FleetArrays":
+        """
+        Pack a fleet DataFrame (drone_id, lat, lon, alt, timestamp).
+        """
+        projection = projection or DEFAULT_PROJECTION
+        codes, drone_ids = pd.factorize(paths["drone_id"], sort=True)
+        t = timestamps_ns(paths["timestamp"])
+        order = np.lexsort((t, codes))
+
+        codes = codes[order].astype(np.int64)
+        geo = np.ascontiguousarray(paths[["lat", "lon", "alt"]].to_numpy(dtype=np.float64)[order])
+
+        return cls(
+            drone_ids=drone_ids,
+            offsets=np.searchsorted(codes, np.arange(len(drone_ids) + 1)).astype(np.int64),
+            t=np.ascontiguousarray(t[order]),
+            geo=geo,
+            xyz=projection.project(geo),
+            owner=codes[:-1],
+            valid=codes[:-1] == codes[1:],
+            projection=projection,
+        )
+
+    @classmethod
+    def open(cls, path: Path, mmap: bool = True) -> "FleetArrays":
+        """
+        Open a fleet file written by ``save``, memory-mapped read-only
+        unless ``mmap`` is False.
+        """
+        path = Path(path)
+        meta_file = path / "meta.json"
+        if not meta_file.exists():
+            raise FileNotFoundError(f"{meta_file} not found")
+
+        meta = json.loads(meta_file.read_text())
+        mode = "r" if mmap else None
+        arrays = {name: np.load(path / f"{name}.npy", mmap_mode=mode) for name in _FLEET_ARRAYS}
+
+        return cls(
+            drone_ids=np.load(path / "drone_ids.npy").tolist(),
+            projection=LocalProjection(**meta["projection"]),
+            path=path.resolve() if mmap else None,
+            **arrays,
+        )
+
+    def save(self, path: Path) -> Path:
+        """
+        Write the fleet as a directory of .npy files plus meta.json.
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+
+        for name in _FLEET_ARRAYS:
+            np.save(path / f"{name}.npy", np.ascontiguousarray(getattr(self, name)))
+
+        drone_ids = np.asarray(self.drone_ids.tolist())
+        if drone_ids.dtype == object:
+            drone_ids = drone_ids.astype(str)
+        np.save(path / "drone_ids.npy", drone_ids)
+
+        meta = {
+            "version": FLEET_VERSION,
+            "drones": len(self.drone_ids),
+            "waypoints": len(self.t),
+            "projection": {
+                "lat0": self.projection.lat0,
+                "lon0": self.projection.lon0,
+                "mode": self.projection.mode,
+            },
+        }
+        (path / "meta.json").write_text(json.dumps(meta, indent=2))
+        return path
+
+    def __len__(self):
+        return len(self.drone_ids)
+
+    def __getitem__(self, k: int) -> Trajectory:
+        lo, hi = self.offsets[k], self.offsets[k + 1]
+        return Trajectory(self.drone_ids[k], self.t[lo:hi], self.geo[lo:hi], self.xyz[lo:hi])
+
+    def __iter__(self) -> Iterator[Trajectory]:
+        return (self[k] for k in range(len(self)))
+
+    def drone(self, drone_id) -> Trajectory:
+        """
+        Trajectory of ``drone_id``.
+        """
+        if self._codes is None:
+            self._codes = {d: k for k, d in enumerate(self.drone_ids)}
+        if drone_id not in self._codes:
+            raise KeyError(f"Drone {drone_id} is not in this fleet")
+        return self[self._codes[drone_id]]
+
+    def segments(self) -> SegmentTable:
+        """
+        Zero-copy SegmentTable over every row-to-row segment; rows that
+        cross between drones are masked by ``valid``.
+        """
+        return SegmentTable.from_arrays(
+            drone_ids=self.drone_ids,
+            owner=self.owner,
+            t0=self.t[:-1],
+            t1=self.t[1:],
+            geo0=self.geo[:-1],
+            geo1=self.geo[1:],
+            xyz0=self.xyz[:-1],
+            xyz1=self.xyz[1:],
+            projection=self.projection,
+            valid=self.valid,
+            source=None if self.path is None else (self.path, 0, len(self.owner)),
+        )
+
+
+# Script entry point: python -m src.deconfliction.trajectories <paths> <fleet>
+if __name__ == "__main__":
+    import sys
+    from src.data.trajectory_store import read_paths
+
+    if len(sys.argv) != 3:
+        raise SystemExit("usage: python -m src.deconfliction.trajectories <paths> <fleet>")
+
+    df = read_paths(Path(sys.argv[1]))
+    out = FleetArrays.from_paths(df, LocalProjection.centered_on(df)).save(Path(sys.argv[2]))
+    print(f"✓ Packed {df['drone_id'].nunique()} drones → {out}")
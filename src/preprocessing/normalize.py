@@ -3,16 +3,18 @@ import matplotlib.pyplot as plt
 from pathlib import Path
 from mpl_toolkits.mplot3d import Axes3D  # noqa: F401 (needed for 3D)
 
+from src.data.trajectory_store import TRAJ_SUFFIX, find_dataset, read_paths, write_paths
+
 # Resolve project paths
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 DATA_DIR = PROJECT_ROOT / "data"
 
-INPUT_EXCEL = DATA_DIR / "simulated_paths.xlsx"
-OUTPUT_EXCEL = DATA_DIR / "normalized_paths.xlsx"
+INPUT_PATH = find_dataset(DATA_DIR / "simulated_paths")
+OUTPUT_PATH = DATA_DIR / f"normalized_paths{TRAJ_SUFFIX}"
 
 # Normalize paths
-def normalize_paths(input_excel: Path, output_excel: Path):
-    df = pd.read_excel(input_excel)
+def normalize_paths(input_path: Path, output_path: Path):
+    df = read_paths(input_path, mmap=False)
 
     df["timestamp"] = pd.to_datetime(df["timestamp"])
 
@@ -29,12 +31,12 @@ def normalize_paths(input_excel: Path, output_excel: Path):
         / (t_max - t_min).total_seconds()
     )
 
-    df.to_excel(output_excel, index=False)
-    print(f"✓ Normalized dataset saved to {output_excel}")
+    write_paths(df, output_path)
+    print(f"✓ Normalized dataset saved to {output_path}")
 
 # 3D Visualization (XYZ)
-def plot_normalized_3d(normalized_excel: Path):
-    df = pd.read_excel(normalized_excel)
+def plot_normalized_3d(normalized_path: Path):
+    df = read_paths(normalized_path)
 
     fig = plt.figure(figsize=(10, 8))
     ax = fig.add_subplot(111, projection="3d")
@@ -58,8 +60,8 @@ def plot_normalized_3d(normalized_excel: Path):
 
 # Script entry point (optional)
 if __name__ == "__main__":
-    if not INPUT_EXCEL.exists():
-        raise FileNotFoundError(f"{INPUT_EXCEL} not found")
+    if not INPUT_PATH.exists():
+        raise FileNotFoundError(f"{INPUT_PATH} not found")
 
-    normalize_paths(INPUT_EXCEL, OUTPUT_EXCEL)
-    plot_normalized_3d(OUTPUT_EXCEL)
+    normalize_paths(INPUT_PATH, OUTPUT_PATH)
+    plot_normalized_3d(OUTPUT_PATH)
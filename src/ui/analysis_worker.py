@@ -0,0 +1,79 @@
+import threading
+import traceback
+import pandas as pd
+
+from PyQt5.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
+
+from src.deconfliction.spatiotemporal import iter_conflicts
+from src.deconfliction.stats import ConflictStats
+
+
+class AnalysisWorker(QObject):
+    """
+    Runs one collision analysis on a background QThread.
+
+    Every encounter is sent back with ``alert`` as soon as its drone group
+    finishes, so the GUI thread can draw markers while the scan goes on.
+    Exactly one of ``finished``, ``cancelled`` or ``failed`` follows, then
+    ``done``. Signals are delivered to the GUI thread through queued
+    connections; the worker never touches widgets itself.
+    """
+
+    alert = pyqtSignal(object)          # one encounter dict
+    progress = pyqtSignal(int, int)     # fleet segments done, total
+    finished = pyqtSignal(object, object)   # all alerts, ConflictStats
+    cancelled = pyqtSignal()
+    failed = pyqtSignal(str)
+    done = pyqtSignal()
+
+    def __init__(self, new_path: pd.DataFrame, airspace):
+        super().__init__()
+        self.new_path = new_path
+        self.airspace = airspace
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        """Ask the scan to stop before its next drone group (thread-safe)."""
+        self._cancel.set()
+
+    @pyqtSlot()
+    def run(self):
+        stats = ConflictStats()
+        alerts = []
+        try:
+            for a in iter_conflicts(
+                new_path=self.new_path,
+                existing_paths=self.airspace,
+                encounters=True,
+                cancel=self._cancel.is_set,
+                progress=self.progress.emit,
+                stats=stats
+            ):
+                alerts.append(a)
+                self.alert.emit(a)
+
+            if self._cancel.is_set():
+                self.cancelled.emit()
+            else:
+                self.finished.emit(alerts, stats)
+        except Exception:
+            self.failed.emit(traceback.format_exc())
+        finally:
+            self.done.emit()
+
+
+def start_analysis(parent: QObject, worker: AnalysisWorker) -> QThread:
+    """
+    Move ``worker`` to a new QThread owned by ``parent`` and start it. The
+    thread quits and both objects are deleted once the worker is done.
+    """
+    thread = QThread(parent)
+    worker.moveToThread(thread)
+
+    thread.started.connect(worker.run)
+    worker.done.connect(thread.quit)
+    thread.finished.connect(worker.deleteLater)
+    thread.finished.connect(thread.deleteLater)
+
+    thread.start()
+    return thread
@@ -1,10 +1,10 @@
 import sys
 import json
+import time
+import uuid
 import numpy as np
 import pandas as pd
-import time 
 from pathlib import Path
-import pandas as pd
 from datetime import datetime
 
 
@@ -12,20 +12,32 @@ from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QFileDialog, QLabel, QInputDialog, QTextEdit, QSplitter
 )
-from PyQt5.QtCore import Qt, pyqtSlot, QUrl
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QThread, QTimer, QUrl
 from PyQt5.QtWebEngineWidgets import QWebEngineView
 from PyQt5.QtWebChannel import QWebChannel
 from PyQt5.QtWidgets import QMessageBox
 
-from src.deconfliction.spatiotemporal import detect_conflicts
+from src.deconfliction.spatiotemporal import is_path_safe
+from src.deconfliction.registry import AirspaceRegistry
+from src.deconfliction.index import SegmentIndex
+from src.deconfliction.incremental import IncrementalAnalysis
+from src.deconfliction.live import LiveMonitor
+from src.deconfliction.projection import LocalProjection
 from src.deconfliction.explain import explain_conflicts
 
 from src.control.drone_controller import SimpleDroneController
+from src.control.mission import TICK_MS, MissionScheduler
+from src.ui.analysis_worker import AnalysisWorker, start_analysis
+from src.ui.monitor_worker import MonitorWorker
+from src.ui.map_payload import FleetLayers, collisions_payload, insertion_index, js_call, waypoint_payload
+from src.data.trajectory_store import find_dataset, read_paths
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 DATA_DIR = PROJECT_ROOT / "data"
 
 controller = SimpleDroneController()
+MISSION_SYSTEM_ID = 2   # drone that flies plans executed from the panel
+DEFAULT_MAP_ZOOM = 14   # zoom of the map's initial setView
 # -----------------------------------
 # JS ↔ Python bridge
 # -----------------------------------
@@ -59,28 +71,56 @@ class MapBridge(QObject):
                 return
 
             wp = {"lat":lat,"lon":lng,"alt":alt,"timestamp":t}
-            self.mw.new_path.append(wp)
+            index = self.mw.insert_new_waypoint(wp)
 
             self.mw.log.append(f"✓ Waypoint added: lat={lat:.6f}, lon={lng:.6f}, alt={alt}m, time={t}")
             self.mw.refresh_text()
             
-            # Redraw new path with updated waypoint info
-            self.mw.draw_new_path()
+            # Add just this waypoint to the drawn path
+            self.mw.draw_new_waypoint(index)
+            self.mw.revalidate_new_path()
         except Exception as e:
             self.mw.log.append(f"❌ Error adding waypoint: {str(e)}")
             self.mw.refresh_text()
 
+    @pyqtSlot(float, float, float, float, int)
+    def viewChanged(self, south, west, north, east, zoom):
+        self.mw.on_map_view((south, west, north, east), zoom)
+
 
 class MainWindow(QMainWindow):
 
+    # queued to the live monitor's thread
+    monitor_assign = pyqtSignal(int, object, object)
+    monitor_airspace = pyqtSignal(object)
+    monitor_stop = pyqtSignal()     # blocks until the monitor's timer is stopped
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Drone Path Conflict Detection Panel")
         self.resize(1600, 1000)
 
-        self.stored_paths = None  # from xlsx
-        self.new_path = []        # clicked waypoints
+        self.stored_paths = None  # from data/normalized_paths.*
+        self.fleet_layers = None  # stored_paths prepared for viewport rendering
+        self.map_bounds = None    # (south, west, north, east) last reported by the map
+        self.map_zoom = DEFAULT_MAP_ZOOM
+        self.drawn_view = None    # (zoom, visible drones) of the last drawPaths
+        self.airspace = None      # live registry of stored + approved flights
+        self.new_path = []        # clicked waypoints, kept in time order
         self.path_is_safe = None
+        self.live_check = None        # per-segment cached re-check of the new path
+        self.analysis_worker = None   # analysis in flight, if any
+        self.analysis_thread = None
+        self.pending_collisions = []  # alerts not yet drawn, flushed in batches
+        self.missions = MissionScheduler(controller, log=self.mission_log)
+        self.mission_flights = {}     # system id -> (registry, flight id) of its filed plan
+        self.monitor_worker = None    # live conformance / conflict monitor
+        self.monitor_thread = None
+        self.live_alerts = {}         # alert key -> alert, as last reported
+
+        self.mission_timer = QTimer(self)
+        self.mission_timer.setInterval(TICK_MS)
+        self.mission_timer.timeout.connect(self.on_mission_tick)
 
         self.init_ui()
         
@@ -118,7 +158,7 @@ class MainWindow(QMainWindow):
         execute_mission_btn.setMinimumHeight(40)
         left_layout.addWidget(execute_mission_btn)
 
-        load_btn = QPushButton(" Load Existing Paths (xlsx)")
+        load_btn = QPushButton(" Load Existing Paths")
         load_btn.clicked.connect(self.load_paths)
         load_btn.setMinimumHeight(40)
         
@@ -127,6 +167,17 @@ class MainWindow(QMainWindow):
         analyze_btn.setMinimumHeight(40)
         analyze_btn.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold;")
         
+        self.cancel_btn = QPushButton("⏹ Cancel Analysis")
+        self.cancel_btn.clicked.connect(self.cancel_analysis)
+        self.cancel_btn.setMinimumHeight(40)
+        self.cancel_btn.setEnabled(False)
+
+        self.live_check_btn = QPushButton("⚡ Live Check")
+        self.live_check_btn.setCheckable(True)
+        self.live_check_btn.setToolTip("Re-check the new path for conflicts after every edit")
+        self.live_check_btn.toggled.connect(self.on_live_check_toggled)
+        self.live_check_btn.setMinimumHeight(40)
+
         clear_btn = QPushButton(" Clear New Path")
         clear_btn.clicked.connect(lambda: self.reset_new())
         clear_btn.setMinimumHeight(40)
@@ -160,6 +211,8 @@ class MainWindow(QMainWindow):
 
         left_layout.addWidget(load_btn)
         left_layout.addWidget(analyze_btn)
+        left_layout.addWidget(self.cancel_btn)
+        left_layout.addWidget(self.live_check_btn)
         left_layout.addWidget(clear_btn)
         
         # Status info
@@ -231,6 +284,11 @@ class MainWindow(QMainWindow):
             font-weight: bold;
             white-space: nowrap;
           }
+          .waypoint-cluster {
+            background: rgba(51, 51, 51, 0.85);
+            color: #fff;
+            border-radius: 10px;
+          }
           .collision-popup {
             background: rgba(255, 255, 0, 0.95);
             border: 2px solid #ff0000;
@@ -252,98 +310,182 @@ class MainWindow(QMainWindow):
          { attribution:'© OpenStreetMap contributors'}
         ).addTo(map);
 
+        var bridge = null;
         var channel = new QWebChannel(qt.webChannelTransport,function(chan){
             bridge = chan.objects.bridge;
+            reportView();
         });
 
-        var existingWaypointMarkers = [];  // For existing drone paths
-        var newPathMarkers = [];           // For new path being created
-        var pathLayers = [];               // For existing drone paths
+        var newPathPoints = [];            // {marker, label, idx} per new-path waypoint, in time order
         var newPathPolyline = null;        // For new path polyline
-        var collisionMarkers = [];
+
+        // Existing paths and collisions are drawn in bulk: one canvas
+        // renderer instead of an SVG / DOM node per marker, one layer
+        // group per kind so a redraw clears them in one call
+        var canvasRenderer = L.canvas({padding: 0.5});
+        var pathGroup = L.layerGroup().addTo(map);
+        var labelGroup = L.layerGroup().addTo(map);
+        var collisionGroup = L.layerGroup().addTo(map);
 
         map.on('click',function(e){
             bridge.addWaypoint(e.latlng.lat, e.latlng.lng);
         });
 
-        function drawPath(path, color, droneId, isNew=false){
-            var latlngs = path.map(p=>[p.lat,p.lon]);
-            var polyline = L.polyline(latlngs,{
-                color: color,
-                weight: isNew ? 4 : 3,
-                opacity: isNew ? 0.9 : 0.7,
-                dashArray: isNew ? '10, 5' : null
+        function newPathLabel(idx){
+            return L.divIcon({
+                className: 'waypoint-label',
+                html: `N${idx + 1}`,
+                iconSize: [30, 20],
+                iconAnchor: [15, -10]
+            });
+        }
+
+        function insertNewWaypoint(index, wp){
+            // wp: {lat, lon, alt, time}, index: its place in time order.
+            // Only the new vertex is created; the polyline is patched in place
+            var latlng = L.latLng(wp.lat, wp.lon);
+            var point = {idx: index};
+
+            point.marker = L.circleMarker(latlng, {
+                radius: 7,
+                color: 'red',
+                fillColor: 'red',
+                fillOpacity: 0.8,
+                weight: 2
+            }).bindTooltip(() =>
+                `<b>New Path - WP${point.idx + 1}</b><br>` +
+                `Lat: ${wp.lat.toFixed(6)}<br>` +
+                `Lon: ${wp.lon.toFixed(6)}<br>` +
+                `Alt: ${wp.alt.toFixed(1)}m<br>` +
+                `Time: ${wp.time}`, {
+                direction: 'top',
+                offset: [0, -5]
             }).addTo(map);
-            
-            if (!isNew) {
-                polyline.bindTooltip(`Drone: ${droneId}`, {permanent: false, direction: 'top'});
+
+            point.label = L.marker(latlng, {
+                icon: newPathLabel(index),
+                interactive: false
+            }).addTo(map);
+
+            newPathPoints.splice(index, 0, point);
+
+            // waypoints timed after it move one place up
+            for (var k = index + 1; k < newPathPoints.length; k++){
+                newPathPoints[k].idx = k;
+                newPathPoints[k].label.setIcon(newPathLabel(k));
             }
-            
-            if (isNew) {
-                newPathPolyline = polyline;
+
+            if (!newPathPolyline){
+                newPathPolyline = L.polyline([latlng], {
+                    color: 'red',
+                    weight: 4,
+                    opacity: 0.9,
+                    dashArray: '10, 5'
+                }).addTo(map);
+            } else if (index === newPathPoints.length - 1){
+                newPathPolyline.addLatLng(latlng);
             } else {
-                pathLayers.push(polyline);
+                var latlngs = newPathPolyline.getLatLngs();
+                latlngs.splice(index, 0, latlng);
+                newPathPolyline.setLatLngs(latlngs);
             }
+        }
 
-            // Add waypoint markers with detailed tooltips
-            path.forEach((wp, idx) => {
-                var markerColor = isNew ? 'red' : color;
-                var marker = L.circleMarker([wp.lat, wp.lon], {
-                    radius: isNew ? 7 : 5,
-                    color: markerColor,
-                    fillColor: markerColor,
-                    fillOpacity: 0.8,
-                    weight: 2
-                }).addTo(map);
+        function drawNewPath(path){
+            // full redraw, for batches (text input)
+            clearNewPathWaypoints();
+            path.forEach((wp, k) => insertNewWaypoint(k, wp));
+        }
 
-                // Create detailed tooltip
-                var tooltipContent = isNew ? 
-                    `<b>New Path - WP${idx + 1}</b><br>` :
-                    `<b>${droneId} - WP${idx + 1}</b><br>`;
-                
-                tooltipContent += `Lat: ${wp.lat.toFixed(6)}<br>`;
-                tooltipContent += `Lon: ${wp.lon.toFixed(6)}<br>`;
-                tooltipContent += `Alt: ${wp.alt.toFixed(1)}m<br>`;
-                tooltipContent += `Time: ${wp.time}`;
-
-                marker.bindTooltip(tooltipContent, {
-                    permanent: false,
-                    direction: 'top',
-                    offset: [0, -5]
-                });
+        function formatTime(seconds){
+            // epoch seconds of a naive timestamp -> "YYYY-MM-DD HH:MM:SS"
+            return new Date(seconds * 1000).toISOString().slice(0, 19).replace('T', ' ');
+        }
 
-                // Add permanent label for waypoint number
-                var labelIcon = L.divIcon({
-                    className: 'waypoint-label',
-                    html: isNew ? `N${idx + 1}` : `${idx + 1}`,
-                    iconSize: [30, 20],
-                    iconAnchor: [15, -10]
-                });
-                
-                var label = L.marker([wp.lat, wp.lon], {
-                    icon: labelIcon,
-                    interactive: false
-                }).addTo(map);
+        function waypointTooltip(p, droneId, k){
+            // built only when the tooltip opens
+            return function(){
+                return `<b>${droneId} - WP${p.wp[k]}</b><br>` +
+                    `Lat: ${p.lat[k].toFixed(6)}<br>` +
+                    `Lon: ${p.lon[k].toFixed(6)}<br>` +
+                    `Alt: ${p.alt[k].toFixed(1)}m<br>` +
+                    `Time: ${formatTime(p.t[k])}`;
+            };
+        }
 
-                // Store markers in appropriate array
-                if (isNew) {
-                    newPathMarkers.push(marker);
-                    newPathMarkers.push(label);
-                } else {
-                    existingWaypointMarkers.push(marker);
-                    existingWaypointMarkers.push(label);
+        function drawPaths(p){
+            // p: columnar payload, drone d owns rows p.offsets[d]..p.offsets[d+1]
+            // (already culled to the view and simplified for the zoom level)
+            pathGroup.clearLayers();
+            labelGroup.clearLayers();
+
+            for (var d = 0; d < p.drones.length; d++){
+                var lo = p.offsets[d], hi = p.offsets[d + 1];
+                var color = p.colors[d], droneId = p.drones[d];
+                var latlngs = [];
+                for (var k = lo; k < hi; k++) latlngs.push([p.lat[k], p.lon[k]]);
+
+                L.polyline(latlngs, {
+                    renderer: canvasRenderer, color: color, weight: 3, opacity: 0.7
+                }).bindTooltip(`Drone: ${droneId}`, {direction: 'top'}).addTo(pathGroup);
+
+                for (var k = lo; k < hi; k++){
+                    L.circleMarker(latlngs[k - lo], {
+                        renderer: canvasRenderer,
+                        radius: 5,
+                        color: color,
+                        fillColor: color,
+                        fillOpacity: 0.8,
+                        weight: 2
+                    }).bindTooltip(waypointTooltip(p, droneId, k), {
+                        direction: 'top', offset: [0, -5]
+                    }).addTo(pathGroup);
                 }
-            });
+            }
+
+            // one label per screen cell: a waypoint number, or a cluster size
+            var labels = p.labels;
+            for (var k = 0; k < labels.text.length; k++){
+                L.marker([labels.lat[k], labels.lon[k]], {
+                    icon: L.divIcon({
+                        className: labels.count[k] > 1 ? 'waypoint-label waypoint-cluster' : 'waypoint-label',
+                        html: labels.text[k],
+                        iconSize: [30, 20],
+                        iconAnchor: [15, -10]
+                    }),
+                    interactive: false
+                }).addTo(labelGroup);
+            }
+        }
+
+        function reportView(){
+            // Python answers with drawPaths for the drones in (padded) view
+            if (!bridge) return;
+            var b = map.getBounds().pad(0.5);
+            bridge.viewChanged(b.getSouth(), b.getWest(), b.getNorth(), b.getEast(), Math.round(map.getZoom()));
+        }
+        map.on('moveend', reportView);
+
+        function markCollisions(c){
+            // c: columnar payload of alerts, one call per batch
+            for (var k = 0; k < c.lat.length; k++){
+                markCollision({
+                    lat: c.lat[k], lon: c.lon[k], alt: c.alt[k],
+                    drone_id: c.drone[k], time: c.time[k],
+                    start: c.start[k], end: c.end[k], distance: c.distance[k]
+                });
+            }
         }
 
         function markCollision(collisionData){
             var marker = L.circleMarker([collisionData.lat, collisionData.lon], {
+                renderer: canvasRenderer,
                 radius: 15,
                 color: 'red',
                 fillColor: 'yellow',
                 fillOpacity: 0.6,
                 weight: 3
-            }).addTo(map);
+            }).addTo(collisionGroup);
 
             // Create detailed collision popup
             var popupContent = `
@@ -351,6 +493,7 @@ class MainWindow(QMainWindow):
                     <b>⚠️ COLLISION RISK</b><br>
                     <b>Drone:</b> ${collisionData.drone_id}<br>
                     <b>Time:</b> ${collisionData.time}<br>
+                    <b>Window:</b> ${collisionData.start} → ${collisionData.end}<br>
                     <b>Position:</b><br>
                     &nbsp;&nbsp;Lat: ${collisionData.lat.toFixed(6)}<br>
                     &nbsp;&nbsp;Lon: ${collisionData.lon.toFixed(6)}<br>
@@ -365,13 +508,14 @@ class MainWindow(QMainWindow):
             });
             
             marker.bindTooltip('⚠️ COLLISION', {permanent: true, direction: 'top'});
-
-            collisionMarkers.push(marker);
         }
 
         function clearNewPathWaypoints(){
-            newPathMarkers.forEach(m => map.removeLayer(m));
-            newPathMarkers = [];
+            newPathPoints.forEach(p => {
+                map.removeLayer(p.marker);
+                map.removeLayer(p.label);
+            });
+            newPathPoints = [];
             if (newPathPolyline) {
                 map.removeLayer(newPathPolyline);
                 newPathPolyline = null;
@@ -379,18 +523,16 @@ class MainWindow(QMainWindow):
         }
 
         function clearPaths(){
-            pathLayers.forEach(p => map.removeLayer(p));
-            pathLayers = [];
+            pathGroup.clearLayers();
+            labelGroup.clearLayers();
         }
 
         function clearCollisions(){
-            collisionMarkers.forEach(m => map.removeLayer(m));
-            collisionMarkers = [];
+            collisionGroup.clearLayers();
         }
 
         function clearAllWaypoints(){
-            existingWaypointMarkers.forEach(m => map.removeLayer(m));
-            existingWaypointMarkers = [];
+            clearPaths();
             clearNewPathWaypoints();
         }
 
@@ -426,6 +568,11 @@ class MainWindow(QMainWindow):
                 self.refresh_text()
                 return
             
+            if MISSION_SYSTEM_ID in self.missions.active:
+                self.log.append(f"❌ Drone {MISSION_SYSTEM_ID} is already flying a mission!")
+                self.refresh_text()
+                return
+
             if self.path_is_safe==None:
                 self.log.append("❌ Cannot Execute Mission! Analysis Required !")
                 self.refresh_text()
@@ -437,54 +584,124 @@ class MainWindow(QMainWindow):
             
             # Sort waypoints by timestamp to ensure proper order
             points = sorted(self.new_path, key=lambda x: x['timestamp'])
+
+            # The airspace may have changed since the analysis; re-check,
+            # stopping at the first violation
+            if self.airspace is not None and not is_path_safe(pd.DataFrame(points), self.airspace):
+                self.path_is_safe = False
+                self.log.append("❌ Cannot Execute Mission! Airspace changed since analysis, re-run Analyze.")
+                self.refresh_text()
+                return
+
+            # Approved plan: later plans must deconflict against it
+            if self.airspace is not None:
+                mission_id = f"mission_{uuid.uuid4().hex[:12]}"
+                self.airspace.add_flight(mission_id, pd.DataFrame(points))
+                self.mission_flights[MISSION_SYSTEM_ID] = (self.airspace, mission_id)
+                self.log.append(f"✓ Flight plan registered in airspace as {mission_id}")
             
             self.log.append(" Starting mission execution...")
             self.log.append(f"Number of waypoints: {len(points)}")
             self.refresh_text()
-            
-            # 1. Set drone to GUIDED mode
-            self.log.append("Setting drone to GUIDED mode...")
-            controller.set_drone_mode(2, "GUIDED")
-            time.sleep(1)
-            
-            # 2. Arm the drone
-            self.log.append("Arming drone...")
-            controller.arm_drone(2)
-            time.sleep(2)
-            
-            # 3. Takeoff to first waypoint altitude or 10m
-            takeoff_alt = points[0]['alt'] if points else 10
-            self.log.append(f"Taking off to {takeoff_alt}m...")
-            controller.takeoff_drone(2, takeoff_alt)
-            time.sleep(5)  # Wait for takeoff to complete
-            
-            # 4. Fly to each waypoint
-            for i, waypoint in enumerate(points, 1):
-                lat = waypoint['lat']
-                lon = waypoint['lon']
-                alt = waypoint['alt']
-                
-                self.log.append(f"Flying to waypoint {i}/{len(points)}:")
-                self.log.append(f"  Latitude: {lat:.6f}")
-                self.log.append(f"  Longitude: {lon:.6f}")
-                self.log.append(f"  Altitude: {alt}m")
-                self.refresh_text()
-                
-                # Fly to the waypoint
-                controller.goto_location(2, lat, lon, alt)
-                
-                # Optional: Wait a bit between waypoints (adjust as needed)
-                if i < len(points):
-                    time.sleep(20)
-            
-            self.log.append("✅ Mission completed successfully!")
-            self.refresh_text()
+
+            # Commands follow telemetry from here on: on_mission_tick advances
+            # the mission without blocking the GUI thread
+            if not controller.monitoring_active:
+                controller.start_attitude_monitoring()
+            self.missions.add(MISSION_SYSTEM_ID, points)
+            self.mission_timer.start()
+
+            if self.airspace is not None:
+                self.start_live_monitor()
+                self.monitor_airspace.emit(SegmentIndex(self.airspace.to_table()))
+                self.monitor_assign.emit(MISSION_SYSTEM_ID, mission_id, pd.DataFrame(points))
             
         except Exception as e:
             error_msg = f"❌ Mission execution failed: {str(e)}"
             self.log.append(error_msg)
             print(error_msg)
+            # a mission that did not get going must not keep its plan filed
+            if MISSION_SYSTEM_ID in self.missions.active:
+                self.missions.abort(MISSION_SYSTEM_ID)
+            self.release_mission_flight(MISSION_SYSTEM_ID)
+            self.refresh_text()
+
+    def on_mission_tick(self):
+        self.missions.tick()
+        # done, failed or aborted: the plan no longer reserves airspace
+        for system_id in [s for s in self.mission_flights if s not in self.missions.active]:
+            self.release_mission_flight(system_id)
+        if self.missions.finished:
+            self.mission_timer.stop()
+
+    def release_mission_flight(self, system_id):
+        """
+        Withdraw the plan filed for ``system_id``'s mission from the airspace.
+        """
+        if system_id not in self.mission_flights:
+            return
+
+        registry, mission_id = self.mission_flights.pop(system_id)
+        registry.remove_flight(mission_id)
+        self.log.append(f"✓ Flight plan {mission_id} removed from airspace")
+        if registry is self.airspace and self.monitor_worker is not None:
+            self.monitor_airspace.emit(SegmentIndex(self.airspace.to_table()))
+        self.refresh_text()
+
+    def start_live_monitor(self):
+        """
+        Start checking airborne drones against each other, the airspace
+        and their filed plans on a background thread (once).
+        """
+        if self.monitor_worker is not None:
+            return
+
+        # the worker gets its own copy of the airspace: the registry keeps
+        # changing on this thread
+        worker = MonitorWorker(LiveMonitor(SegmentIndex(self.airspace.to_table())), controller.telemetry)
+        worker.report.connect(self.on_live_report)
+        self.monitor_assign.connect(worker.assign)
+        self.monitor_airspace.connect(worker.set_airspace)
+        # blocking: the timer must be stopped on its own thread before it quits
+        self.monitor_stop.connect(worker.stop, Qt.BlockingQueuedConnection)
+
+        self.monitor_worker = worker
+        self.monitor_thread = start_analysis(self, worker)
+        self.log.append("📡 Live conflict monitor started")
+        self.refresh_text()
+
+    @pyqtSlot(object)
+    def on_live_report(self, report):
+        # log alerts when they appear and when they clear, not every tick
+        current = {}
+        for a in report["conflicts"]:
+            current[("conflict", a["drone_id"], a["other_drone_id"])] = a
+        for a in report["airspace"]:
+            current[("airspace", a["system_id"], a["drone_id"])] = a
+        for a in report["deviations"]:
+            current[("deviation", a["system_id"])] = a
+
+        for key, a in current.items():
+            if key in self.live_alerts:
+                continue
+            at = a["time"].strftime("%H:%M:%S")
+            if key[0] == "conflict":
+                self.log.append(f"⚠ Live conflict: drone {key[1]} ↔ drone {key[2]}, {a['distance']:.1f} m at {at}")
+            elif key[0] == "airspace":
+                self.log.append(f"⚠ Drone {key[1]} heading into {key[2]}'s plan, {a['distance']:.1f} m at {at}")
+            else:
+                self.log.append(f"⚠ Drone {key[1]} is {a['distance']:.0f} m off its plan {a['drone_id']}")
+
+        for key in self.live_alerts.keys() - current.keys():
+            self.log.append(f"✓ Cleared: {key[0]} {' / '.join(map(str, key[1:]))}")
+
+        if current.keys() != self.live_alerts.keys():
             self.refresh_text()
+        self.live_alerts = current
+
+    def mission_log(self, message):
+        self.log.append(message)
+        self.refresh_text()
 
     def refresh_text(self):
         self.messages.setText("\n".join(self.log))
@@ -494,17 +711,27 @@ class MainWindow(QMainWindow):
 
     def load_paths(self):
         try:
-            default_path = DATA_DIR / "normalized_paths.xlsx"
+            default_path = find_dataset(DATA_DIR / "normalized_paths")
 
             if not default_path.exists():
-                QMessageBox.warning(self, "File Missing", "normalized_paths.xlsx not found in data/")
+                QMessageBox.warning(self, "File Missing", "normalized_paths not found in data/")
                 return
 
-            df = pd.read_excel(default_path)
+            df = read_paths(default_path)
             self.stored_paths = df
-            self.log.append("✓ Loaded normalized_paths.xlsx from data/")
+            self.fleet_layers = FleetLayers(df)
+            self.drawn_view = None
+            self.airspace = AirspaceRegistry.from_paths(
+                df, projection=LocalProjection.centered_on(df)
+            )
+            # built on the registry just loaded, never the previous one
+            self.live_check = IncrementalAnalysis(self.airspace)
+            self.log.append(f"✓ Loaded {default_path.name} from data/")
             self.refresh_text()
 
+            if self.monitor_worker is not None:
+                self.monitor_airspace.emit(SegmentIndex(self.airspace.to_table()))
+
             self.draw_existing_paths()
 
         except Exception as e:
@@ -512,61 +739,121 @@ class MainWindow(QMainWindow):
             self.refresh_text()
 
     def draw_existing_paths(self):
-        if self.stored_paths is None: 
+        if self.fleet_layers is None:
             return
 
         try:
-            grouped = self.stored_paths.groupby("drone_id")
-
-            for i, (drone_id, df) in enumerate(grouped):
-                df = df.sort_values("timestamp")
-                path = []
-                for _, row in df.iterrows():
-                    path.append({
-                        "lat": row["lat"],
-                        "lon": row["lon"],
-                        "alt": row["alt"],
-                        "time": row["timestamp"].strftime("%Y-%m-%d %H:%M:%S")
-                    })
-                
-                js = f"drawPath({json.dumps(path)}, '{self.color(i)}', '{drone_id}', false);"
-                self.map_view.page().runJavaScript(js)
-            
-            self.log.append(f"✓ Drew {len(grouped)} existing drone paths with waypoint labels")
+            payload = self.redraw_fleet()
+            self.log.append(
+                f"✓ Drew {len(self.fleet_layers)} existing drone paths "
+                f"({len(payload['drones'])} in view, {len(payload['lat'])} waypoints at zoom {self.map_zoom})"
+            )
             self.refresh_text()
         except Exception as e:
             self.log.append(f"❌ Error drawing paths: {str(e)}")
             self.refresh_text()
 
+    def redraw_fleet(self, force: bool = True):
+        """
+        Send drawPaths for the stored drones in the current map view,
+        simplified for its zoom level. Returns the payload, or None when
+        the view shows the same drones at the same zoom as last time.
+        """
+        if self.map_bounds is None:
+            drones = None   # no view reported yet: the whole fleet
+        else:
+            drones = self.fleet_layers.visible(*self.map_bounds)
+
+        view = (self.map_zoom, None if drones is None else drones.tobytes())
+        if not force and view == self.drawn_view:
+            return None
+
+        payload = self.fleet_layers.payload(drones, self.map_zoom)
+        self.map_view.page().runJavaScript(js_call("drawPaths", payload))
+        self.drawn_view = view
+        return payload
+
+    def on_map_view(self, bounds, zoom):
+        self.map_bounds = bounds
+        self.map_zoom = zoom
+        if self.fleet_layers is None:
+            return
+        try:
+            self.redraw_fleet(force=False)
+        except Exception as e:
+            self.log.append(f"❌ Error drawing paths: {str(e)}")
+            self.refresh_text()
+
     def draw_new_path(self):
         """Draw the new path with all its waypoints"""
         if not self.new_path:
             return
         
         try:
-            # Clear only new path visualization, not existing drone paths
-            self.map_view.page().runJavaScript("clearNewPathWaypoints();")
-            
-            # Format new path data
-            path = []
-            for wp in sorted(self.new_path, key=lambda x: x['timestamp']):
-                path.append({
-                    "lat": wp["lat"],
-                    "lon": wp["lon"],
-                    "alt": wp["alt"],
-                    "time": wp["timestamp"].strftime("%Y-%m-%d %H:%M:%S")
-                })
-            
-            js = f"drawPath({json.dumps(path)}, 'red', 'New Path', true);"
-            self.map_view.page().runJavaScript(js)
+            # Replaces only the new path visualization, not existing drone paths
+            path = [waypoint_payload(wp) for wp in self.new_path]
+            self.map_view.page().runJavaScript(js_call("drawNewPath", path))
             
         except Exception as e:
             self.log.append(f"❌ Error drawing new path: {str(e)}")
             self.refresh_text()
 
-    def color(self, i):
-        colors = ["blue","green","purple","orange","brown","pink","cyan","magenta"]
-        return colors[i % len(colors)]
+    def on_live_check_toggled(self, checked):
+        self.log.append("⚡ Live check on" if checked else "⚡ Live check off")
+        self.refresh_text()
+        self.revalidate_new_path()
+
+    def revalidate_new_path(self):
+        """
+        With live check on, re-check the new path after an edit. Results
+        are cached per segment (IncrementalAnalysis), so only the segments
+        around the changed waypoint are checked against the airspace.
+        """
+        if not self.live_check_btn.isChecked() or self.live_check is None or len(self.new_path) < 2:
+            return
+
+        try:
+            # the edit makes an analysis in flight obsolete; drop its late signals
+            if self.analysis_worker is not None:
+                self.analysis_worker.cancel()
+                self.pending_collisions = []
+                self._analysis_ended()
+                self.log.append("⏹ Analysis superseded by live check")
+
+            start = time.perf_counter()
+            alerts = self.live_check.check(pd.DataFrame(self.new_path))
+            elapsed = time.perf_counter() - start
+
+            self.map_view.page().runJavaScript("clearCollisions();")
+            if alerts:
+                self.map_view.page().runJavaScript(js_call("markCollisions", collisions_payload(alerts)))
+
+            self.path_is_safe = len(alerts) == 0
+            segments = self.live_check.checked + self.live_check.reused
+            self.log.append(
+                f"{'⚠️' if alerts else '✓'} Live check: {len(alerts)} conflict(s), "
+                f"{self.live_check.checked}/{segments} segments re-checked in {elapsed * 1e3:.1f} ms"
+            )
+            self.refresh_text()
+        except Exception as e:
+            self.log.append(f"❌ Error during live check: {str(e)}")
+            self.refresh_text()
+
+    def insert_new_waypoint(self, wp) -> int:
+        """Insert wp into new_path at its place in time order; returns that index"""
+        index = insertion_index(self.new_path, wp["timestamp"])
+        self.new_path.insert(index, wp)
+        return index
+
+    def draw_new_waypoint(self, index):
+        """Add new_path[index] to the drawn new path without redrawing the rest"""
+        try:
+            self.map_view.page().runJavaScript(
+                js_call("insertNewWaypoint", index, waypoint_payload(self.new_path[index]))
+            )
+        except Exception as e:
+            self.log.append(f"❌ Error drawing new path: {str(e)}")
+            self.refresh_text()
 
     def reset_new(self):
         self.new_path = []
@@ -594,42 +881,35 @@ class MainWindow(QMainWindow):
                 self.refresh_text()
                 return
 
+            # A newer analysis supersedes the one in flight; its late
+            # signals are ignored (see _is_current)
+            if self.analysis_worker is not None:
+                self.analysis_worker.cancel()
+                self.log.append("⏹ Previous analysis superseded")
+
             # Clear previous results
             self.map_view.page().runJavaScript("clearCollisions();")
+            self.pending_collisions = []
             self.log.append("🔍 Starting collision analysis...")
             self.log.append("=" * 60)
+            self.path_is_safe = None
             self.refresh_text()
 
-            # Run centralized deconfliction
+            # Run centralized deconfliction on a worker thread
             new_df = pd.DataFrame(self.new_path).sort_values("timestamp")
 
-            alerts = detect_conflicts(
-                new_path=new_df,
-                existing_paths=self.stored_paths
-            )
+            # the worker gets its own copy of the airspace: missions keep
+            # filing and withdrawing plans on this thread while it scans
+            worker = AnalysisWorker(new_df, SegmentIndex(self.airspace.to_table()))
+            worker.alert.connect(self.on_analysis_alert)
+            worker.progress.connect(self.on_analysis_progress)
+            worker.finished.connect(self.on_analysis_finished)
+            worker.cancelled.connect(self.on_analysis_cancelled)
+            worker.failed.connect(self.on_analysis_failed)
 
-            # Visualize conflicts on map
-            for a in alerts:
-                collision_data = {
-                    "lat": a["lat"],
-                    "lon": a["lon"],
-                    "alt": a["alt"],
-                    "drone_id": a["drone_id"],
-                    "time": a["time"].strftime("%Y-%m-%d %H:%M:%S"),
-                    "distance": f"{a['distance']:.1f}"
-                }
-
-                self.map_view.page().runJavaScript(
-                    f"markCollision({json.dumps(collision_data)});"
-                )
-
-            # Explain results
-            messages = explain_conflicts(alerts)
-            for msg in messages:
-                self.log.append(msg)
-
-            self.path_is_safe = len(alerts) == 0
-            self.refresh_text()
+            self.analysis_worker = worker
+            self.analysis_thread = start_analysis(self, worker)
+            self.cancel_btn.setEnabled(True)
 
         except Exception as e:
             self.log.append(f"❌ Error during analysis: {str(e)}")
@@ -638,6 +918,79 @@ class MainWindow(QMainWindow):
             self.refresh_text()
 
 
+    def cancel_analysis(self):
+        if self.analysis_worker is not None:
+            self.analysis_worker.cancel()
+            self.cancel_btn.setEnabled(False)
+            self.log.append("⏹ Cancelling analysis...")
+            self.refresh_text()
+
+    def _is_current(self) -> bool:
+        # signals from a superseded worker arrive late; drop them
+        return self.sender() is self.analysis_worker
+
+    def _analysis_ended(self):
+        self.flush_collisions()
+        self.analysis_worker = None
+        self.analysis_thread = None
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.setText("⏹ Cancel Analysis")
+
+    @pyqtSlot(object)
+    def on_analysis_alert(self, a):
+        if not self._is_current():
+            return
+
+        # drawn in one batch per progress update instead of one call each
+        self.pending_collisions.append(a)
+
+    def flush_collisions(self):
+        if self.pending_collisions:
+            self.map_view.page().runJavaScript(
+                js_call("markCollisions", collisions_payload(self.pending_collisions))
+            )
+            self.pending_collisions = []
+
+    @pyqtSlot(int, int)
+    def on_analysis_progress(self, done, total):
+        if not self._is_current():
+            return
+        self.flush_collisions()
+        if total:
+            self.cancel_btn.setText(f"⏹ Cancel Analysis ({100 * done // total}%)")
+
+    @pyqtSlot(object, object)
+    def on_analysis_finished(self, alerts, stats):
+        if not self._is_current():
+            return
+        self._analysis_ended()
+
+        # Explain results
+        messages = explain_conflicts(alerts)
+        for msg in messages:
+            self.log.append(msg)
+        self.log.append(stats.summary())
+
+        self.path_is_safe = len(alerts) == 0
+        self.refresh_text()
+
+    @pyqtSlot()
+    def on_analysis_cancelled(self):
+        if not self._is_current():
+            return
+        self._analysis_ended()
+        self.log.append("⏹ Analysis cancelled")
+        self.refresh_text()
+
+    @pyqtSlot(str)
+    def on_analysis_failed(self, error):
+        if not self._is_current():
+            return
+        self._analysis_ended()
+        self.log.append("❌ Error during analysis:")
+        self.log.append(error)
+        self.refresh_text()
+
     def add_path_from_text(self):
             """Parse and add waypoints from text input"""
             try:
@@ -675,7 +1028,7 @@ class MainWindow(QMainWindow):
                             continue
                         
                         wp = {"lat": lat, "lon": lon, "alt": alt, "timestamp": t}
-                        self.new_path.append(wp)
+                        self.insert_new_waypoint(wp)
                         added_count += 1
                         
                     except ValueError as e:
@@ -685,6 +1038,7 @@ class MainWindow(QMainWindow):
                 if added_count > 0:
                     self.log.append(f"✓ Added {added_count} waypoint(s) from text input")
                     self.draw_new_path()
+                    self.revalidate_new_path()
                     self.text_input.clear()  # Clear the input after successful addition
                 else:
                     self.log.append("❌ No valid waypoints found in text input")
@@ -696,6 +1050,15 @@ class MainWindow(QMainWindow):
                 self.refresh_text()
 
     def closeEvent(self, event):
+        self.mission_timer.stop()
+        # stop the current analysis and any superseded one still winding down
+        if self.analysis_worker is not None:
+            self.analysis_worker.cancel()
+        if self.monitor_thread is not None and self.monitor_thread.isRunning():
+            self.monitor_stop.emit()
+        for thread in self.findChildren(QThread):
+            thread.quit()
+            thread.wait(2000)
         event.accept()
 
     
@@ -0,0 +1,232 @@
+import json
+import numpy as np
+import pandas as pd
+from typing import Dict, List
+
+PATH_COLORS = ["blue", "green", "purple", "orange", "brown", "pink", "cyan", "magenta"]
+COORD_DECIMALS = 6      # ~0.1 m, the precision the tooltips show
+TILE_PIXELS = 256       # Web Mercator world width at zoom 0
+SIMPLIFY_PIXELS = 1.0   # Douglas-Peucker tolerance, in screen pixels at the current zoom
+LABEL_CELL_PIXELS = 40  # waypoint labels sharing a screen cell this size are clustered
+
+
+def path_color(i: int) -> str:
+    return PATH_COLORS[i % len(PATH_COLORS)]
+
+
+def mercator_pixels(lat: np.ndarray, lon: np.ndarray):
+    """
+    Web Mercator (Leaflet's default CRS) pixel coordinates at zoom 0;
+    multiply by 2 ** zoom for the pixels of any other zoom level.
+    """
+    phi = np.radians(np.clip(lat, -85.05112878, 85.05112878))
+    x = (np.asarray(lon, dtype=np.float64) + 180.0) / 360.0 * TILE_PIXELS
+    y = (1.0 - np.arcsinh(np.tan(phi)) / np.pi) / 2.0 * TILE_PIXELS
+    return x, y
+
+
+def dp_significance(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Douglas-Peucker run once for every tolerance: vertex k survives
+    simplification with tolerance ``tol`` iff ``significance[k] > tol``.
+
+    A vertex's significance is its distance from the chord it split,
+    capped by the significance of the split that exposed it, so the
+    surviving set shrinks monotonically as the tolerance grows.
+    Endpoints are always kept.
+    """
+    n = len(x)
+    significance = np.zeros(n)
+    if n == 0:
+        return significance
+    significance[[0, -1]] = np.inf
+
+    stack = [(0, n - 1, np.inf)]
+    while stack:
+        lo, hi, cap = stack.pop()
+        if hi - lo < 2:
+            continue
+
+        dx, dy = x[hi] - x[lo], y[hi] - y[lo]
+        px, py = x[lo + 1:hi] - x[lo], y[lo + 1:hi] - y[lo]
+        chord = np.hypot(dx, dy)
+        if chord > 0:
+            distance = np.abs(dx * py - dy * px) / chord
+        else:
+            distance = np.hypot(px, py)
+
+        k = lo + 1 + int(np.argmax(distance))
+        significance[k] = min(float(distance[k - lo - 1]), cap)
+        stack.append((lo, k, significance[k]))
+        stack.append((k, hi, significance[k]))
+
+    return significance
+
+
+class FleetLayers:
+    """
+    Stored fleet prepared once for viewport-aware map payloads.
+
+    Waypoints are sorted by drone then time into flat columns; each drone
+    keeps its bounding box and each waypoint its Douglas-Peucker
+    significance in zoom-0 Mercator pixels. ``payload`` then only has to
+    mask rows: drones outside the view are culled, vertices below one
+    screen pixel of significance at the current zoom are dropped, and
+    labels closer than LABEL_CELL_PIXELS on screen are clustered.
+    """
+
+    def __init__(self, paths: pd.DataFrame):
+        codes, drone_ids = pd.factorize(paths["drone_id"], sort=True)
+        t = np.asarray(pd.to_datetime(paths["timestamp"]), dtype="datetime64[s]").astype(np.int64)
+        order = np.lexsort((t, codes))
+
+        self.drone_ids = [str(d) for d in drone_ids]
+        self.codes = codes[order]
+        self.offsets = np.searchsorted(self.codes, np.arange(len(drone_ids) + 1))
+        self.lat = paths["lat"].to_numpy(dtype=np.float64)[order]
+        self.lon = paths["lon"].to_numpy(dtype=np.float64)[order]
+        self.alt = paths["alt"].to_numpy(dtype=np.float64)[order]
+        self.t = t[order]
+        # 1-based waypoint number within its drone's path
+        self.number = np.arange(len(order)) - self.offsets[self.codes] + 1
+
+        self.x, self.y = mercator_pixels(self.lat, self.lon)
+        self.significance = np.concatenate([
+            dp_significance(self.x[lo:hi], self.y[lo:hi])
+            for lo, hi in zip(self.offsets[:-1], self.offsets[1:])
+        ] or [np.zeros(0)])
+
+        # per-drone bounding boxes: south, west, north, east
+        if len(order):
+            starts = self.offsets[:-1]
+            self.bounds = np.stack([
+                np.minimum.reduceat(self.lat, starts),
+                np.minimum.reduceat(self.lon, starts),
+                np.maximum.reduceat(self.lat, starts),
+                np.maximum.reduceat(self.lon, starts),
+            ], axis=1)
+        else:
+            self.bounds = np.zeros((0, 4))
+
+    def __len__(self):
+        return len(self.drone_ids)
+
+    def visible(self, south: float, west: float, north: float, east: float) -> np.ndarray:
+        """
+        Indices of the drones whose bounding box intersects the view.
+        """
+        b = self.bounds
+        hit = (b[:, 0] <= north) & (b[:, 2] >= south) & (b[:, 1] <= east) & (b[:, 3] >= west)
+        return np.flatnonzero(hit)
+
+    def payload(self, drones: np.ndarray = None, zoom: int = None) -> Dict:
+        """
+        Columnar payload for the map's ``drawPaths``: drone k's waypoints
+        are rows offsets[k]:offsets[k + 1] of lat / lon / alt / t / wp, in
+        time order. Times are epoch seconds of the naive timestamps,
+        formatted back in JS only when a tooltip opens.
+
+        ``drones`` limits the payload to those drone indices (see
+        ``visible``); with a ``zoom`` paths are simplified and labels
+        clustered for that zoom level, otherwise every waypoint is sent.
+        """
+        drones = np.arange(len(self)) if drones is None else np.asarray(drones, dtype=np.int64)
+        rows = np.isin(self.codes, drones)
+        if zoom is not None:
+            rows &= self.significance * 2.0 ** zoom > SIMPLIFY_PIXELS
+        rows = np.flatnonzero(rows)
+
+        return {
+            "drones": [self.drone_ids[d] for d in drones.tolist()],
+            # colors follow the drone's place in the whole fleet, not in the view
+            "colors": [path_color(d) for d in drones.tolist()],
+            "offsets": np.searchsorted(self.codes[rows], np.append(drones, len(self))).tolist(),
+            "lat": self.lat[rows].round(COORD_DECIMALS).tolist(),
+            "lon": self.lon[rows].round(COORD_DECIMALS).tolist(),
+            "alt": self.alt[rows].round(1).tolist(),
+            "t": self.t[rows].tolist(),
+            "wp": self.number[rows].tolist(),
+            "labels": self._labels(rows, zoom),
+        }
+
+    def _labels(self, rows: np.ndarray, zoom: int = None) -> Dict:
+        # one label per screen cell: the waypoint number when the cell holds
+        # a single waypoint, otherwise the cluster's size at its centroid
+        if zoom is None or len(rows) == 0:
+            count = np.ones(len(rows), dtype=np.int64)
+            return {
+                "lat": self.lat[rows].round(COORD_DECIMALS).tolist(),
+                "lon": self.lon[rows].round(COORD_DECIMALS).tolist(),
+                "text": [str(n) for n in self.number[rows].tolist()],
+                "count": count.tolist(),
+            }
+
+        scale = 2.0 ** zoom / LABEL_CELL_PIXELS
+        cells = np.stack([np.floor(self.x[rows] * scale), np.floor(self.y[rows] * scale)], axis=1)
+        _, cell, count = np.unique(cells, axis=0, return_inverse=True, return_counts=True)
+        cell = cell.reshape(-1)
+
+        lat = np.bincount(cell, weights=self.lat[rows]) / count
+        lon = np.bincount(cell, weights=self.lon[rows]) / count
+        number = np.bincount(cell, weights=self.number[rows]).astype(np.int64)
+        return {
+            "lat": lat.round(COORD_DECIMALS).tolist(),
+            "lon": lon.round(COORD_DECIMALS).tolist(),
+            "text": [str(n if c == 1 else c) for n, c in zip(number.tolist(), count.tolist())],
+            "count": count.tolist(),
+        }
+
+
+def collisions_payload(alerts: List[Dict]) -> Dict:
+    """
+    Columnar map payload of conflict alerts for the map's ``markCollisions``.
+    """
+    def times(key, fmt):
+        return [a[key].strftime(fmt) if key in a else "" for a in alerts]
+
+    return {
+        "lat": [round(a["lat"], COORD_DECIMALS) for a in alerts],
+        "lon": [round(a["lon"], COORD_DECIMALS) for a in alerts],
+        "alt": [round(a["alt"], 1) for a in alerts],
+        "drone": [str(a["drone_id"]) for a in alerts],
+        "time": times("time", "%Y-%m-%d %H:%M:%S"),
+        "start": times("start", "%H:%M:%S"),
+        "end": times("end", "%H:%M:%S"),
+        "distance": [f"{a['distance']:.1f}" for a in alerts],
+    }
+
+
+def waypoint_payload(wp: Dict) -> Dict:
+    """
+    One new-path waypoint (lat, lon, alt, timestamp) for the map's
+    ``insertNewWaypoint`` / ``drawNewPath``.
+    """
+    return {
+        "lat": wp["lat"],
+        "lon": wp["lon"],
+        "alt": wp["alt"],
+        "time": wp["timestamp"].strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+def insertion_index(path: List[Dict], timestamp) -> int:
+    """
+    Index at which a waypoint at ``timestamp`` keeps the time-ordered
+    ``path`` sorted; after any waypoints with the same time, as a stable
+    sort would put it.
+    """
+    lo, hi = 0, len(path)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if path[mid]["timestamp"] <= timestamp:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def js_call(function: str, *args) -> str:
+    """
+    One runJavaScript statement passing ``args`` as JSON literals.
+    """
+    return f"{function}({','.join(json.dumps(a, separators=(',', ':')) for a in args)});"
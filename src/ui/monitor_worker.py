@@ -0,0 +1,60 @@
+import pandas as pd
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
+
+from src.control.telemetry import TelemetryStore
+from src.deconfliction.index import SegmentIndex
+from src.deconfliction.live import TICK_BUDGET_SECONDS, VELOCITY_WINDOW_SECONDS, LiveMonitor
+
+MONITOR_TICK_MS = 100   # 10 Hz, the usual GLOBAL_POSITION_INT rate
+
+
+class MonitorWorker(QObject):
+    """
+    Runs a LiveMonitor on its own QThread, one tick per MONITOR_TICK_MS.
+
+    Each tick snapshots the controller's TelemetryStore (no lock needed)
+    and sends the monitor's report back with ``report``. Plans and
+    airspace changes arrive through the ``assign`` / ``set_airspace``
+    slots; connected to GUI-thread signals they run queued on this
+    thread, between ticks, so the monitor is never touched from two
+    threads.
+    """
+
+    report = pyqtSignal(object)
+    done = pyqtSignal()
+
+    def __init__(self, monitor: LiveMonitor, telemetry: TelemetryStore):
+        super().__init__()
+        self.monitor = monitor
+        self.telemetry = telemetry
+        self.timer = None
+        self.over_budget = 0    # ticks slower than TICK_BUDGET_SECONDS
+
+    @pyqtSlot()
+    def run(self):
+        # created here so the timer lives on the worker thread
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.tick)
+        self.timer.start(MONITOR_TICK_MS)
+
+    @pyqtSlot()
+    def tick(self):
+        report = self.monitor.check(self.telemetry.snapshot(VELOCITY_WINDOW_SECONDS))
+        if report["seconds"] > TICK_BUDGET_SECONDS:
+            self.over_budget += 1
+        self.report.emit(report)
+
+    @pyqtSlot(int, object, object)
+    def assign(self, system_id: int, flight_id, path: pd.DataFrame):
+        self.monitor.assign(system_id, flight_id, path)
+
+    @pyqtSlot(object)
+    def set_airspace(self, airspace: SegmentIndex):
+        self.monitor.set_airspace(airspace)
+
+    @pyqtSlot()
+    def stop(self):
+        if self.timer is not None:
+            self.timer.stop()
+        self.done.emit()
@@ -4,17 +4,19 @@ import cartopy.crs as ccrs
 import cartopy.feature as cfeature
 from pathlib import Path
 
+from src.data.trajectory_store import find_dataset, read_paths
+
 # Resolve project root and data directory
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 DATA_DIR = PROJECT_ROOT / "data"
 
-EXCEL_PATH = DATA_DIR / "normalized_paths.xlsx"
+DATA_PATH = find_dataset(DATA_DIR / "normalized_paths")
 
-if not EXCEL_PATH.exists():
-    raise FileNotFoundError(f"{EXCEL_PATH} not found")
+if not DATA_PATH.exists():
+    raise FileNotFoundError(f"{DATA_PATH} not found")
 
 # Load data
-df = pd.read_excel(EXCEL_PATH)
+df = read_paths(DATA_PATH)
 
 # group paths per drone
 groups = df.groupby("drone_id")
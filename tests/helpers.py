@@ -0,0 +1,17 @@
+import pandas as pd
+
+
+def make_df(points, drone_id):
+    """
+    Helper to convert (lat, lon, alt, time_str) → DataFrame
+    """
+    return pd.DataFrame([
+        {
+            "drone_id": drone_id,
+            "lat": p[0],
+            "lon": p[1],
+            "alt": p[2],
+            "timestamp": pd.to_datetime(p[3])
+        }
+        for p in points
+    ])
@@ -0,0 +1,118 @@
+import os
+import time
+import pandas as pd
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PyQt5.QtWidgets", exc_type=ImportError)
+
+from PyQt5.QtCore import QObject, Qt
+from PyQt5.QtWidgets import QApplication
+from src.deconfliction.index import SegmentIndex
+from src.deconfliction.spatiotemporal import detect_conflicts
+from src.ui.analysis_worker import AnalysisWorker, start_analysis
+from tests.helpers import make_df
+
+NEW_PATH = make_df([
+    (18.57209, 73.76876, 10, '2025-12-23 05:00:00'),
+    (18.56155, 73.76876, 10, '2025-12-23 05:10:00'),
+], "new_drone")
+
+FLEET = pd.concat([
+    # head-on with the new path
+    make_df([
+        (18.56155, 73.76876, 10, '2025-12-23 05:00:00'),
+        (18.57209, 73.76876, 10, '2025-12-23 05:10:00'),
+    ], "drone_A"),
+    # same path, 5m higher
+    make_df([
+        (18.56155, 73.76876, 15, '2025-12-23 05:00:00'),
+        (18.57209, 73.76876, 15, '2025-12-23 05:10:00'),
+    ], "drone_B"),
+])
+
+# the worker thread's event loop needs an application; a QApplication so
+# the window tests can share it
+APP = QApplication.instance() or QApplication([])
+
+
+def record(worker):
+    """
+    Every signal the worker emits, in order, as (name, args); connected
+    directly so no event loop is needed on the receiving side.
+    """
+    emitted = []
+    for name in ("alert", "progress", "finished", "cancelled", "failed", "done"):
+        getattr(worker, name).connect(
+            lambda *args, name=name: emitted.append((name, args)), Qt.DirectConnection
+        )
+    return emitted
+
+
+# TEST 1
+def test_worker_streams_alerts_then_finishes():
+    """
+    The worker SHOULD emit every encounter and its progress, then finished and done
+    """
+    airspace = SegmentIndex.from_paths(FLEET)
+    worker = AnalysisWorker(NEW_PATH, airspace)
+    emitted = record(worker)
+    worker.run()
+
+    names = [name for name, _ in emitted]
+    expected = detect_conflicts(NEW_PATH, airspace, encounters=True)
+    alerts = [args[0] for name, args in emitted if name == "alert"]
+    progress = [args for name, args in emitted if name == "progress"]
+
+    assert alerts == expected and len(alerts) == 2
+    assert progress[-1] == (len(airspace), len(airspace))
+    assert names[-2:] == ["finished", "done"]
+    assert emitted[-2][1][0] == expected
+    assert emitted[-2][1][1].counters["alerts"] == 2
+    assert "cancelled" not in names and "failed" not in names
+
+
+# TEST 2
+def test_cancelled_worker_reports_cancelled():
+    """
+    A worker cancelled before it runs SHOULD emit cancelled and done, no alerts
+    """
+    worker = AnalysisWorker(NEW_PATH, SegmentIndex.from_paths(FLEET))
+    emitted = record(worker)
+    worker.cancel()
+    worker.run()
+
+    assert [name for name, _ in emitted] == ["cancelled", "done"]
+
+
+# TEST 3
+def test_failing_worker_reports_traceback():
+    """
+    An error during the scan SHOULD be emitted as failed with its traceback, then done
+    """
+    worker = AnalysisWorker(NEW_PATH.drop(columns="alt"), SegmentIndex.from_paths(FLEET))
+    emitted = record(worker)
+    worker.run()
+
+    assert [name for name, _ in emitted] == ["failed", "done"]
+    assert "Traceback" in emitted[0][1][0]
+
+
+# TEST 4
+def test_start_analysis_runs_worker_on_its_own_thread():
+    """
+    start_analysis SHOULD run the worker on a new thread that quits once it is done
+    """
+    parent = QObject()
+    worker = AnalysisWorker(NEW_PATH, SegmentIndex.from_paths(FLEET))
+    emitted = record(worker)
+
+    thread = start_analysis(parent, worker)
+    # done reaches thread.quit through this thread's event queue
+    deadline = time.monotonic() + 10
+    while not thread.isFinished() and time.monotonic() < deadline:
+        APP.processEvents()
+    assert thread.wait(1000), "Expected the analysis thread to quit"
+
+    assert thread.parent() is parent
+    assert [name for name, _ in emitted][-2:] == ["finished", "done"]
@@ -0,0 +1,32 @@
+from benchmarks.bench_conflicts import _area_km2, compare, make_fleet, run_suite
+
+# TEST 1 
+def test_fleet_density_is_controlled():
+    """
+    Larger fleets SHOULD be spread over proportionally larger areas
+    """
+    small = make_fleet(10, density=20)
+    large = make_fleet(100, density=20)
+
+    assert small["drone_id"].nunique() == 10
+    assert large["drone_id"].nunique() == 100
+    assert abs(_area_km2(small) - 0.5) < 1e-6
+    assert abs(_area_km2(large) - 5.0) < 1e-6
+
+# TEST 2 
+def test_suite_report_is_machine_readable():
+    """
+    The report SHOULD carry per-case metrics and flag slowdowns against a baseline
+    """
+    report = run_suite(sizes=(10, 20), backends=("dataframe",), repeats=1, plans=2)
+
+    assert [r["drones"] for r in report["results"]] == [10, 20]
+    for result in report["results"]:
+        assert result["segment_pairs"] >= 0
+        assert result["seconds_best"] > 0
+        assert result["peak_memory_bytes"] > 0
+    assert report["scaling"]["dataframe"]["exponent"] is not None
+
+    slower = {"results": [dict(r, seconds_best=r["seconds_best"] * 2) for r in report["results"]]}
+    assert compare(report, report) == []
+    assert len(compare(slower, report, tolerance=0.5)) == 2
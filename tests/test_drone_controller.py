@@ -0,0 +1,170 @@
+import threading
+import pytest
+
+mavutil = pytest.importorskip("pymavlink.mavutil")
+
+from src.control import drone_controller
+from src.control.drone_controller import ReceiveStats, SimpleDroneController
+
+mavlink = mavutil.mavlink
+ARM = mavlink.MAV_CMD_COMPONENT_ARM_DISARM
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+def received(msg, system_id):
+    """
+    ``msg`` as the connection hands it over: packed by drone ``system_id``
+    and parsed back, so the MAVLink header is real.
+    """
+    packed = msg.pack(mavlink.MAVLink(None, srcSystem=system_id, srcComponent=1))
+    return mavlink.MAVLink(None).parse_char(bytearray(packed))
+
+
+def position(system_id, lat, lon, relative_alt_m, heading):
+    return received(mavlink.MAVLink_global_position_int_message(
+        0, int(lat * 1e7), int(lon * 1e7), 0, int(relative_alt_m * 1000), 0, 0, 0, int(heading * 100)
+    ), system_id)
+
+
+def ack(system_id, command, result):
+    return received(mavlink.MAVLink_command_ack_message(command, result), system_id)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(drone_controller, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def controller():
+    controller = SimpleDroneController()
+    controller.detected_drones = [2, 3]
+    return controller
+
+
+# TEST 1
+def test_positions_fill_each_drones_slot(clock, controller):
+    """
+    GLOBAL_POSITION_INT SHOULD replace its drone's latest slot and extend its track
+    """
+    for k in range(3):
+        clock.now = 1000.0 + k / 10
+        controller._handle_message(position(2, 18.562 + k * 1e-4, 73.769, 10 + k, 90))
+    controller._handle_message(position(3, 18.570, 73.770, 25, 180))
+
+    assert controller.get_live_drone_attitude(2) == {
+        "heading": 90.0, "latitude": 18.5622, "longitude": 73.769, "altitude": 12.0
+    }
+    assert controller.attitude_heading[2]["timestamp"] == 1000.2
+    assert controller.get_live_drone_attitude(3)["altitude"] == 25.0
+
+    track = controller.get_drone_track(2)
+    assert list(track.t) == [1000.0, 1000.1, 1000.2]
+    assert list(track.geo[:, 2]) == [10.0, 11.0, 12.0]
+    assert set(controller.get_all_live_drone_attitudes()) == {2, 3}
+
+
+# TEST 2
+def test_unknown_drones_and_empty_reads_are_ignored(clock, controller):
+    """
+    Messages from undetected drones and receive timeouts SHOULD NOT be stored
+    """
+    controller._handle_message(None)
+    controller._handle_message(position(7, 18.562, 73.769, 10, 0))
+    controller._handle_message(ack(7, ARM, mavlink.MAV_RESULT_ACCEPTED))
+
+    assert controller.attitude_heading == {}
+    assert controller.command_acks == {}
+    assert controller.get_telemetry_stats() == {}
+    assert controller.get_drone_track(7) is None
+
+
+# TEST 3
+def test_command_ack_lookup(clock, controller):
+    """
+    command_ack SHOULD return the latest result for the drone and command, only if newer than since
+    """
+    assert controller.command_ack(2, ARM) is None
+
+    clock.now = 1000.0
+    controller._handle_message(ack(2, ARM, mavlink.MAV_RESULT_TEMPORARILY_REJECTED))
+    clock.now = 1001.0
+    controller._handle_message(ack(2, ARM, mavlink.MAV_RESULT_ACCEPTED))
+
+    assert controller.command_ack(2, ARM) == mavlink.MAV_RESULT_ACCEPTED
+    assert controller.command_ack(2, ARM, since=1000.5) == mavlink.MAV_RESULT_ACCEPTED
+    assert controller.command_ack(2, ARM, since=1001.5) is None
+    assert controller.command_ack(3, ARM) is None
+    assert controller.command_ack(2, mavlink.MAV_CMD_NAV_TAKEOFF) is None
+    # acks are not positions
+    assert controller.get_live_drone_attitude(2) is None
+
+
+# TEST 4
+def test_telemetry_stats_report_rates(clock, controller):
+    """
+    get_telemetry_stats SHOULD report message count, smoothed rate, worst gap and age per drone
+    """
+    for k in range(11):
+        clock.now = 1000.0 + k / 10
+        controller._handle_message(position(2, 18.562, 73.769, 10, 0))
+    clock.now += 0.5
+    controller._handle_message(ack(2, ARM, mavlink.MAV_RESULT_ACCEPTED))
+    clock.now += 2.0
+
+    stats = controller.get_telemetry_stats()
+    assert set(stats) == {2}
+    assert stats[2]["messages"] == 12
+    assert stats[2]["max_gap"] == pytest.approx(0.5)
+    # ten 0.1 s gaps, then one 0.5 s gap smoothed in with weight RATE_SMOOTHING
+    interval = 0.1 + drone_controller.RATE_SMOOTHING * 0.4
+    assert stats[2]["rate_hz"] == pytest.approx(1 / interval)
+    assert stats[2]["age"] == pytest.approx(2.0)
+
+
+# TEST 5
+def test_receive_stats_before_a_second_message():
+    """
+    One message SHOULD report no rate yet rather than divide by zero
+    """
+    stats = ReceiveStats()
+    stats.record(5.0)
+    assert stats.as_dict(6.0) == {"messages": 1, "rate_hz": 0.0, "max_gap": 0.0, "age": 1.0}
+
+
+# TEST 6
+def test_monitoring_thread_blocks_on_the_connection(controller):
+    """
+    The monitoring thread SHOULD block in recv_match for monitored messages and store each one
+    """
+    messages = [position(2, 18.562, 73.769, 10, 0), None, ack(2, ARM, mavlink.MAV_RESULT_ACCEPTED)]
+    calls = []
+    drained = threading.Event()
+
+    class Connection:
+        def recv_match(self, **kwargs):
+            calls.append(kwargs)
+            if messages:
+                return messages.pop(0)
+            drained.set()
+            return None
+
+    controller.connection = Connection()
+    controller.start_attitude_monitoring(update_interval=0.01)
+    try:
+        assert drained.wait(5), "Expected the thread to read every message"
+    finally:
+        controller.stop_attitude_monitoring()
+
+    assert calls[0] == {"type": SimpleDroneController.MONITORED, "blocking": True, "timeout": 0.01}
+    assert controller.get_live_drone_attitude(2)["latitude"] == 18.562
+    assert controller.command_ack(2, ARM) == mavlink.MAV_RESULT_ACCEPTED
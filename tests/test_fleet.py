@@ -0,0 +1,101 @@
+import warnings
+import numpy as np
+import pandas as pd
+from src.deconfliction.fleet import detect_all_conflicts, conflict_matrix
+from src.deconfliction.spatiotemporal import detect_conflicts
+from tests.helpers import make_df
+
+SOUTHBOUND = [
+    (18.57209, 73.76876, 10, '2025-12-23 05:00:00'),
+    (18.56155, 73.76876, 10, '2025-12-23 05:10:00'),
+]
+NORTHBOUND = [
+    (18.56155, 73.76876, 10, '2025-12-23 05:00:00'),
+    (18.57209, 73.76876, 10, '2025-12-23 05:10:00'),
+]
+LATER = [
+    (18.56155, 73.76876, 10, '2025-12-23 07:00:00'),
+    (18.57209, 73.76876, 10, '2025-12-23 07:10:00'),
+]
+
+# TEST 1 
+def test_fleet_sweep_finds_each_pair_once():
+    """
+    Two head-on drones SHOULD produce one conflict; a later drone SHOULD NOT
+    """
+    fleet = pd.concat([
+        make_df(NORTHBOUND, "drone_B"),
+        make_df(SOUTHBOUND, "drone_A"),
+        make_df(LATER, "drone_C"),
+    ])
+    result = detect_all_conflicts(fleet)
+
+    assert len(result["alerts"]) == 1
+    alert = result["alerts"][0]
+    assert (alert["drone_id"], alert["other_drone_id"]) == ("drone_A", "drone_B")
+
+    pairs = result["pairs"]
+    assert list(zip(pairs.drone_a, pairs.drone_b, pairs.conflicts)) == [("drone_A", "drone_B", 1)]
+
+    summary = result["summary"]
+    assert summary.loc["drone_A", "conflicts"] == 1
+    assert summary.loc["drone_B", "conflicting_drones"] == 1
+    assert summary.loc["drone_C", "conflicts"] == 0
+
+# TEST 2 
+def test_fleet_sweep_matches_pairwise_checks():
+    """
+    The sweep SHOULD report the same conflicts as checking every pair
+    """
+    fleet = pd.concat([
+        make_df(SOUTHBOUND, "drone_A"),
+        make_df(NORTHBOUND, "drone_B"),
+        make_df([(p[0], p[1] + 0.00005, 14, p[3]) for p in NORTHBOUND], "drone_C"),
+        make_df(LATER, "drone_D"),
+    ])
+    result = detect_all_conflicts(fleet)
+
+    expected = 0
+    for drone_id, path in fleet.groupby("drone_id"):
+        expected += len(detect_conflicts(path, fleet[fleet.drone_id > drone_id]))
+    assert len(result["alerts"]) == expected == 3
+
+    matrix = conflict_matrix(result["pairs"], ["drone_A", "drone_B", "drone_C", "drone_D"])
+    assert matrix.loc["drone_B", "drone_A"] == matrix.loc["drone_A", "drone_B"] == 1
+    assert matrix["drone_D"].sum() == 0
+
+# TEST 3 
+def test_fleet_without_conflicts():
+    """
+    A schedule with no conflicts SHOULD give empty alerts and pairs
+    """
+    fleet = pd.concat([make_df(SOUTHBOUND, "drone_A"), make_df(LATER, "drone_C")])
+    result = detect_all_conflicts(fleet)
+    assert result["alerts"] == []
+    assert len(result["pairs"]) == 0
+    assert result["summary"]["conflicts"].sum() == 0
+
+# TEST 4 
+def test_fleet_sweep_with_duplicate_timestamps():
+    """
+    Waypoints sharing a timestamp SHOULD NOT produce NaNs or warnings in the sweep
+    """
+    fleet = pd.concat([
+        make_df([
+            (18.56155, 73.76876, 10, '2025-12-23 05:00:00'),
+            (18.56155, 73.76876, 30, '2025-12-23 05:00:00'),   # climb, same time
+            (18.57209, 73.76876, 30, '2025-12-23 05:10:00'),
+        ], "drone_A"),
+        make_df([
+            (18.56155, 73.76876, 30, '2025-12-23 04:55:00'),
+            (18.57209, 73.76876, 30, '2025-12-23 05:10:00'),
+        ], "drone_B"),
+    ])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = detect_all_conflicts(fleet)
+
+    assert len(result["alerts"]) > 0
+    assert all(np.isfinite(a["distance"]) and np.isfinite(a["lat"]) for a in result["alerts"])
+    assert result["pairs"]["conflicts"].tolist() == [len(result["alerts"])]
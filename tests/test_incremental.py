@@ -0,0 +1,74 @@
+import pandas as pd
+from src.deconfliction.incremental import IncrementalAnalysis
+from src.deconfliction.registry import AirspaceRegistry
+from src.deconfliction.spatiotemporal import detect_conflicts
+from tests.helpers import make_df
+
+FLEET = pd.concat([
+    make_df([
+        (18.56155, 73.76876, 10, '2025-12-23 05:00:00'),
+        (18.57209, 73.76876, 10, '2025-12-23 05:10:00'),
+    ], "drone_A"),
+    make_df([
+        (18.56155, 73.77500, 10, '2025-12-23 05:00:00'),
+        (18.57209, 73.77500, 10, '2025-12-23 05:10:00'),
+    ], "drone_B"),
+])
+
+# a survey path: head-on with drone_A, then across to drone_B's track
+SURVEY = make_df([
+    (18.57209, 73.76876, 10, '2025-12-23 05:00:00'),
+    (18.56155, 73.76876, 10, '2025-12-23 05:10:00'),
+    (18.56155, 73.77200, 10, '2025-12-23 05:12:00'),
+    (18.56155, 73.78000, 10, '2025-12-23 05:20:00'),
+], "new_path")
+
+
+# TEST 1
+def test_incremental_matches_full_analysis():
+    """
+    The cached check SHOULD return exactly the encounters of a full detect_conflicts run
+    """
+    registry = AirspaceRegistry.from_paths(FLEET)
+    analysis = IncrementalAnalysis(registry)
+
+    for n in range(2, len(SURVEY) + 1):
+        path = SURVEY.iloc[:n]
+        assert analysis.check(path) == detect_conflicts(path, registry, encounters=True)
+
+    assert [a["drone_id"] for a in analysis.check(SURVEY)] == ["drone_A"]
+
+
+# TEST 2
+def test_edit_rechecks_only_touched_segments():
+    """
+    Inserting a waypoint SHOULD re-check only the two segments it creates
+    """
+    registry = AirspaceRegistry.from_paths(FLEET)
+    analysis = IncrementalAnalysis(registry)
+    analysis.check(SURVEY)
+    assert (analysis.checked, analysis.reused) == (3, 0)
+
+    # detour onto drone_B's track, between the last two waypoints
+    detour = make_df([(18.56500, 73.77500, 10, '2025-12-23 05:16:00')], "new_path")
+    edited = pd.concat([SURVEY, detour]).sort_values("timestamp")
+
+    alerts = analysis.check(edited)
+    assert (analysis.checked, analysis.reused) == (2, 2)
+    assert alerts == detect_conflicts(edited, registry, encounters=True)
+
+
+# TEST 3
+def test_airspace_change_invalidates_cache():
+    """
+    A flight added to the airspace SHOULD invalidate every cached segment
+    """
+    registry = AirspaceRegistry.from_paths(FLEET[FLEET["drone_id"] == "drone_B"])
+    analysis = IncrementalAnalysis(registry)
+    assert analysis.check(SURVEY.iloc[:2]) == []
+
+    registry.add_flight("drone_A", FLEET[FLEET["drone_id"] == "drone_A"])
+    alerts = analysis.check(SURVEY.iloc[:2])
+
+    assert analysis.checked == 1
+    assert [a["drone_id"] for a in alerts] == ["drone_A"]
@@ -0,0 +1,56 @@
+import pandas as pd
+from src.deconfliction.index import SegmentIndex
+from src.deconfliction.segments import SegmentTable
+from src.deconfliction.spatiotemporal import detect_conflicts
+from tests.helpers import make_df
+
+NEW_PATH = make_df([
+    (18.57209, 73.76876, 10, '2025-12-23 05:00:00'),
+    (18.56155, 73.76876, 10, '2025-12-23 05:10:00'),
+], "new_drone")
+
+FLEET = pd.concat([
+    # head-on with the new path
+    make_df([
+        (18.56155, 73.76876, 10, '2025-12-23 05:00:00'),
+        (18.57209, 73.76876, 10, '2025-12-23 05:10:00'),
+    ], "drone_A"),
+    # same place, hours later
+    make_df([
+        (18.56155, 73.76876, 10, '2025-12-23 09:00:00'),
+        (18.57209, 73.76876, 10, '2025-12-23 09:10:00'),
+    ], "drone_B"),
+    # same time, ~10 km away
+    make_df([
+        (18.66155, 73.76876, 10, '2025-12-23 05:00:00'),
+        (18.67209, 73.76876, 10, '2025-12-23 05:10:00'),
+    ], "drone_C"),
+])
+
+# TEST 1 
+def test_query_skips_distant_segments():
+    """
+    Segments far away in space or time SHOULD NOT be returned as candidates
+    """
+    index = SegmentIndex.from_paths(FLEET)
+    candidates = index.candidates(SegmentTable.from_path(NEW_PATH), 12)
+    ids = set(candidates.drone_ids[candidates.owner])
+    assert ids == {"drone_A"}, f"Expected only drone_A as candidate, got {ids}"
+
+# TEST 2 
+def test_index_matches_dataframe_scan():
+    """
+    Querying through the index SHOULD give the same alerts as a full scan
+    """
+    index = SegmentIndex.from_paths(FLEET, cell_meters=50, cell_seconds=60)
+    assert detect_conflicts(NEW_PATH, index) == detect_conflicts(NEW_PATH, FLEET)
+
+# TEST 3 
+def test_empty_index():
+    """
+    An index over an empty fleet SHOULD report no conflicts
+    """
+    empty = pd.DataFrame(columns=["drone_id", "lat", "lon", "alt", "timestamp"])
+    index = SegmentIndex.from_paths(empty)
+    assert len(index) == 0
+    assert detect_conflicts(NEW_PATH, index) == []
@@ -0,0 +1,93 @@
+import pandas as pd
+from src.control.telemetry import TelemetryStore
+from src.deconfliction.live import LiveMonitor
+from src.deconfliction.projection import LocalProjection
+from src.deconfliction.registry import AirspaceRegistry
+from tests.helpers import make_df
+
+PLAN_A = make_df([
+    (18.56155, 73.76876, 10, '2025-12-23 05:00:00'),
+    (18.57209, 73.76876, 10, '2025-12-23 05:10:00'),
+], "plan_A")
+
+PLAN_B = make_df([
+    (18.56155, 73.76876, 100, '2025-12-23 05:00:00'),
+    (18.57209, 73.76876, 100, '2025-12-23 05:10:00'),
+], "plan_B")
+
+# time_offset=0: telemetry seconds map onto the plans' naive times as UTC
+NOW = pd.Timestamp('2025-12-23 05:05:00').timestamp()
+LAT_PER_SECOND = (18.57209 - 18.56155) / 600
+
+
+def fly(store, system_id, lat, lon, alt, lat_per_second):
+    # 10 Hz telemetry over the last two seconds, arriving at (lat, lon, alt) now
+    for k in range(21):
+        dt = (k - 20) / 10
+        store.record(system_id, NOW + dt, lat + lat_per_second * dt, lon, alt)
+
+
+# TEST 1
+def test_live_monitor_reports_conflicts_and_deviations():
+    """
+    Live drones SHOULD be checked against each other, other drones' plans and their own plan
+    """
+    airspace = AirspaceRegistry.from_paths(pd.concat([PLAN_A, PLAN_B]))
+    monitor = LiveMonitor(airspace, time_offset=0)
+    monitor.assign(1, "plan_A", PLAN_A)
+    monitor.assign(3, "plan_B", PLAN_B)
+
+    store = TelemetryStore()
+    mid_lat = 18.56155 + 300 * LAT_PER_SECOND
+    fly(store, 1, mid_lat, 73.76876, 10, LAT_PER_SECOND)              # on its plan
+    fly(store, 2, mid_lat + 0.00036, 73.76876, 10, -LAT_PER_SECOND)   # head-on, 40 m ahead
+    fly(store, 3, mid_lat, 73.78, 10, LAT_PER_SECOND)                 # 1.2 km off plan_B
+    store.record(4, NOW - 10, mid_lat, 73.76876, 10)                  # stale: ignored
+
+    report = monitor.check(store.snapshot(2), NOW)
+
+    assert report["drones"] == 3
+    assert [(a["drone_id"], a["other_drone_id"]) for a in report["conflicts"]] == [(1, 2)]
+    assert report["conflicts"][0]["distance"] < 12
+
+    # drone 1 flies plan_A itself; drone 2 is on a collision course with it
+    assert [(a["system_id"], a["drone_id"]) for a in report["airspace"]] == [(2, "plan_A")]
+
+    assert [(a["system_id"], a["drone_id"]) for a in report["deviations"]] == [(3, "plan_B")]
+    assert report["deviations"][0]["distance"] > 1000
+    assert report["time"] == pd.Timestamp('2025-12-23 05:05:00')
+
+
+# TEST 2
+def test_unproject_inverts_project():
+    """
+    unproject SHOULD map projected meters back to the original lat/lon/alt
+    """
+    geo = PLAN_A[["lat", "lon", "alt"]].to_numpy()
+    for mode in ("enu", "flat", "haversine"):
+        projection = LocalProjection(18.566817, 73.772498, mode=mode)
+        assert abs(projection.unproject(projection.project(geo)) - geo).max() < 1e-9
+
+
+# TEST 3
+def test_plan_with_shared_timestamps_does_not_break_deviation_check():
+    """
+    A plan whose waypoints share a timestamp SHOULD still be checked for deviations
+    """
+    plan = make_df([
+        (18.56155, 73.76876, 10, '2025-12-23 05:10:00'),
+        (18.56155, 73.76876, 30, '2025-12-23 05:10:00'),   # climb, same time
+        (18.57209, 73.76876, 30, '2025-12-23 05:20:00'),
+    ], "plan_C")
+    monitor = LiveMonitor(AirspaceRegistry.from_paths(plan), time_offset=0)
+    monitor.assign(1, "plan_C", plan)
+
+    store = TelemetryStore()
+    fly(store, 1, 18.56155, 73.76876, 10, 0.0)          # waiting at the start
+    fly(store, 2, 18.56155, 73.78, 10, 0.0)
+    monitor.assign(2, "plan_C", plan)                   # 1.2 km from the start
+
+    report = monitor.check(store.snapshot(2), NOW)
+
+    # before the plan starts it is held at its first waypoint
+    assert [a["system_id"] for a in report["deviations"]] == [2]
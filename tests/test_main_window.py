@@ -0,0 +1,95 @@
+import os
+import pandas as pd
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PyQt5.QtWebEngineWidgets", exc_type=ImportError)
+
+from PyQt5.QtWidgets import QApplication
+from src.control.mission import MissionScheduler
+from src.ui import main_window
+from src.ui.main_window import MISSION_SYSTEM_ID, MainWindow
+
+APP = QApplication.instance() or QApplication([])
+
+
+class IdleController:
+    """
+    Accepts every command and never reports back.
+    """
+
+    monitoring_active = True
+    attitude_heading = {}
+
+    def command_ack(self, system_id, command, since=0.0):
+        return None
+
+    def set_drone_mode(self, system_id, mode):
+        return True
+
+
+# TEST 1
+def test_live_check_after_loading_paths():
+    """
+    A live check right after loading paths SHOULD run against the loaded airspace
+    """
+    window = MainWindow()
+    window.load_paths()
+    assert window.live_check.airspace is window.airspace
+
+    # retrace a stored drone's first leg: a guaranteed conflict
+    first = window.stored_paths.sort_values("timestamp").groupby("drone_id").head(2)
+    drone = first["drone_id"].iloc[0]
+    for _, row in first[first["drone_id"] == drone].iterrows():
+        window.insert_new_waypoint({
+            "lat": row["lat"], "lon": row["lon"], "alt": row["alt"], "timestamp": row["timestamp"]
+        })
+
+    window.live_check_btn.setChecked(True)
+
+    assert not any(line.startswith("❌") for line in window.log)
+    assert window.path_is_safe is False
+
+    # a reload swaps the registry; the live check must follow it
+    window.load_paths()
+    assert window.live_check.airspace is window.airspace
+    window.close()
+
+
+# TEST 2
+def test_mission_plan_is_withdrawn_when_mission_ends(monkeypatch):
+    """
+    Missions started within one second SHOULD file distinct plans, and each plan
+    SHOULD leave the airspace once its mission ends
+    """
+    fake = IdleController()
+    monkeypatch.setattr(main_window, "controller", fake)
+
+    window = MainWindow()
+    window.load_paths()
+    window.missions = MissionScheduler(fake, log=window.mission_log)
+    monkeypatch.setattr(window, "start_live_monitor", lambda: None)
+
+    # far above every stored flight
+    start = window.stored_paths["timestamp"].min()
+    row = window.stored_paths.iloc[0]
+    for k in range(2):
+        window.insert_new_waypoint({
+            "lat": row["lat"], "lon": row["lon"], "alt": 5000 + k, "timestamp": start + pd.Timedelta(minutes=k)
+        })
+    window.path_is_safe = True
+    stored = set(window.airspace.flights)
+
+    filed = []
+    for _ in range(2):
+        window.execute_mission()
+        (mission_id,) = set(window.airspace.flights) - stored
+        filed.append(mission_id)
+
+        window.missions.abort(MISSION_SYSTEM_ID)
+        window.on_mission_tick()
+        assert set(window.airspace.flights) == stored
+
+    assert filed[0] != filed[1]
+    assert not any(line.startswith("❌") for line in window.log)
+    window.close()
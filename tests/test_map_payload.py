@@ -0,0 +1,109 @@
+import json
+import numpy as np
+import pandas as pd
+from src.ui.map_payload import (
+    FleetLayers, collisions_payload, dp_significance, insertion_index, js_call, waypoint_payload
+)
+from tests.helpers import make_df
+
+
+# TEST 1
+def test_collisions_payload_is_one_js_call():
+    """
+    A batch of alerts SHOULD become one markCollisions call with a valid JSON argument
+    """
+    alerts = [
+        {
+            "drone_id": f"drone_{k}",
+            "lat": 18.5 + k,
+            "lon": 73.7,
+            "alt": 10.04,
+            "time": pd.Timestamp('2025-12-23 05:00:00'),
+            "start": pd.Timestamp('2025-12-23 04:59:50'),
+            "end": pd.Timestamp('2025-12-23 05:00:10'),
+            "distance": 3.14159,
+        }
+        for k in range(3)
+    ]
+
+    call = js_call("markCollisions", collisions_payload(alerts))
+
+    assert call.startswith("markCollisions(") and call.endswith(");")
+    payload = json.loads(call[len("markCollisions("):-2])
+    assert payload["drone"] == ["drone_0", "drone_1", "drone_2"]
+    assert payload["time"][0] == "2025-12-23 05:00:00"
+    assert payload["start"][0] == "04:59:50"
+    assert payload["distance"][0] == "3.1"
+    assert payload["alt"][0] == 10.0
+
+
+# TEST 2
+def test_douglas_peucker_significance_is_monotone():
+    """
+    dp_significance SHOULD keep endpoints and drop vertices in the order Douglas-Peucker would
+    """
+    x = np.array([0.0, 1.0, 2.0, 3.0, 4.0])
+    y = np.array([0.0, 0.1, 0.0, 3.0, 0.0])
+
+    significance = dp_significance(x, y)
+
+    assert np.isinf(significance[[0, -1]]).all()
+    assert significance[3] == 3.0                 # first split: the spike
+    assert abs(significance[2] - 2 ** 0.5) < 1e-9  # off the chord 0 -> 3
+    assert abs(significance[1] - 0.1) < 1e-9      # near-collinear detail
+    assert list(np.flatnonzero(significance > 0.5)) == [0, 2, 3, 4]
+    assert list(np.flatnonzero(significance > 2.0)) == [0, 3, 4]
+
+
+# TEST 3
+def test_fleet_layers_cull_simplify_and_cluster():
+    """
+    FleetLayers SHOULD send only drones in view, fewer vertices and clustered labels when zoomed out
+    """
+    # drone_A: a straight line with many collinear waypoints; drone_B: far away
+    line = make_df([
+        (18.50 + k * 0.001, 73.70, 10, f'2025-12-23 05:{k:02d}:00')
+        for k in range(11)
+    ], "drone_A")
+    far = make_df([
+        (19.50, 74.70, 10, '2025-12-23 05:00:00'),
+        (19.51, 74.70, 10, '2025-12-23 05:10:00'),
+    ], "drone_B")
+    layers = FleetLayers(pd.concat([far, line]))
+
+    visible = layers.visible(18.45, 73.65, 18.55, 73.75)
+    assert visible.tolist() == [0]
+
+    payload = layers.payload(visible, zoom=14)
+    assert payload["drones"] == ["drone_A"]
+    assert payload["colors"] == ["blue"]          # fleet-wide color, stable across views
+    assert payload["wp"] == [1, 11]               # collinear waypoints simplified away
+    assert payload["offsets"] == [0, 2]
+
+    full = layers.payload(visible)
+    assert full["wp"] == list(range(1, 12))
+    assert full["labels"]["count"] == [1] * 11
+
+    # zoomed out, drone_A's 1.1 km fits in a few pixels: one cluster label
+    clustered = layers.payload(visible, zoom=8)
+    assert clustered["labels"]["count"] == [2]
+    assert clustered["labels"]["text"] == ["2"]
+
+
+# TEST 4
+def test_new_waypoints_insert_in_time_order():
+    """
+    insertion_index SHOULD keep the new path time-ordered, later clicks after equal times
+    """
+    path = []
+    for lat, minute in [(0, 0), (1, 10), (2, 5), (3, 5), (4, 1)]:
+        wp = {"lat": lat, "lon": 73.7, "alt": 10.0,
+              "timestamp": pd.Timestamp(f'2025-12-23 05:{minute:02d}:00')}
+        path.insert(insertion_index(path, wp["timestamp"]), wp)
+
+    assert [wp["lat"] for wp in path] == [0, 4, 2, 3, 1]
+    assert insertion_index(path, pd.Timestamp('2025-12-23 04:00:00')) == 0
+
+    call = js_call("insertNewWaypoint", 2, waypoint_payload(path[2]))
+    assert call == ('insertNewWaypoint(2,{"lat":2,"lon":73.7,"alt":10.0,'
+                    '"time":"2025-12-23 05:05:00"});')
@@ -0,0 +1,189 @@
+import pytest
+from src.control.mission import (
+    ABORTED, ACK_COMMANDS, ARM, DONE, FAILED, MODE, TAKEOFF, WAYPOINT,
+    MissionExecutor, MissionScheduler
+)
+
+WAYPOINTS = [
+    {"lat": 18.5700, "lon": 73.7700, "alt": 10, "timestamp": "2025-12-23 05:00:00"},
+    {"lat": 18.5710, "lon": 73.7700, "alt": 20, "timestamp": "2025-12-23 05:02:00"},
+]
+
+
+class FakeController:
+    """
+    Records commands and serves telemetry the test writes into it.
+    """
+
+    def __init__(self):
+        self.attitude_heading = {}
+        self.command_acks = {}
+        self.sent = []
+
+    def report(self, lat, lon, alt, timestamp, system_id=2):
+        self.attitude_heading[system_id] = {
+            "latitude": lat, "longitude": lon, "altitude": alt, "timestamp": timestamp
+        }
+
+    def ack(self, step, result, timestamp, system_id=2):
+        self.command_acks[(system_id, ACK_COMMANDS[step])] = {"result": result, "timestamp": timestamp}
+
+    def command_ack(self, system_id, command, since=0.0):
+        ack = self.command_acks.get((system_id, command))
+        if ack is None or ack["timestamp"] < since:
+            return None
+        return ack["result"]
+
+    def set_drone_mode(self, system_id, mode):
+        self.sent.append(("mode", mode))
+        return True
+
+    def arm_drone(self, system_id):
+        self.sent.append(("arm",))
+        return True
+
+    def takeoff_drone(self, system_id, alt):
+        self.sent.append(("takeoff", alt))
+        return True
+
+    def goto_location(self, system_id, lat, lon, alt):
+        self.sent.append(("goto", lat, lon, alt))
+        return True
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_mission(controller, clock, **kwargs):
+    return MissionExecutor(controller, 2, WAYPOINTS, log=lambda _: None, clock=clock, **kwargs)
+
+
+# TEST 1
+def test_mission_advances_on_arrival():
+    """
+    Each waypoint SHOULD be sent only once the drone reports being at the previous one
+    """
+    controller, clock = FakeController(), Clock()
+    mission = make_mission(controller, clock)
+
+    mission.start()
+    assert mission.state == MODE
+    assert mission.tick() == MODE          # not acknowledged yet
+
+    clock.now += 1
+    controller.ack(MODE, 0, timestamp=clock.now)
+    assert mission.tick() == ARM
+    clock.now += 1
+    controller.ack(ARM, 0, timestamp=clock.now)
+    assert mission.tick() == TAKEOFF
+
+    # old telemetry and a half-done climb do not count
+    controller.report(18.5700, 73.7700, 10, timestamp=clock.now - 5)
+    assert mission.tick() == TAKEOFF
+    clock.now += 1
+    controller.report(18.5700, 73.7700, 5, timestamp=clock.now)
+    assert mission.tick() == TAKEOFF
+
+    controller.report(18.5700, 73.7700, 9.8, timestamp=clock.now)
+    assert mission.tick() == WAYPOINT
+    assert controller.sent[-1] == ("goto", 18.5700, 73.7700, 10)
+
+    # arriving at the first waypoint sends the second; the same fix does not complete it
+    clock.now += 1
+    controller.report(18.5700, 73.7700, 10, timestamp=clock.now)
+    assert mission.tick() == WAYPOINT
+    assert controller.sent[-1] == ("goto", 18.5710, 73.7700, 20)
+    assert mission.tick() == WAYPOINT
+
+    clock.now += 30
+    controller.report(18.57099, 73.7700, 19.5, timestamp=clock.now)
+    assert mission.tick() == DONE
+    assert mission.finished
+    assert [c[0] for c in controller.sent] == ["mode", "arm", "takeoff", "goto", "goto"]
+
+
+# TEST 2
+def test_mission_times_out_and_aborts():
+    """
+    A leg that never arrives SHOULD fail the mission; abort SHOULD stop it for good
+    """
+    controller, clock = FakeController(), Clock()
+    mission = make_mission(controller, clock, leg_timeout=60)
+    mission.start()
+    controller.ack(MODE, 0, timestamp=clock.now)
+    mission.tick()
+    controller.ack(ARM, 0, timestamp=clock.now)
+    assert mission.tick() == TAKEOFF
+
+    clock.now += 61
+    assert mission.tick() == FAILED
+
+    mission = make_mission(controller, clock)
+    mission.start()
+    mission.abort()
+    clock.now += 10
+    assert mission.tick() == ABORTED
+    with pytest.raises(RuntimeError):
+        mission.start()
+
+
+# TEST 3
+def test_unacknowledged_commands_are_resent_then_fail():
+    """
+    A command without ack SHOULD be resent, and a rejected one SHOULD fail the mission
+    """
+    controller, clock = FakeController(), Clock()
+    mission = make_mission(controller, clock)
+    mission.start()
+
+    for _ in range(2):
+        clock.now += 3
+        assert mission.tick() == MODE
+    assert controller.sent.count(("mode", "GUIDED")) == 3
+    clock.now += 3
+    assert mission.tick() == FAILED
+
+    mission = make_mission(controller, clock)
+    mission.start()
+    controller.ack(MODE, 0, timestamp=clock.now)
+    mission.tick()
+    controller.ack(ARM, 4, timestamp=clock.now)     # MAV_RESULT_FAILED
+    assert mission.tick() == FAILED
+
+
+# TEST 4
+def test_scheduler_dispatches_drones_concurrently():
+    """
+    The scheduler SHOULD advance every drone whose step is done in the same tick
+    """
+    controller, clock = FakeController(), Clock()
+    scheduler = MissionScheduler(controller, log=lambda _: None, clock=clock)
+    drones = range(1, 51)
+    for system_id in drones:
+        scheduler.add(system_id, WAYPOINTS)
+    assert len(controller.sent) == 50
+
+    with pytest.raises(RuntimeError):
+        scheduler.add(7, WAYPOINTS)
+
+    for system_id in drones:
+        controller.ack(MODE, 0, timestamp=clock.now, system_id=system_id)
+    states = scheduler.tick()
+    assert set(states.values()) == {ARM}
+    assert len(controller.sent) == 100
+
+    scheduler.abort(7)
+    for system_id in drones:
+        controller.ack(ARM, 0, timestamp=clock.now, system_id=system_id)
+    states = scheduler.tick()
+    assert states[7] == ABORTED
+    assert sum(state == TAKEOFF for state in states.values()) == 49
+    assert len(scheduler.active) == 49 and not scheduler.finished
+
+    scheduler.abort()
+    assert scheduler.finished
@@ -0,0 +1,47 @@
+import os
+import time
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PyQt5.QtWidgets", exc_type=ImportError)
+
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
+from PyQt5.QtWidgets import QApplication
+from src.control.telemetry import TelemetryStore
+from src.deconfliction.live import LiveMonitor
+from src.ui.analysis_worker import start_analysis
+from src.ui.monitor_worker import MonitorWorker
+
+APP = QApplication.instance() or QApplication([])
+
+
+class Window(QObject):
+    # what MainWindow connects to the worker
+    monitor_stop = pyqtSignal()
+
+
+def wait_for(condition, seconds=10):
+    deadline = time.monotonic() + seconds
+    while not condition() and time.monotonic() < deadline:
+        APP.processEvents()
+    return condition()
+
+
+# TEST 1
+def test_stop_ends_the_monitor_thread():
+    """
+    stop SHOULD halt the tick timer on the worker thread and let the thread quit
+    """
+    window = Window()
+    worker = MonitorWorker(LiveMonitor(time_offset=0), TelemetryStore())
+    reports = []
+    worker.report.connect(reports.append, Qt.DirectConnection)
+    window.monitor_stop.connect(worker.stop, Qt.BlockingQueuedConnection)
+
+    thread = start_analysis(window, worker)
+    assert wait_for(lambda: len(reports) > 0), "Expected the monitor to tick"
+
+    window.monitor_stop.emit()
+    assert not worker.timer.isActive()
+    assert wait_for(thread.isFinished), "Expected the monitor thread to quit"
+    assert reports[-1]["drones"] == 0
@@ -0,0 +1,101 @@
+import pandas as pd
+import pytest
+from src.deconfliction.registry import AirspaceRegistry
+from src.deconfliction.spatiotemporal import detect_conflicts
+from tests.helpers import make_df
+
+NEW_PATH = make_df([
+    (18.57209, 73.76876, 10, '2025-12-23 05:00:00'),
+    (18.56155, 73.76876, 10, '2025-12-23 05:10:00'),
+], "new_drone")
+
+HEAD_ON = make_df([
+    (18.56155, 73.76876, 10, '2025-12-23 05:00:00'),
+    (18.57209, 73.76876, 10, '2025-12-23 05:10:00'),
+], "drone_A")
+
+CLEAR = make_df([
+    (18.56155, 73.76876, 50, '2025-12-23 05:00:00'),
+    (18.57209, 73.76876, 50, '2025-12-23 05:10:00'),
+], "drone_A")
+
+# TEST 1 
+def test_added_flight_is_checked():
+    """
+    A flight added after loading SHOULD take part in later checks
+    """
+    registry = AirspaceRegistry()
+    assert detect_conflicts(NEW_PATH, registry) == []
+
+    registry.add_flight("drone_A", HEAD_ON)
+    alerts = detect_conflicts(NEW_PATH, registry)
+    assert [a["drone_id"] for a in alerts] == ["drone_A"]
+    assert registry.version == 1
+
+# TEST 2 
+def test_removed_flight_is_ignored():
+    """
+    A removed flight SHOULD no longer cause conflicts
+    """
+    registry = AirspaceRegistry.from_paths(HEAD_ON)
+    assert len(detect_conflicts(NEW_PATH, registry)) > 0
+
+    registry.remove_flight("drone_A")
+    assert "drone_A" not in registry
+    assert detect_conflicts(NEW_PATH, registry) == []
+
+# TEST 3 
+def test_amended_flight_replaces_path():
+    """
+    Amending a flight to a vertically separated path SHOULD clear the conflict
+    """
+    registry = AirspaceRegistry.from_paths(HEAD_ON)
+    registry.amend_flight("drone_A", CLEAR)
+    assert detect_conflicts(NEW_PATH, registry) == []
+
+    registry.amend_flight("drone_A", HEAD_ON)
+    assert len(detect_conflicts(NEW_PATH, registry)) > 0
+
+# TEST 4 
+def test_matches_dataframe_after_updates():
+    """
+    Registry results SHOULD equal a fresh DataFrame scan of the same fleet
+    """
+    other = HEAD_ON.assign(drone_id="drone_0", alt=14)
+    registry = AirspaceRegistry.from_paths(HEAD_ON)
+    registry.add_flight("drone_0", other)
+    registry.remove_flight("drone_A")
+    registry.add_flight("drone_A", HEAD_ON)
+
+    fleet = pd.concat([HEAD_ON, other])
+    assert detect_conflicts(NEW_PATH, registry) == detect_conflicts(NEW_PATH, fleet)
+
+# TEST 5 
+def test_duplicate_and_unknown_flights():
+    """
+    Re-adding or removing unknown flights SHOULD raise
+    """
+    registry = AirspaceRegistry.from_paths(HEAD_ON)
+    with pytest.raises(ValueError):
+        registry.add_flight("drone_A", HEAD_ON)
+    with pytest.raises(KeyError):
+        registry.remove_flight("drone_B")
+
+# TEST 6 
+def test_repeated_add_remove_stays_bounded():
+    """
+    Flights added and removed over a long session SHOULD reuse slots and owner codes
+    """
+    registry = AirspaceRegistry.from_paths(HEAD_ON)
+    for k in range(200):
+        registry.add_flight(f"mission_{k}", CLEAR.assign(drone_id=f"mission_{k}"))
+        registry.remove_flight(f"mission_{k}")
+
+    assert len(registry.table.drone_ids) <= 2
+    assert len(registry.table.t0) <= 16
+
+    # a reused code belongs to its new flight only
+    registry.add_flight("drone_B", HEAD_ON.assign(drone_id="drone_B"))
+    alerts = detect_conflicts(NEW_PATH, registry)
+    assert sorted({a["drone_id"] for a in alerts}) == ["drone_A", "drone_B"]
+    assert registry.flights == ["drone_A", "drone_B"]
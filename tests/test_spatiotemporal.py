@@ -1,22 +1,11 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from src.deconfliction.spatiotemporal import detect_conflicts
-
-def make_df(points, drone_id):
-    """
-    Helper to convert (lat, lon, alt, time_str) → DataFrame
-    """
-    return pd.DataFrame([
-        {
-            "drone_id": drone_id,
-            "lat": p[0],
-            "lon": p[1],
-            "alt": p[2],
-            "timestamp": pd.to_datetime(p[3])
-        }
-        for p in points
-    ])
+from src.deconfliction.spatiotemporal import (
+    detect_conflicts, detect_conflicts_batch, first_conflict, is_path_safe, iter_conflicts
+)
+from src.deconfliction.projection import EARTH_RADIUS_METERS, LocalProjection
+from tests.helpers import make_df
 
 # TEST 1 
 def test_exact_same_position_same_time():
@@ -278,23 +267,418 @@ def test_empty_path_no_conflict():
 # TEST 15 
 def test_3d_distance_boundary_case():
     """
-    Test exact boundary case: distance exactly at 12m threshold
+    Test boundary case: 3D distance just over the 12m threshold SHOULD NOT
+    conflict, just under it SHOULD
+    """
+    # 8.5m north + 8.5m up = ~12.02m total
+    north = np.degrees(8.5 / EARTH_RADIUS_METERS)
+    new_path_points = [
+        (18.57209, 73.76876, 10, '2025-12-23 05:00:00'),
+        (18.57209, 73.76876, 10, '2025-12-23 05:05:00'),
+    ]
+    existing_points = [
+        (18.57209 + north, 73.76876, 18.5, '2025-12-23 05:00:00'),  # 8.5m north, 8.5m up
+        (18.57209 + north, 73.76876, 18.5, '2025-12-23 05:05:00'),
+    ]
+    new_df = make_df(new_path_points, "new_drone")
+    existing_df = make_df(existing_points, "drone_A")
+    alerts = detect_conflicts(new_df, existing_df)
+    # Just over 12m, it should not conflict (threshold is <12m)
+    assert len(alerts) == 0, "Expected no conflicts at ~12.02m distance"
+
+    # 8.5m north + 8.4m up = ~11.95m total
+    existing_df["alt"] = 18.4
+    alerts = detect_conflicts(new_df, existing_df)
+    assert len(alerts) == 1, "Expected a conflict at ~11.95m distance"
+
+# TEST 16 
+def test_multiple_drones_alerts_grouped_by_drone():
+    """
+    Only drones that come close SHOULD be reported, grouped per drone in
+    drone_id order with each drone's alerts in time order
+    """
+    new_path_points = [
+        (18.57209, 73.76876, 10, '2025-12-23 05:00:00'),
+        (18.57209, 73.76876, 10, '2025-12-23 05:10:00'),
+    ]
+    close_points = [
+        (18.57209, 73.76876, 15, '2025-12-23 05:00:00'),
+        (18.57209, 73.76876, 15, '2025-12-23 05:05:00'),
+        (18.57209, 73.76876, 15, '2025-12-23 05:10:00'),
+    ]
+    far_points = [
+        (18.58000, 73.76876, 10, '2025-12-23 05:00:00'),
+        (18.58000, 73.76876, 10, '2025-12-23 05:10:00'),
+    ]
+    new_df = make_df(new_path_points, "new_drone")
+    existing_df = pd.concat([
+        make_df(close_points, "drone_C"),
+        make_df(far_points, "drone_B"),
+        make_df(close_points, "drone_A"),
+    ])
+    alerts = detect_conflicts(new_df, existing_df)
+    ids = [a["drone_id"] for a in alerts]
+    assert set(ids) == {"drone_A", "drone_C"}, "Expected only the close drones"
+    assert ids == sorted(ids), "Expected alerts grouped by drone_id"
+    times = [a["time"] for a in alerts if a["drone_id"] == "drone_A"]
+    assert times == sorted(times), "Expected alerts in time order per drone"
+
+# TEST 17 
+def test_cpa_finds_pass_between_samples():
+    """
+    A head-on pass at the window midpoint SHOULD be found by the exact
+    CPA solver even though 4-sample probing steps over it
+    """
+    new_path_points = [
+        (18.57209, 73.76876, 10, '2025-12-23 05:00:00'),
+        (18.56155, 73.76876, 10, '2025-12-23 05:10:00'),
+    ]
+    existing_points = [
+        (18.56155, 73.76876, 10, '2025-12-23 05:00:00'),
+        (18.57209, 73.76876, 10, '2025-12-23 05:10:00'),
+    ]
+    new_df = make_df(new_path_points, "new_drone")
+    existing_df = make_df(existing_points, "drone_A")
+
+    sampled = detect_conflicts(new_df, existing_df, method="sample")
+    alerts = detect_conflicts(new_df, existing_df, method="cpa")
+
+    assert len(sampled) == 0, "4-sample probing is expected to miss the pass"
+    assert len(alerts) == 1, "Expected exactly one CPA alert per segment pair"
+    assert alerts[0]["distance"] < 1e-6
+    assert alerts[0]["time"] == pd.Timestamp('2025-12-23 05:05:00')
+
+# TEST 18 
+def test_cpa_conflict_interval():
+    """
+    intervals=True SHOULD report the window where separation < safety distance
+    """
+    # Closing speed: ~1172m / 600s each way → ~3.9 m/s relative
+    new_path_points = [
+        (18.57209, 73.76876, 10, '2025-12-23 05:00:00'),
+        (18.56155, 73.76876, 10, '2025-12-23 05:10:00'),
+    ]
+    existing_points = [
+        (18.56155, 73.76876, 10, '2025-12-23 05:00:00'),
+        (18.57209, 73.76876, 10, '2025-12-23 05:10:00'),
+    ]
+    new_df = make_df(new_path_points, "new_drone")
+    existing_df = make_df(existing_points, "drone_A")
+    alerts = detect_conflicts(new_df, existing_df, intervals=True)
+
+    assert len(alerts) == 1
+    a = alerts[0]
+    assert a["start"] < a["time"] < a["end"]
+    meters_per_degree = np.radians(EARTH_RADIUS_METERS)
+    closing_speed = 2 * (18.57209 - 18.56155) * meters_per_degree / 600
+    expected = 2 * 12 / closing_speed
+    assert abs((a["end"] - a["start"]).total_seconds() - expected) < 0.01
+
+# TEST 19 
+def test_batch_matches_single_checks():
+    """
+    Batch results SHOULD equal checking each candidate on its own
+    """
+    existing_df = make_df([
+        (18.56155, 73.76876, 10, '2025-12-23 05:00:00'),
+        (18.57209, 73.76876, 10, '2025-12-23 05:10:00'),
+    ], "drone_A")
+    head_on = make_df([
+        (18.57209, 73.76876, 10, '2025-12-23 05:00:00'),
+        (18.56155, 73.76876, 10, '2025-12-23 05:10:00'),
+    ], "plan_1")
+    high = make_df([
+        (18.57209, 73.76876, 60, '2025-12-23 05:00:00'),
+        (18.56155, 73.76876, 60, '2025-12-23 05:10:00'),
+    ], "plan_2")
+    candidates = pd.concat([head_on, high])
+
+    results = detect_conflicts_batch(candidates, existing_df)
+
+    assert set(results) == {"plan_1", "plan_2"}
+    assert results["plan_1"] == detect_conflicts(head_on, existing_df)
+    assert results["plan_2"] == []
+
+# TEST 20 
+def test_batch_mutual_conflicts():
+    """
+    With mutual=True, candidates that conflict with each other SHOULD be reported
+    """
+    existing_df = pd.DataFrame(columns=["drone_id", "lat", "lon", "alt", "timestamp"])
+    plan_1 = make_df([
+        (18.57209, 73.76876, 10, '2025-12-23 05:00:00'),
+        (18.56155, 73.76876, 10, '2025-12-23 05:10:00'),
+    ], "plan_1")
+    plan_2 = make_df([
+        (18.56155, 73.76876, 10, '2025-12-23 05:00:00'),
+        (18.57209, 73.76876, 10, '2025-12-23 05:10:00'),
+    ], "plan_2")
+    candidates = pd.concat([plan_1, plan_2])
+
+    assert detect_conflicts_batch(candidates, existing_df) == {"plan_1": [], "plan_2": []}
+
+    results = detect_conflicts_batch(candidates, existing_df, mutual=True)
+    assert [a["drone_id"] for a in results["plan_1"]] == ["plan_2"]
+    assert [a["drone_id"] for a in results["plan_2"]] == ["plan_1"]
+
+# TEST 21 
+def test_parallel_matches_serial():
+    """
+    Splitting the fleet across worker processes SHOULD give identical,
+    identically ordered alerts
+    """
+    from src.deconfliction import spatiotemporal
+
+    new_df = make_df([
+        (18.57209, 73.76876, 10, '2025-12-23 05:00:00'),
+        (18.56155, 73.76876, 10, '2025-12-23 05:10:00'),
+    ], "new_drone")
+    existing_df = pd.concat([
+        make_df([
+            (18.56155, 73.76876, 10 + k, '2025-12-23 05:00:00'),
+            (18.57209, 73.76876, 10 + k, '2025-12-23 05:10:00'),
+        ], f"drone_{k}")
+        for k in range(8)
+    ])
+
+    serial = detect_conflicts(new_df, existing_df)
+    threshold = spatiotemporal.PARALLEL_MIN_SEGMENTS
+    spatiotemporal.PARALLEL_MIN_SEGMENTS = 0
+    try:
+        parallel = detect_conflicts(new_df, existing_df, workers=3)
+    finally:
+        spatiotemporal.PARALLEL_MIN_SEGMENTS = threshold
+
+    assert len(serial) == 8
+    assert parallel == serial, "Expected parallel run to match serial run"
+
+# TEST 22 
+def test_east_west_distance_models():
+    """
+    ~11.6m east-west separation SHOULD conflict under the ENU and haversine
+    models; the legacy flat model overstates it as ~12.2m
     """
-    # Calculate position that's exactly 12m away in 3D space
-    # Using 8.5m horizontal + 8.5m vertical = ~12.02m total
     new_path_points = [
         (18.57209, 73.76876, 10, '2025-12-23 05:00:00'),
         (18.57209, 73.76876, 10, '2025-12-23 05:05:00'),
     ]
     existing_points = [
-        (18.57216, 73.76876, 18.5, '2025-12-23 05:00:00'),  # ~8.5m north, 8.5m up
-        (18.57216, 73.76876, 18.5, '2025-12-23 05:05:00'),
+        (18.57209, 73.76887, 10, '2025-12-23 05:00:00'),  # 0.00011 deg east
+        (18.57209, 73.76887, 10, '2025-12-23 05:05:00'),
     ]
     new_df = make_df(new_path_points, "new_drone")
     existing_df = make_df(existing_points, "drone_A")
+
+    enu = detect_conflicts(new_df, existing_df)
+    haversine = detect_conflicts(
+        new_df, existing_df, projection=LocalProjection(18.57, 73.77, mode="haversine")
+    )
+    flat = detect_conflicts(
+        new_df, existing_df, projection=LocalProjection(18.57, 73.77, mode="flat")
+    )
+
+    assert len(enu) == 1 and abs(enu[0]["distance"] - 11.6) < 0.05
+    assert len(haversine) == 1 and abs(haversine[0]["distance"] - enu[0]["distance"]) < 0.01
+    assert len(flat) == 0, "Flat model is expected to overstate east-west distance"
+
+# TEST 23 
+def test_first_conflict_stops_early():
+    """
+    first_conflict SHOULD return one of the conflicts detect_conflicts reports,
+    checking the nearest drone first
+    """
+    new_df = make_df([
+        (18.56155, 73.76876, 10, '2025-12-23 05:00:00'),
+        (18.57209, 73.76876, 10, '2025-12-23 05:10:00'),
+    ], "new_drone")
+    existing_df = pd.concat([
+        make_df([
+            (18.56155, 73.76876 + 0.00005 * k, 10, '2025-12-23 05:00:00'),
+            (18.57209, 73.76876 + 0.00005 * k, 10, '2025-12-23 05:10:00'),
+        ], f"drone_{k}")
+        for k in (2, 1, 0, 30)
+    ])
+
+    alerts = detect_conflicts(new_df, existing_df)
+    first = first_conflict(new_df, existing_df)
+
+    assert len(alerts) == 3
+    assert first in alerts
+    assert first["drone_id"] == "drone_0", "Expected the co-located drone to be found first"
+
+# TEST 24 
+def test_is_path_safe():
+    """
+    is_path_safe SHOULD agree with detect_conflicts
+    """
+    new_df = make_df([
+        (18.56155, 73.76876, 10, '2025-12-23 05:00:00'),
+        (18.57209, 73.76876, 10, '2025-12-23 05:10:00'),
+    ], "new_drone")
+    head_on = make_df([
+        (18.57209, 73.76876, 10, '2025-12-23 05:00:00'),
+        (18.56155, 73.76876, 10, '2025-12-23 05:10:00'),
+    ], "drone_A")
+    above = make_df([
+        (18.57209, 73.76876, 40, '2025-12-23 05:00:00'),
+        (18.56155, 73.76876, 40, '2025-12-23 05:10:00'),
+    ], "drone_B")
+
+    assert is_path_safe(new_df, above)
+    assert not is_path_safe(new_df, pd.concat([above, head_on]))
+    assert first_conflict(new_df, above) is None
+
+# TEST 25 
+def test_encounters_coalesce_segments():
+    """
+    A long encounter spanning several segments SHOULD produce one record
+    per encounter, with its window and closest approach
+    """
+    new_df = make_df([
+        (18.56155, 73.76876, 10, '2025-12-23 05:00:00'),
+        (18.56655, 73.76876, 10, '2025-12-23 05:05:00'),
+        (18.57155, 73.76876, 10, '2025-12-23 05:10:00'),
+        (18.57655, 73.76876, 10, '2025-12-23 05:15:00'),
+    ], "new_drone")
+    # flies alongside (8m, then 5m east) for the first two segments,
+    # peels away, and comes back alongside for the last minute
+    existing_df = make_df([
+        (18.56155, 73.76884, 10, '2025-12-23 05:00:00'),
+        (18.56655, 73.76881, 10, '2025-12-23 05:05:00'),
+        (18.57155, 73.76884, 10, '2025-12-23 05:10:00'),
+        (18.57555, 73.77200, 10, '2025-12-23 05:14:00'),
+        (18.57655, 73.76881, 10, '2025-12-23 05:15:00'),
+    ], "drone_A")
+
+    per_pair = detect_conflicts(new_df, existing_df, intervals=True)
+    encounters = detect_conflicts(new_df, existing_df, encounters=True)
+
+    assert len(per_pair) == 4
+    assert len(encounters) == 2
+    first, second = encounters
+    assert first["start"] == pd.Timestamp('2025-12-23 05:00:00')
+    assert pd.Timestamp('2025-12-23 05:10:00') < first["end"] < pd.Timestamp('2025-12-23 05:10:05')
+    assert first["time"] == pd.Timestamp('2025-12-23 05:05:00'), "Closest approach is at the 5m offset"
+    assert abs(first["distance"] - 5.3) < 0.1
+    assert second["start"] > first["end"]
+
+# TEST 26 
+def test_encounters_with_subsecond_timestamps():
+    """
+    Drones hovering together over waypoints with millisecond timestamps SHOULD
+    give one continuous encounter, not one per segment
+    """
+    times = [
+        '2025-12-23 05:00:00.137', '2025-12-23 05:00:07.411', '2025-12-23 05:00:13.903',
+        '2025-12-23 05:00:21.259', '2025-12-23 05:00:28.777', '2025-12-23 05:00:36.013',
+    ]
+    new_df = make_df([(18.56155, 73.76876, 10, t) for t in times], "new_drone")
+    # same hover spot 3m higher, waypoints at other sub-second instants
+    existing_df = make_df([
+        (18.56155, 73.76876, 13, t)
+        for t in ['2025-12-23 04:59:58.001', '2025-12-23 05:00:04.333', '2025-12-23 05:00:11.089',
+                  '2025-12-23 05:00:19.521', '2025-12-23 05:00:30.047', '2025-12-23 05:00:40.999']
+    ], "drone_A")
+
+    encounters = detect_conflicts(new_df, existing_df, encounters=True)
+
+    assert len(encounters) == 1
+    assert encounters[0]["start"] == pd.Timestamp(times[0])
+    assert encounters[0]["end"] == pd.Timestamp(times[-1])
+
+# TEST 27 
+def test_iter_conflicts_streams_and_cancels():
+    """
+    iter_conflicts SHOULD yield the same alerts as detect_conflicts group by
+    group, and stop once cancelled
+    """
+    from src.deconfliction import spatiotemporal
+
+    new_df = make_df([
+        (18.56155, 73.76876, 10, '2025-12-23 05:00:00'),
+        (18.57209, 73.76876, 10, '2025-12-23 05:10:00'),
+    ], "new_drone")
+    existing_df = pd.concat([
+        make_df([
+            (18.56155, 73.76876, 10 + k, '2025-12-23 05:00:00'),
+            (18.57209, 73.76876, 10 + k, '2025-12-23 05:10:00'),
+        ], f"drone_{k}")
+        for k in range(6)
+    ])
+
+    group_size = spatiotemporal.STREAM_GROUP_SEGMENTS
+    spatiotemporal.STREAM_GROUP_SEGMENTS = 2
+    try:
+        done = []
+        streamed = list(iter_conflicts(
+            new_df, existing_df, progress=lambda n, total: done.append((n, total))
+        ))
+
+        seen = []
+        for alert in iter_conflicts(new_df, existing_df, cancel=lambda: len(seen) >= 2):
+            seen.append(alert)
+    finally:
+        spatiotemporal.STREAM_GROUP_SEGMENTS = group_size
+
+    assert streamed == detect_conflicts(new_df, existing_df)
+    assert done == [(2, 6), (4, 6), (6, 6)]
+    assert len(seen) == 2, "Expected the scan to stop after the cancelled group"
+
+
+# TEST 28 
+def test_high_latitude_paths():
+    """
+    ~10m east-west separation at latitude 60 SHOULD conflict in every entry point,
+    measured about the paths themselves rather than the default origin
+    """
+    lat, lon = 60.17, 24.94
+    east = np.degrees(10 / (EARTH_RADIUS_METERS * np.cos(np.radians(lat))))
+    new_df = make_df([
+        (lat, lon, 10, '2025-12-23 05:00:00'),
+        (lat, lon, 10, '2025-12-23 05:05:00'),
+    ], "new_drone")
+    existing_df = make_df([
+        (lat, lon + east, 10, '2025-12-23 05:00:00'),
+        (lat, lon + east, 10, '2025-12-23 05:05:00'),
+    ], "drone_A")
+
     alerts = detect_conflicts(new_df, existing_df)
-    # At exactly 12m, it should not conflict (threshold is <12m)
-    assert len(alerts) == 0, "Expected no conflicts at exactly 12m distance"
+    assert len(alerts) == 1 and abs(alerts[0]["distance"] - 10) < 0.01
+    assert list(iter_conflicts(new_df, existing_df)) == alerts
+    assert detect_conflicts_batch(new_df, existing_df) == {"new_drone": alerts}
+    assert not is_path_safe(new_df, existing_df)
+
+
+# TEST 29 
+def test_first_conflict_pairs_fleet_lazily():
+    """
+    first_conflict SHOULD stop pairing up the fleet once a chunk holds a conflict
+    """
+    from src.deconfliction import spatiotemporal
+
+    new_df = make_df([
+        (18.56155, 73.76876, 10, '2025-12-23 05:00:00'),
+        (18.57209, 73.76876, 10, '2025-12-23 05:10:00'),
+    ], "new_drone")
+    # drone_0000 flies the same path, the other 999 fly it 100m higher
+    existing_df = pd.DataFrame({
+        "drone_id": np.repeat([f"drone_{k:04d}" for k in range(1000)], 2),
+        "lat": np.tile([18.56155, 18.57209], 1000),
+        "lon": 73.76876,
+        "alt": np.repeat(10 + 100 * np.minimum(np.arange(1000), 1), 2),
+        "timestamp": pd.to_datetime(np.tile(['2025-12-23 05:00:00', '2025-12-23 05:10:00'], 1000)),
+    })
+
+    paired = []
+    box_gap = spatiotemporal._box_gap
+    spatiotemporal._box_gap = lambda new, existing, i, j: paired.append(len(i)) or box_gap(new, existing, i, j)
+    try:
+        first = first_conflict(new_df, existing_df)
+    finally:
+        spatiotemporal._box_gap = box_gap
+
+    assert first["drone_id"] == "drone_0000"
+    assert sum(paired) < 1000, "Expected the fleet beyond the first chunk to stay unpaired"
 
 
 # RUN ALL TESTS
@@ -315,6 +699,20 @@ if __name__ == "__main__":
         test_multi_segment_path_with_conflict,
         test_empty_path_no_conflict,
         test_3d_distance_boundary_case,
+        test_multiple_drones_alerts_grouped_by_drone,
+        test_cpa_finds_pass_between_samples,
+        test_cpa_conflict_interval,
+        test_batch_matches_single_checks,
+        test_batch_mutual_conflicts,
+        test_parallel_matches_serial,
+        test_east_west_distance_models,
+        test_first_conflict_stops_early,
+        test_is_path_safe,
+        test_encounters_coalesce_segments,
+        test_encounters_with_subsecond_timestamps,
+        test_iter_conflicts_streams_and_cancels,
+        test_high_latitude_paths,
+        test_first_conflict_pairs_fleet_lazily,
     ]
     
     print("=" * 60)
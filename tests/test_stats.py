@@ -0,0 +1,60 @@
+import pandas as pd
+from src.deconfliction.spatiotemporal import detect_conflicts
+from src.deconfliction.stats import ConflictStats
+from tests.helpers import make_df
+
+NORTHBOUND = [
+    (18.56155, 73.76876, 10, '2025-12-23 05:00:00'),
+    (18.57209, 73.76876, 10, '2025-12-23 05:10:00'),
+]
+SOUTHBOUND = [
+    (18.57209, 73.76876, 10, '2025-12-23 05:00:00'),
+    (18.56155, 73.76876, 10, '2025-12-23 05:10:00'),
+]
+LATER = [
+    (18.56155, 73.76876, 10, '2025-12-23 07:00:00'),
+    (18.57209, 73.76876, 10, '2025-12-23 07:10:00'),
+]
+
+def make_fleet():
+    return pd.concat([
+        make_df(SOUTHBOUND, "drone_A"),
+        make_df(LATER, "drone_B"),
+    ], ignore_index=True)
+
+# TEST 1 
+def test_stats_count_pipeline_work():
+    """
+    Counters SHOULD reflect pruned drones, tested pairs, samples and alerts
+    """
+    new_df = make_df(NORTHBOUND, "new_drone")
+
+    cpa = ConflictStats()
+    alerts = detect_conflicts(new_df, make_fleet(), stats=cpa)
+    sample = ConflictStats()
+    detect_conflicts(new_df, make_fleet(), method="sample", stats=sample)
+
+    assert cpa.counters["drones_checked"] == 2
+    assert cpa.counters["drones_pruned"] == 1       # drone_B flies two hours later
+    assert cpa.counters["segment_pairs"] == 1
+    assert cpa.counters["samples"] == 1
+    assert sample.counters["samples"] == 4
+    assert cpa.counters["alerts"] == len(alerts) == 1
+    assert list(cpa.timings) == ["prepare", "pairs", "kernel", "merge", "alerts"]
+
+# TEST 2 
+def test_stats_reporting():
+    """
+    Stats SHOULD accumulate across calls and render as a summary and Prometheus text
+    """
+    stats = ConflictStats()
+    for _ in range(2):
+        detect_conflicts(make_df(NORTHBOUND, "new_drone"), make_fleet(), stats=stats)
+
+    assert stats.counters["checks"] == 2
+    assert stats.as_dict()["total_seconds"] == stats.total_seconds > 0
+    assert "2 pairs" in stats.summary()
+
+    text = stats.to_prometheus()
+    assert "deconfliction_alerts_total 2\n" in text
+    assert 'deconfliction_stage_seconds_total{stage="kernel"}' in text
@@ -0,0 +1,59 @@
+import threading
+import numpy as np
+from src.control.telemetry import TelemetryStore
+
+# TEST 1
+def test_ring_keeps_latest_samples_in_order():
+    """
+    A full ring SHOULD keep the newest samples, oldest first, and honour the time window
+    """
+    store = TelemetryStore(capacity=8)
+    assert store.track(2) is None and store.latest(2) is None
+
+    for k in range(20):
+        store.record(2, t=100.0 + k, lat=18.5 + k * 1e-4, lon=73.7, alt=k, heading=k)
+
+    track = store.track(2)
+    assert np.array_equal(track.t, 100.0 + np.arange(12, 20))
+    assert np.array_equal(track.geo[:, 2], np.arange(12, 20))
+    assert store.samples(2) == 20
+
+    assert len(store.track(2, seconds=3)) == 4
+    assert store.latest(2) == track.latest()
+    assert store.latest(2)["timestamp"] == 119.0
+
+    frame = track.to_frame()
+    assert list(frame.columns) == ["drone_id", "lat", "lon", "alt", "timestamp"]
+    assert frame["timestamp"].is_monotonic_increasing
+
+
+# TEST 2
+def test_snapshots_are_consistent_while_written():
+    """
+    Reads racing the writer SHOULD only ever see whole samples in time order
+    """
+    store = TelemetryStore(capacity=16)
+    stop = threading.Event()
+
+    def writer():
+        k = 0
+        while not stop.is_set():
+            store.record(7, t=float(k), lat=float(k), lon=-float(k), alt=2.0 * k, heading=k % 360)
+            k += 1
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        reads = 0
+        while reads < 2000:
+            track = store.track(7)
+            if track is None:
+                continue
+            reads += 1
+            assert np.all(np.diff(track.t) == 1)
+            assert np.array_equal(track.geo[:, 0], track.t)
+            assert np.array_equal(track.geo[:, 1], -track.t)
+            assert np.array_equal(track.geo[:, 2], 2 * track.t)
+    finally:
+        stop.set()
+        thread.join()
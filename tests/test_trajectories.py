@@ -0,0 +1,107 @@
+import pickle
+import pandas as pd
+from src.deconfliction import spatiotemporal
+from src.deconfliction.fleet import detect_all_conflicts
+from src.deconfliction.projection import LocalProjection
+from src.deconfliction.spatiotemporal import detect_conflicts, detect_conflicts_batch
+from src.deconfliction.trajectories import FleetArrays
+from tests.helpers import make_df
+
+SOUTHBOUND = [
+    (18.57209, 73.76876, 10, '2025-12-23 05:00:00'),
+    (18.56155, 73.76876, 10, '2025-12-23 05:10:00'),
+]
+NORTHBOUND = [
+    (18.56155, 73.76876, 10, '2025-12-23 05:00:00'),
+    (18.57209, 73.76876, 10, '2025-12-23 05:10:00'),
+]
+# starts right where drone_A ends: the gap between the two drones' rows
+# must never be treated as a flight segment
+HANDOVER = [
+    (18.56155, 73.77294, 10, '2025-12-23 05:20:00'),
+    (18.56155, 73.76876, 10, '2025-12-23 05:30:00'),
+]
+
+def make_fleet():
+    return pd.concat([
+        make_df(HANDOVER, "drone_B"),
+        make_df(SOUTHBOUND, "drone_A"),
+    ], ignore_index=True)
+
+# TEST 1 
+def test_mapped_fleet_round_trip(tmp_path):
+    """
+    A saved fleet SHOULD reopen memory-mapped with per-drone views
+    """
+    df = make_fleet()
+    path = FleetArrays.from_paths(df).save(tmp_path / "paths.fleet")
+    fleet = FleetArrays.open(path)
+
+    assert list(fleet.drone_ids) == ["drone_A", "drone_B"]
+    assert fleet.t.dtype == "int64" and fleet.geo.dtype == "float64"
+
+    drone_b = fleet.drone("drone_B")
+    assert drone_b.t.base is not None  # a view into the mapped file
+    pd.testing.assert_frame_equal(drone_b.to_frame(), make_df(HANDOVER, "drone_B"), check_dtype=False)
+
+# TEST 2 
+def test_mapped_fleet_matches_dataframe(tmp_path):
+    """
+    Checking against a mapped fleet SHOULD give the same alerts as the DataFrame
+    """
+    df = make_fleet()
+    projection = LocalProjection.centered_on(df)
+    fleet = FleetArrays.open(
+        FleetArrays.from_paths(df, projection).save(tmp_path / "paths.fleet")
+    )
+
+    new_path = make_df(NORTHBOUND, "new")
+    expected = detect_conflicts(new_path, df, projection=projection)
+    result = detect_conflicts(new_path, fleet)
+
+    assert len(result) == 1 and result[0]["drone_id"] == "drone_A"
+    assert result == expected
+    assert detect_all_conflicts(fleet)["alerts"] == []
+
+# TEST 3 
+def test_mapped_fleet_shared_with_workers(tmp_path):
+    """
+    Mapped segments SHOULD reach worker processes as a file reference
+    """
+    df = make_fleet()
+    fleet = FleetArrays.open(FleetArrays.from_paths(df).save(tmp_path / "paths.fleet"))
+    segments = fleet.segments()
+
+    restored = pickle.loads(pickle.dumps(segments.take(slice(1, 3))))
+    assert restored.source == (fleet.path, 1, 3)
+    assert (restored.t0 == segments.t0[1:3]).all()
+
+    serial = detect_conflicts(make_df(NORTHBOUND, "new"), fleet)
+    threshold = spatiotemporal.PARALLEL_MIN_SEGMENTS
+    spatiotemporal.PARALLEL_MIN_SEGMENTS = 0
+    try:
+        parallel = detect_conflicts(make_df(NORTHBOUND, "new"), fleet, workers=2)
+    finally:
+        spatiotemporal.PARALLEL_MIN_SEGMENTS = threshold
+    assert parallel == serial
+
+# TEST 4 
+def test_mapped_fleet_batch_check(tmp_path):
+    """
+    detect_conflicts_batch SHOULD accept a mapped fleet and match the DataFrame results
+    """
+    df = make_fleet()
+    projection = LocalProjection.centered_on(df)
+    fleet = FleetArrays.open(
+        FleetArrays.from_paths(df, projection).save(tmp_path / "paths.fleet")
+    )
+    candidates = pd.concat([
+        make_df(NORTHBOUND, "north"),
+        make_df([(lat, lon, alt + 50, t) for lat, lon, alt, t in NORTHBOUND], "above"),
+    ], ignore_index=True)
+
+    result = detect_conflicts_batch(candidates, fleet)
+
+    assert [a["drone_id"] for a in result["north"]] == ["drone_A"]
+    assert result["above"] == []
+    assert result == detect_conflicts_batch(candidates, df, projection=projection)
@@ -0,0 +1,64 @@
+import os
+import pandas as pd
+import pytest
+from src.data.trajectory_store import find_dataset, read_paths, write_paths
+
+def make_df():
+    return pd.DataFrame({
+        "drone_id": ["drone_1", "drone_1", "drone_2"],
+        "lat": [18.57209, 18.56155, 18.57000],
+        "lon": [73.76876, 73.77294, 73.76876],
+        "alt": [10.0, 30.0, 15.5],
+        "timestamp": pd.to_datetime([
+            '2025-12-23 05:00:00', '2025-12-23 05:10:00', '2025-12-23 05:02:30'
+        ]),
+    })
+
+# TEST 1 
+def test_columnar_round_trip(tmp_path):
+    """
+    Writing then reading a .traj store SHOULD give back the same frame
+    """
+    df = make_df()
+    path = write_paths(df, tmp_path / "paths.traj")
+    loaded = read_paths(path)
+    pd.testing.assert_frame_equal(loaded, df)
+
+# TEST 2 
+def test_find_dataset_prefers_columnar(tmp_path):
+    """
+    A .traj store SHOULD be preferred over an Excel file of the same name
+    """
+    stem = tmp_path / "normalized_paths"
+    assert find_dataset(stem) == stem.with_suffix(".traj")
+
+    (tmp_path / "normalized_paths.xlsx").touch()
+    assert find_dataset(stem) == stem.with_suffix(".xlsx")
+
+    write_paths(make_df(), stem.with_suffix(".traj"))
+    assert find_dataset(stem) == stem.with_suffix(".traj")
+
+# TEST 3 
+def test_unknown_format(tmp_path):
+    """
+    Unsupported suffixes SHOULD be rejected
+    """
+    with pytest.raises(ValueError):
+        write_paths(make_df(), tmp_path / "paths.csv")
+
+# TEST 4 
+def test_find_dataset_skips_stale_store(tmp_path):
+    """
+    An Excel file edited after its .traj store was written SHOULD win over the store
+    """
+    stem = tmp_path / "normalized_paths"
+    write_paths(make_df(), stem.with_suffix(".traj"))
+    sheet = stem.with_suffix(".xlsx")
+    sheet.touch()
+
+    store_time = (stem.with_suffix(".traj") / "meta.json").stat().st_mtime
+    os.utime(sheet, (store_time - 60, store_time - 60))
+    assert find_dataset(stem) == stem.with_suffix(".traj")
+
+    os.utime(sheet, (store_time + 60, store_time + 60))
+    assert find_dataset(stem) == sheet